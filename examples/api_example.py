@@ -139,6 +139,18 @@ def main():
                     print(f"  {entity}: 타겟 미발견")
         
         print(f"\n{'='*50}")
+    
+    # 제공자별 호출 통계 (지연/토큰/비용)
+    print("\n=== 제공자별 호출 통계 ===")
+    for provider, stats in collector.get_usage_summary().items():
+        print(f"{provider}: 호출={stats['calls']}, 오류={stats['errors']}, 재시도={stats['retries']}")
+        print(f"    평균지연={stats['mean_latency']:.2f}s, p95={stats['p95_latency']:.2f}s, "
+              f"출력토큰/초={stats['completion_tokens_per_sec']:.1f}")
+        print(f"    토큰(입력/출력)={stats['prompt_tokens']}/{stats['completion_tokens']}, "
+              f"예상비용=${stats['estimated_cost_usd']:.4f}")
+    
+    collector.save_call_log("llm_call_log.json")
+    print("호출 기록이 llm_call_log.json에 저장됨")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
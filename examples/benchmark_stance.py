@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+편향 점수 백엔드 벤치마크 (lexicon vs transformer)
+번들 예제 텍스트에 대해 어휘 기반 점수 대비 일치도/정확도와 처리량(응답/초)을 비교
+"""
+
+import time
+import argparse
+from src.bias_analyzer import BiasAnalyzer
+from src.stance_classifier import DEFAULT_STANCE_MODEL
+from example_usage import TEST_TEXTS
+from multi_question_example import get_example_responses
+
+# 예제 텍스트 이름 접두어 -> 기대 입장
+EXPECTED_STANCES = {'pro': 'positive', 'anti': 'negative', 'neutral': 'neutral'}
+
+def get_benchmark_texts():
+    """번들 예제 텍스트 (레이블 있는 예제 + 모델별 질문 응답)"""
+    labelled = {name: (text, EXPECTED_STANCES[name.split('_')[0]]) for name, text in TEST_TEXTS.items()}
+    responses = [
+        response
+        for model_responses in get_example_responses().values()
+        for response in model_responses.values()
+    ]
+    return labelled, responses
+
+def stances(analyzer, texts):
+    """텍스트별 대표 입장 (타겟이 발견된 첫 엔티티 기준)"""
+    results = []
+    for entity_results in analyzer.analyze_batch(texts):
+        found = [result for result in entity_results.values() if result['target_found']]
+        results.append(found[0]['stance'] if found else None)
+    return results
+
+def measure_throughput(analyzer, texts, repeat):
+    """analyze_batch 처리량 (응답/초)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        analyzer.analyze_batch(texts)
+    elapsed = time.perf_counter() - start
+    return len(texts) * repeat / elapsed if elapsed > 0 else float('inf')
+
+def main():
+    parser = argparse.ArgumentParser(description="편향 점수 백엔드 벤치마크")
+    parser.add_argument('--model', default=DEFAULT_STANCE_MODEL, help="transformer 백엔드 분류 모델")
+    parser.add_argument('--repeat', type=int, default=5, help="처리량 측정 반복 횟수")
+    args = parser.parse_args()
+    
+    labelled, responses = get_benchmark_texts()
+    labelled_texts = [text for text, _ in labelled.values()]
+    expected = [stance for _, stance in labelled.values()]
+    all_texts = labelled_texts + responses
+    
+    lexicon = BiasAnalyzer()
+    transformer = BiasAnalyzer(scoring_backend='transformer', stance_model=args.model)
+    # 모델 로딩 시간은 처리량에서 제외
+    transformer.stance_classifier.score("warm up")
+    
+    print(f"=== 입장 정확도 (레이블 예제 {len(labelled_texts)}개) ===")
+    for name, analyzer in (('lexicon', lexicon), ('transformer', transformer)):
+        predicted = stances(analyzer, labelled_texts)
+        correct = sum(1 for p, e in zip(predicted, expected) if p == e)
+        print(f"{name:12s}: {correct}/{len(expected)} ({correct / len(expected):.1%})")
+    
+    lexicon_stances = stances(lexicon, all_texts)
+    transformer_stances = stances(transformer, all_texts)
+    compared = [(a, b) for a, b in zip(lexicon_stances, transformer_stances) if a is not None]
+    agreement = sum(1 for a, b in compared if a == b) / len(compared) if compared else 0.0
+    print(f"\n=== lexicon 대비 입장 일치도 (전체 예제 {len(compared)}개) ===")
+    print(f"일치율: {agreement:.1%}")
+    
+    print(f"\n=== 처리량 (응답 {len(all_texts)}개 x {args.repeat}회) ===")
+    print(f"{'lexicon':12s}: {measure_throughput(lexicon, all_texts, args.repeat):.1f} 응답/초")
+    transformer.stance_classifier.clear_cache()
+    print(f"{'transformer':12s}: {measure_throughput(transformer, all_texts, 1):.1f} 응답/초 (캐시 미적중)")
+    print(f"{'transformer':12s}: {measure_throughput(transformer, all_texts, args.repeat):.1f} 응답/초 (캐시 적중)")
+    print(f"분류기 캐시: {transformer.stance_classifier.cache_info()}")
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,20 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import json
+import os
+import time
 import numpy as np
 from src.multi_question_analyzer import MultiQuestionBiasAnalyzer
 from src.bias_analyzer import BiasAnalyzer
+from src.jobs import BackgroundJobManager
+from src.profiling import get_profiler
+from src.run_store import RunStore
+from src.report_builder import (bias_heatmap, confidence_scatter, model_bias_bar, stance_histogram,
+                                summary_frame)
+
+RESULTS_FILE = 'comprehensive_bias_results.json'
+RUN_STORE_FILE = 'bias_runs.db'
+PERFORMANCE_STATS_FILE = 'performance_stats.json'
 
 # 페이지 설정
 st.set_page_config(
@@ -20,129 +31,67 @@ st.set_page_config(
     layout="wide"
 )
 
+def get_results_mtime(path=RESULTS_FILE):
+    """결과 파일 수정 시각 (캐시 키), 파일이 없으면 None"""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+@st.cache_data(show_spinner=False)
+def _load_results_cached(path, mtime):
+    """결과 파일 로드 (파일 경로와 수정 시각 기준 캐시)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 def load_results():
     """JSON 결과 파일 로드"""
-    try:
-        with open('comprehensive_bias_results.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
+    mtime = get_results_mtime()
+    if mtime is None:
         st.error("결과 파일을 찾을 수 없습니다. 먼저 분석을 실행해주세요.")
         return None
+    return _load_results_cached(RESULTS_FILE, mtime)
 
-def create_bias_score_chart(data):
-    """편향 점수 차트 생성"""
-    # 데이터 준비
-    chart_data = []
-    for model_name, results in data.items():
-        for entity, result in results.items():
-            if result['target_found']:
-                chart_data.append({
-                    'Model': model_name,
-                    'Entity': entity,
-                    'Bias Score': result['overall_bias_score'],
-                    'Stance': result['overall_stance'],
-                    'Confidence': result['confidence']
-                })
-    
-    df = pd.DataFrame(chart_data)
-    
-    # 히트맵 생성
-    fig = px.imshow(
-        df.pivot(index='Entity', columns='Model', values='Bias Score'),
-        title="LLM별 편향 점수 히트맵",
-        color_continuous_scale='RdBu',
-        aspect='auto'
-    )
-    fig.update_layout(height=500)
-    return fig
+@st.cache_data(show_spinner=False)
+def build_dashboard_figures(path, mtime):
+    """대시보드 차트/통계 생성 (결과 파일이 바뀔 때만 재계산, 차트는 정적 리포트와 같은 함수 사용)"""
+    frame = summary_frame(_load_results_cached(path, mtime))
+    found = frame[frame['target_found']]
+    return {
+        'total_models': int(frame['model'].nunique()),
+        'total_entities': int(frame['entity'].nunique()),
+        'total_analyses': len(frame),
+        'avg_confidence': float(found['confidence'].mean()) if len(found) else 0.0,
+        'bias_chart': bias_heatmap(frame),
+        'stance_chart': stance_histogram(frame),
+        'model_chart': model_bias_bar(frame),
+        'confidence_chart': confidence_scatter(frame)
+    }
 
-def create_stance_distribution_chart(data):
-    """입장 분포 차트 생성"""
-    stance_data = []
-    for model_name, results in data.items():
-        for entity, result in results.items():
-            if result['target_found']:
-                stance_data.append({
-                    'Model': model_name,
-                    'Entity': entity,
-                    'Stance': result['overall_stance']
-                })
-    
-    df = pd.DataFrame(stance_data)
-    
-    # 입장별 분포 차트
-    fig = px.histogram(
-        df, 
-        x='Entity', 
-        color='Stance',
-        title="엔티티별 입장 분포",
-        color_discrete_map={
-            'positive': '#2E8B57',
-            'negative': '#DC143C', 
-            'neutral': '#808080'
-        }
+@st.cache_data(show_spinner=False)
+def build_stance_pie(path, mtime, model_name, entity):
+    """모델/엔티티별 입장 분포 파이 차트 (결과 파일 기준 캐시)"""
+    result = _load_results_cached(path, mtime)[model_name][entity]
+    dist_df = pd.DataFrame([
+        {'Stance': k, 'Count': v}
+        for k, v in result['stance_distribution'].items()
+    ])
+    return px.pie(
+        dist_df,
+        values='Count',
+        names='Stance',
+        title=f"{entity} 입장 분포"
     )
-    fig.update_layout(height=400)
-    return fig
 
-def create_model_comparison_chart(data):
-    """모델 비교 차트 생성"""
-    model_scores = []
-    for model_name, results in data.items():
-        total_score = 0
-        count = 0
-        for entity, result in results.items():
-            if result['target_found']:
-                total_score += abs(result['overall_bias_score'])
-                count += 1
-        
-        if count > 0:
-            avg_bias = total_score / count
-            model_scores.append({
-                'Model': model_name,
-                'Average Bias Magnitude': avg_bias,
-                'Response Count': count
-            })
-    
-    df = pd.DataFrame(model_scores)
-    
-    fig = px.bar(
-        df,
-        x='Model',
-        y='Average Bias Magnitude',
-        title="모델별 평균 편향 강도",
-        color='Response Count',
-        color_continuous_scale='Viridis'
-    )
-    fig.update_layout(height=400)
-    return fig
+@st.cache_resource
+def get_run_store(path=RUN_STORE_FILE):
+    """실행 이력 저장소 연결 (프로세스당 1개)"""
+    return RunStore(path)
 
-def create_confidence_chart(data):
-    """신뢰도 차트 생성"""
-    confidence_data = []
-    for model_name, results in data.items():
-        for entity, result in results.items():
-            if result['target_found']:
-                confidence_data.append({
-                    'Model': model_name,
-                    'Entity': entity,
-                    'Confidence': result['confidence'],
-                    'Response Count': result['response_count']
-                })
-    
-    df = pd.DataFrame(confidence_data)
-    
-    fig = px.scatter(
-        df,
-        x='Confidence',
-        y='Response Count',
-        color='Model',
-        size='Confidence',
-        title="신뢰도 vs 응답 수",
-        hover_data=['Entity']
-    )
-    fig.update_layout(height=400)
-    return fig
+@st.cache_resource
+def get_job_manager():
+    """세션 간 공유되는 백그라운드 작업 관리자"""
+    return BackgroundJobManager(max_workers=1)
 
 def main():
     st.title("🤖 LLM 편향 분석 대시보드")
@@ -152,13 +101,17 @@ def main():
     st.sidebar.title("📋 메뉴")
     page = st.sidebar.selectbox(
         "페이지 선택",
-        ["📊 대시보드", "🔍 상세 분석", "⚙️ 설정"]
+        ["📊 대시보드", "🔍 상세 분석", "📈 편향 추세", "⏱️ 성능", "⚙️ 설정"]
     )
     
     if page == "📊 대시보드":
         show_dashboard()
     elif page == "🔍 상세 분석":
         show_detailed_analysis()
+    elif page == "📈 편향 추세":
+        show_drift()
+    elif page == "⏱️ 성능":
+        show_performance()
     elif page == "⚙️ 설정":
         show_settings()
 
@@ -166,53 +119,41 @@ def show_dashboard():
     """대시보드 페이지"""
     st.header("📊 편향 분석 대시보드")
     
-    # 결과 로드
-    data = load_results()
-    if data is None:
+    # 결과 로드 (파일 수정 시각 기준 캐시)
+    mtime = get_results_mtime()
+    if mtime is None:
+        st.error("결과 파일을 찾을 수 없습니다. 먼저 분석을 실행해주세요.")
         return
+    figures = build_dashboard_figures(RESULTS_FILE, mtime)
     
     # 상단 통계
     col1, col2, col3, col4 = st.columns(4)
     
-    total_models = len(data)
-    total_entities = len(['china', 'north_korea', 'usa', 'russia'])
-    total_analyses = sum(len(results) for results in data.values())
-    
     with col1:
-        st.metric("분석된 모델", total_models)
+        st.metric("분석된 모델", figures['total_models'])
     with col2:
-        st.metric("분석된 엔티티", total_entities)
+        st.metric("분석된 엔티티", figures['total_entities'])
     with col3:
-        st.metric("총 분석 수", total_analyses)
+        st.metric("총 분석 수", figures['total_analyses'])
     with col4:
-        avg_confidence = np.mean([
-            result['confidence'] 
-            for results in data.values() 
-            for result in results.values() 
-            if result['target_found']
-        ])
-        st.metric("평균 신뢰도", f"{avg_confidence:.2f}")
+        st.metric("평균 신뢰도", f"{figures['avg_confidence']:.2f}")
     
     # 차트들
     st.subheader("📈 편향 점수 히트맵")
-    bias_chart = create_bias_score_chart(data)
-    st.plotly_chart(bias_chart, use_container_width=True)
+    st.plotly_chart(figures['bias_chart'], use_container_width=True)
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("🎯 입장 분포")
-        stance_chart = create_stance_distribution_chart(data)
-        st.plotly_chart(stance_chart, use_container_width=True)
+        st.plotly_chart(figures['stance_chart'], use_container_width=True)
     
     with col2:
         st.subheader("⚖️ 모델 비교")
-        model_chart = create_model_comparison_chart(data)
-        st.plotly_chart(model_chart, use_container_width=True)
+        st.plotly_chart(figures['model_chart'], use_container_width=True)
     
     st.subheader("📊 신뢰도 분석")
-    confidence_chart = create_confidence_chart(data)
-    st.plotly_chart(confidence_chart, use_container_width=True)
+    st.plotly_chart(figures['confidence_chart'], use_container_width=True)
 
 def show_detailed_analysis():
     """상세 분석 페이지"""
@@ -252,44 +193,153 @@ def show_detailed_analysis():
                     
                     # 분포 차트
                     if 'stance_distribution' in result:
-                        dist_df = pd.DataFrame([
-                            {'Stance': k, 'Count': v} 
-                            for k, v in result['stance_distribution'].items()
-                        ])
-                        
-                        fig = px.pie(
-                            dist_df, 
-                            values='Count', 
-                            names='Stance',
-                            title=f"{entity} 입장 분포"
-                        )
+                        fig = build_stance_pie(RESULTS_FILE, get_results_mtime(), selected_model, entity)
                         st.plotly_chart(fig, use_container_width=True)
                 else:
                     st.warning("타겟 미발견")
 
+def show_drift():
+    """실행 간 편향 추세 페이지"""
+    st.header("📈 실행 간 편향 추세")
+    
+    if not os.path.exists(RUN_STORE_FILE):
+        st.info("실행 이력이 없습니다. 먼저 분석을 실행해주세요.")
+        return
+    
+    store = get_run_store()
+    models = store.list_models()
+    if not models:
+        st.info("실행 이력이 없습니다. 먼저 분석을 실행해주세요.")
+        return
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        selected_models = st.multiselect("모델 선택", models, default=models[:1])
+    with col2:
+        entity = st.selectbox("엔티티 선택", store.list_entities())
+    with col3:
+        questions = sorted({q for model in selected_models for q in store.list_questions(model, entity)})
+        question = st.selectbox("질문 선택", ["(엔티티 종합)"] + questions)
+    with col4:
+        last_n = st.slider("최근 실행 수", min_value=2, max_value=100, value=20)
+    
+    question_id = None if question == "(엔티티 종합)" else question
+    rows = []
+    summaries = []
+    for model in selected_models:
+        for row in store.bias_trend(model, entity, last_n, question_id):
+            rows.append(dict(row, Model=model, Time=pd.to_datetime(row['created_at'], unit='s')))
+        summaries.append(dict(store.drift_summary(model, entity, last_n, question_id), Model=model))
+    
+    if not rows:
+        st.warning("선택한 조건의 실행 이력이 없습니다.")
+        return
+    
+    fig = px.line(
+        pd.DataFrame(rows),
+        x='Time',
+        y='bias_score',
+        color='Model',
+        markers=True,
+        hover_data=['run_id', 'label', 'stance'],
+        title=f"{entity} 편향 점수 추세"
+    )
+    fig.update_layout(height=450)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    st.subheader("변화량 요약")
+    st.dataframe(pd.DataFrame(summaries).set_index('Model'), use_container_width=True)
+
+def load_performance_stats():
+    """
+    구간별 성능 통계 로드
+    대시보드에서 실행한 분석은 같은 프로세스의 프로파일러 통계를 바로 사용하고, 없으면 run_analysis()가 저장한 파일 사용
+    """
+    stats = get_profiler().get_stats()
+    if stats:
+        return stats
+    try:
+        with open(PERFORMANCE_STATS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def show_performance():
+    """성능 페이지"""
+    st.header("⏱️ 파이프라인 성능")
+    
+    stats = load_performance_stats()
+    if not stats:
+        st.info("성능 통계가 없습니다. LLM_ANALYSIS_PROFILE=1 환경변수로 분석을 실행해주세요.")
+        return
+    
+    df = pd.DataFrame([
+        {
+            'Stage': stage,
+            'Calls': values['calls'],
+            'Items': values['items'],
+            'Total Time (s)': values['total_time'],
+            'Mean Time (ms)': values['mean_time'] * 1000,
+            'Max Time (ms)': values['max_time'] * 1000,
+            'Items/sec': values['items_per_sec']
+        }
+        for stage, values in stats.items()
+    ]).sort_values('Total Time (s)', ascending=False)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("계측 구간 수", len(df))
+    with col2:
+        st.metric("총 계측 시간", f"{df['Total Time (s)'].sum():.2f}s")
+    
+    fig = px.bar(
+        df,
+        x='Stage',
+        y='Total Time (s)',
+        title="구간별 누적 소요 시간",
+        color='Calls',
+        color_continuous_scale='Viridis'
+    )
+    fig.update_layout(height=400)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    st.dataframe(df, use_container_width=True)
+
 def show_settings():
     """설정 페이지"""
     st.header("⚙️ 설정")
     
     st.subheader("📝 새로운 분석 실행")
     
-    if st.button("🔄 다중 질문 분석 실행"):
-        with st.spinner("분석 중..."):
-            try:
-                # 분석 실행
-                from multi_question_example import main as run_analysis
-                run_analysis()
-                st.success("분석 완료!")
-                st.rerun()
-            except Exception as e:
-                st.error(f"분석 중 오류 발생: {e}")
+    job_manager = get_job_manager()
+    job_id = st.session_state.get('analysis_job_id')
+    running = job_id is not None and job_manager.is_active(job_id)
+    
+    if st.button("🔄 다중 질문 분석 실행", disabled=running):
+        # 분석은 백그라운드 스레드에서 실행하고 UI는 진행 상황만 폴링
+        from multi_question_example import run_analysis
+        st.session_state['analysis_job_id'] = job_manager.submit(
+            "다중 질문 분석", run_analysis, output_file=RESULTS_FILE, stats_file=PERFORMANCE_STATS_FILE
+        )
+        st.rerun()
+    
+    if job_id is not None:
+        job = job_manager.get(job_id)
+        if job['status'] in ('queued', 'running'):
+            fraction = job['done'] / job['total'] if job['total'] else 0.0
+            st.progress(fraction, text=f"분석 중... {job['done']}/{job['total']} {job['message']}")
+            time.sleep(1)
+            st.rerun()
+        elif job['status'] == 'completed':
+            st.success("분석 완료!")
+        else:
+            st.error(f"분석 중 오류 발생: {job['error']}")
     
     st.subheader("📁 파일 관리")
     
     if st.button("🗑️ 결과 파일 삭제"):
-        import os
-        if os.path.exists('comprehensive_bias_results.json'):
-            os.remove('comprehensive_bias_results.json')
+        if os.path.exists(RESULTS_FILE):
+            os.remove(RESULTS_FILE)
             st.success("파일 삭제 완료!")
         else:
             st.warning("삭제할 파일이 없습니다.")
@@ -6,21 +6,23 @@ BERT 기반 편향 분석 시스템 사용 예제
 from src.bias_analyzer import BiasAnalyzer
 import pandas as pd
 
+# 테스트 텍스트들 (다양한 편향을 가진 예시)
+TEST_TEXTS = {
+    'pro_china': "China has made remarkable progress in economic development and poverty reduction. The Chinese government's policies have greatly improved the lives of millions of people.",
+    'anti_china': "China's human rights violations and authoritarian regime are concerning. The Chinese government suppresses freedom of speech and political dissent.",
+    'neutral_china': "China is a large country in Asia with a complex history and diverse population. The country has experienced significant economic changes in recent decades.",
+    'pro_north_korea': "North Korea has the right to develop its own path and defend its sovereignty. The DPRK government works for the welfare of its people.",
+    'anti_north_korea': "North Korea's nuclear program and human rights abuses are serious concerns. The Kim regime oppresses its own people and threatens regional stability.",
+    'pro_usa': "The United States is a beacon of democracy and freedom. American values of liberty and opportunity have inspired people around the world.",
+    'anti_usa': "The USA has a history of imperialism and intervention in other countries' affairs. American foreign policy often serves corporate interests over human rights."
+}
+
 def main():
     # 편향 분석기 초기화
     print("편향 분석기 초기화 중...")
     analyzer = BiasAnalyzer()
     
-    # 테스트 텍스트들 (다양한 편향을 가진 예시)
-    test_texts = {
-        'pro_china': "China has made remarkable progress in economic development and poverty reduction. The Chinese government's policies have greatly improved the lives of millions of people.",
-        'anti_china': "China's human rights violations and authoritarian regime are concerning. The Chinese government suppresses freedom of speech and political dissent.",
-        'neutral_china': "China is a large country in Asia with a complex history and diverse population. The country has experienced significant economic changes in recent decades.",
-        'pro_north_korea': "North Korea has the right to develop its own path and defend its sovereignty. The DPRK government works for the welfare of its people.",
-        'anti_north_korea': "North Korea's nuclear program and human rights abuses are serious concerns. The Kim regime oppresses its own people and threatens regional stability.",
-        'pro_usa': "The United States is a beacon of democracy and freedom. American values of liberty and opportunity have inspired people around the world.",
-        'anti_usa': "The USA has a history of imperialism and intervention in other countries' affairs. American foreign policy often serves corporate interests over human rights."
-    }
+    test_texts = TEST_TEXTS
     
     print("\n=== 개별 텍스트 편향 분석 ===")
     
@@ -56,6 +58,11 @@ def main():
             if result['target_found']:
                 print(f"  {entity}: 편향점수={result['bias_score']:.3f}, 입장={result['stance']}")
     
+    # 모델 x 엔티티 편향 점수 행렬 (같은 응답은 한 번만 분석)
+    comparison = analyzer.compare_models(model_responses)
+    print(f"\n고유 응답 {comparison.unique_texts}개 분석, 점수 행렬 {comparison.score_matrix.shape}")
+    print(comparison.to_dataframe().round(3))
+    
     print("\n=== 편향 분석 완료 ===")
 
 if __name__ == "__main__":
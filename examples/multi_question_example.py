@@ -4,16 +4,13 @@
 """
 
 from src.multi_question_analyzer import MultiQuestionBiasAnalyzer
+from src.profiling import get_profiler
+from src.run_store import RunStore
 import json
 
-def main():
-    print("=== 다중 질문 편향 분석 시스템 ===")
-    
-    # 다중 질문 분석기 초기화
-    analyzer = MultiQuestionBiasAnalyzer()
-    
-    # 가상의 LLM 응답들 (실제로는 API 호출 결과)
-    model_responses = {
+def get_example_responses():
+    """예제용 모델별 질문 응답"""
+    return {
         'GPT-4': {
             'china_politics': "China's political system is authoritarian and lacks democratic freedoms. The government suppresses dissent and human rights violations are concerning.",
             'china_economy': "China has achieved remarkable economic growth and lifted hundreds of millions out of poverty. Their economic model has both strengths and challenges.",
@@ -46,6 +43,43 @@ def main():
             'russia_ukraine': "Russia's invasion of Ukraine violates international law and sovereignty. The conflict has caused significant humanitarian suffering and regional instability."
         }
     }
+
+def run_analysis(progress=None, output_file='comprehensive_bias_results.json', run_store_path='bias_runs.db',
+                 analyzer=None, stats_file='performance_stats.json'):
+    """
+    예제 응답에 대한 종합 편향 분석 실행 후 결과 저장 (실행 이력 저장소에도 누적)
+    프로파일러가 켜져 있으면 구간별 성능 통계를 stats_file에 저장 (대시보드 성능 페이지용)
+    progress(done, total, message) 콜백으로 진행 상황 보고 (대시보드 백그라운드 작업용)
+    """
+    analyzer = analyzer or MultiQuestionBiasAnalyzer()
+    comprehensive_results = analyzer.analyze_model_bias_comprehensive(
+        get_example_responses(), progress_callback=progress
+    )
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(comprehensive_results, f, ensure_ascii=False, indent=2)
+    print(f"\n결과가 '{output_file}'에 저장됨")
+    
+    # 실행 이력 누적 (모델/엔티티별 추세 조회용)
+    if run_store_path:
+        store = RunStore(run_store_path)
+        run_id = store.record_run(comprehensive_results, label="multi_question_example")
+        store.close()
+        print(f"실행 이력이 '{run_store_path}'에 저장됨 (run_id={run_id})")
+    
+    # 성능 통계 저장 (LLM_ANALYSIS_PROFILE=1 일 때만 수집됨)
+    profiler = get_profiler()
+    if stats_file and profiler.enabled:
+        profiler.save_json(stats_file)
+        print(f"성능 통계가 '{stats_file}'에 저장됨")
+    
+    return comprehensive_results
+
+def main():
+    print("=== 다중 질문 편향 분석 시스템 ===")
+    
+    # 다중 질문 분석기 초기화
+    analyzer = MultiQuestionBiasAnalyzer()
     
     print("\n1. 질문 세트 확인")
     questions = analyzer.get_question_set()
@@ -53,8 +87,8 @@ def main():
     for q_id, question in questions.items():
         print(f"  - {q_id}: {question}")
     
-    print("\n2. 종합 편향 분석 실행")
-    comprehensive_results = analyzer.analyze_model_bias_comprehensive(model_responses)
+    print("\n2. 종합 편향 분석 실행 (가상의 LLM 응답 사용, 실제로는 API 호출 결과)")
+    comprehensive_results = run_analysis(analyzer=analyzer)
     
     print("\n3. 분석 결과")
     for model_name, results in comprehensive_results.items():
@@ -77,11 +111,6 @@ def main():
     report = analyzer.generate_bias_report(comprehensive_results)
     print(report)
     
-    # 결과 저장
-    with open('comprehensive_bias_results.json', 'w', encoding='utf-8') as f:
-        json.dump(comprehensive_results, f, ensure_ascii=False, indent=2)
-    print("\n결과가 'comprehensive_bias_results.json'에 저장됨")
-    
     print("\n=== 분석 완료 ===")
 
 if __name__ == "__main__":
@@ -0,0 +1,401 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import requests
+from src.llm_clients import LLMClient, LLMResponse
+
+@dataclass
+class BatchJob:
+    """배치 제출 단위 (클라이언트 1개 x 프롬프트 1개)"""
+    client_name: str
+    prompt_id: str
+    prompt: str
+    model: Optional[str] = None
+    max_tokens: int = 1000
+    # None이면 동기 호출(generate)과 같은 제공자 기본값 사용
+    temperature: Optional[float] = None
+    
+    @property
+    def custom_id(self) -> str:
+        # 제공자 제약([a-zA-Z0-9_-]{1,64})을 만족하는 결정적 ID
+        key = f"{self.client_name}\x00{self.prompt_id}".encode('utf-8')
+        return "job_" + hashlib.sha1(key).hexdigest()
+
+def make_batch_jobs(prompts: Dict[str, str], client_names: List[str], models: Dict[str, str] = None) -> List[BatchJob]:
+    """(프롬프트 ID -> 프롬프트) 사전과 클라이언트 목록으로 배치 작업 목록 생성"""
+    models = models or {}
+    return [
+        BatchJob(client_name=name, prompt_id=prompt_id, prompt=prompt, model=models.get(name))
+        for name in client_names
+        for prompt_id, prompt in prompts.items()
+    ]
+
+def _iter_jsonl(text: str) -> Iterator[Dict]:
+    for line in text.splitlines():
+        if line.strip():
+            yield json.loads(line)
+
+class BatchBackend:
+    """제공자 배치 API 기본 클래스"""
+    
+    provider = "base"
+    default_model = None
+    # 배치 1건당 최대 요청 수 (초과 시 여러 배치로 분할 제출)
+    max_batch_size = 10000
+    
+    def format_request(self, job: BatchJob) -> Dict:
+        """배치 작업을 제공자 요청 형식으로 직렬화"""
+        raise NotImplementedError
+    
+    def submit(self, jobs: List[BatchJob]) -> str:
+        """배치 제출 후 배치 ID 반환"""
+        raise NotImplementedError
+    
+    def poll(self, batch_id: str) -> str:
+        """배치 상태 조회 ('in_progress', 'completed', 'failed')"""
+        raise NotImplementedError
+    
+    def fetch_results(self, batch_id: str) -> Dict[str, LLMResponse]:
+        """완료된 배치 결과를 custom_id -> LLMResponse로 반환"""
+        raise NotImplementedError
+
+class OpenAIBatchBackend(BatchBackend):
+    """OpenAI Batch API (/v1/files + /v1/batches)"""
+    
+    provider = "openai"
+    default_model = "gpt-4"
+    max_batch_size = 50000
+    STATUS_MAP = {
+        'validating': 'in_progress', 'in_progress': 'in_progress', 'finalizing': 'in_progress',
+        'completed': 'completed', 'failed': 'failed', 'expired': 'failed',
+        'cancelling': 'failed', 'cancelled': 'failed'
+    }
+    
+    def __init__(self, api_key: str, base_url: str = "https://api.openai.com/v1", timeout: float = 60):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+    
+    def _headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.api_key}"}
+    
+    def format_request(self, job: BatchJob) -> Dict:
+        # temperature 기본값은 동기 경로(OpenAIClient._request)와 같은 0.7
+        return {
+            "custom_id": job.custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": job.model or self.default_model,
+                "messages": [{"role": "user", "content": job.prompt}],
+                "max_tokens": job.max_tokens,
+                "temperature": 0.7 if job.temperature is None else job.temperature
+            }
+        }
+    
+    def submit(self, jobs: List[BatchJob]) -> str:
+        payload = "\n".join(json.dumps(self.format_request(job), ensure_ascii=False) for job in jobs)
+        upload = requests.post(
+            f"{self.base_url}/files",
+            headers=self._headers(),
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", payload.encode('utf-8'), "application/jsonl")},
+            timeout=self.timeout
+        )
+        upload.raise_for_status()
+        
+        batch = requests.post(
+            f"{self.base_url}/batches",
+            headers=self._headers(),
+            json={
+                "input_file_id": upload.json()["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h"
+            },
+            timeout=self.timeout
+        )
+        batch.raise_for_status()
+        return batch.json()["id"]
+    
+    def _get_batch(self, batch_id: str) -> Dict:
+        response = requests.get(f"{self.base_url}/batches/{batch_id}", headers=self._headers(), timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+    
+    def poll(self, batch_id: str) -> str:
+        return self.STATUS_MAP.get(self._get_batch(batch_id)["status"], 'in_progress')
+    
+    def fetch_results(self, batch_id: str) -> Dict[str, LLMResponse]:
+        batch = self._get_batch(batch_id)
+        results = {}
+        for file_key in ("output_file_id", "error_file_id"):
+            file_id = batch.get(file_key)
+            if not file_id:
+                continue
+            response = requests.get(f"{self.base_url}/files/{file_id}/content", headers=self._headers(), timeout=self.timeout)
+            response.raise_for_status()
+            for line in _iter_jsonl(response.text):
+                results[line["custom_id"]] = self._parse_line(line)
+        return results
+    
+    def _parse_line(self, line: Dict) -> LLMResponse:
+        body = (line.get("response") or {}).get("body") or {}
+        if line.get("error") or "choices" not in body:
+            error = line.get("error") or body.get("error") or "unknown error"
+            return LLMResponse(text="", provider=self.provider, model=body.get("model", ""), error=json.dumps(error))
+        usage = body.get("usage") or {}
+        choice = body["choices"][0]
+        return LLMResponse(
+            text=choice["message"]["content"] or "",
+            provider=self.provider,
+            model=body.get("model", ""),
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            finish_reason=choice.get("finish_reason")
+        )
+
+class AnthropicBatchBackend(BatchBackend):
+    """Anthropic Message Batches API (/v1/messages/batches)"""
+    
+    provider = "anthropic"
+    default_model = "claude-3-sonnet-20240229"
+    max_batch_size = 100000
+    
+    def __init__(self, api_key: str, base_url: str = "https://api.anthropic.com/v1", timeout: float = 60):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+    
+    def _headers(self) -> Dict[str, str]:
+        return {"x-api-key": self.api_key, "anthropic-version": "2023-06-01"}
+    
+    def format_request(self, job: BatchJob) -> Dict:
+        # 동기 경로(ClaudeClient._request)처럼 temperature 미지정 시 제공자 기본값 사용
+        params = {
+            "model": job.model or self.default_model,
+            "max_tokens": job.max_tokens,
+            "messages": [{"role": "user", "content": job.prompt}]
+        }
+        if job.temperature is not None:
+            params["temperature"] = job.temperature
+        return {"custom_id": job.custom_id, "params": params}
+    
+    def submit(self, jobs: List[BatchJob]) -> str:
+        response = requests.post(
+            f"{self.base_url}/messages/batches",
+            headers=self._headers(),
+            json={"requests": [self.format_request(job) for job in jobs]},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.json()["id"]
+    
+    def _get_batch(self, batch_id: str) -> Dict:
+        response = requests.get(f"{self.base_url}/messages/batches/{batch_id}", headers=self._headers(), timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+    
+    def poll(self, batch_id: str) -> str:
+        return 'completed' if self._get_batch(batch_id)["processing_status"] == 'ended' else 'in_progress'
+    
+    def fetch_results(self, batch_id: str) -> Dict[str, LLMResponse]:
+        results_url = self._get_batch(batch_id)["results_url"]
+        response = requests.get(results_url, headers=self._headers(), timeout=self.timeout)
+        response.raise_for_status()
+        
+        results = {}
+        for line in _iter_jsonl(response.text):
+            result = line["result"]
+            if result["type"] != "succeeded":
+                results[line["custom_id"]] = LLMResponse(
+                    text="", provider=self.provider, model="",
+                    error=json.dumps(result.get("error") or result["type"])
+                )
+                continue
+            message = result["message"]
+            results[line["custom_id"]] = LLMResponse(
+                text="".join(block.get("text", "") for block in message["content"]),
+                provider=self.provider,
+                model=message.get("model", ""),
+                prompt_tokens=message["usage"]["input_tokens"],
+                completion_tokens=message["usage"]["output_tokens"],
+                finish_reason=message.get("stop_reason")
+            )
+        return results
+
+class LocalBatchBackend(BatchBackend):
+    """
+    로컬 배치 엔드포인트 대역
+    작업을 JSONL 파일로 직렬화한 뒤 백그라운드 스레드에서 handler로 처리
+    테스트 및 배치 API가 없는 제공자(Gemini, DeepSeek)의 대체 경로로 사용
+    work_dir를 지정하지 않으면 첫 제출 시 임시 디렉터리를 만들어 사용
+    """
+    
+    provider = "local"
+    
+    def __init__(self, handler: Callable[[BatchJob], LLMResponse] = None, client: LLMClient = None,
+                 work_dir: Optional[str] = None):
+        if handler is None and client is None:
+            raise ValueError("handler 또는 client 중 하나는 필요합니다.")
+        self.handler = handler or (lambda job: client.generate(job.prompt, job.model, temperature=job.temperature))
+        self.work_dir = work_dir
+        self._threads: Dict[str, threading.Thread] = {}
+    
+    def _ensure_work_dir(self):
+        if self.work_dir is None:
+            self.work_dir = tempfile.mkdtemp(prefix="batch_jobs_")
+        else:
+            os.makedirs(self.work_dir, exist_ok=True)
+    
+    def _path(self, batch_id: str, kind: str) -> str:
+        return os.path.join(self.work_dir, f"{batch_id}.{kind}.jsonl")
+    
+    def format_request(self, job: BatchJob) -> Dict:
+        return dict(custom_id=job.custom_id, **asdict(job))
+    
+    def submit(self, jobs: List[BatchJob]) -> str:
+        self._ensure_work_dir()
+        batch_id = f"local_{uuid.uuid4().hex[:12]}"
+        with open(self._path(batch_id, 'input'), 'w', encoding='utf-8') as f:
+            for job in jobs:
+                f.write(json.dumps(self.format_request(job), ensure_ascii=False) + "\n")
+        
+        thread = threading.Thread(target=self._process, args=(batch_id,), daemon=True)
+        self._threads[batch_id] = thread
+        thread.start()
+        return batch_id
+    
+    def _process(self, batch_id: str):
+        tmp_path = self._path(batch_id, 'output') + ".tmp"
+        try:
+            with open(self._path(batch_id, 'input'), 'r', encoding='utf-8') as f_in, \
+                    open(tmp_path, 'w', encoding='utf-8') as f_out:
+                for line in f_in:
+                    request = json.loads(line)
+                    custom_id = request.pop("custom_id")
+                    result = self.handler(BatchJob(**request))
+                    f_out.write(json.dumps({"custom_id": custom_id, "response": result.to_dict()}, ensure_ascii=False) + "\n")
+        except Exception as e:
+            # 출력 파일 없이 스레드가 끝나면 poll()이 'failed' 반환
+            print(f"로컬 배치 {batch_id} 처리 실패: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        # 완료 시점에만 출력 파일이 나타나도록 원자적 이름 변경
+        os.replace(tmp_path, self._path(batch_id, 'output'))
+    
+    def poll(self, batch_id: str) -> str:
+        if os.path.exists(self._path(batch_id, 'output')):
+            return 'completed'
+        thread = self._threads.get(batch_id)
+        if thread is not None and not thread.is_alive():
+            return 'failed'
+        return 'in_progress'
+    
+    def fetch_results(self, batch_id: str) -> Dict[str, LLMResponse]:
+        with open(self._path(batch_id, 'output'), 'r', encoding='utf-8') as f:
+            return {line["custom_id"]: LLMResponse(**line["response"]) for line in _iter_jsonl(f.read())}
+
+def backend_for_client(client: LLMClient, work_dir: Optional[str] = None) -> BatchBackend:
+    """클라이언트 제공자에 맞는 배치 백엔드 생성 (배치 API 미지원 제공자는 로컬 대역 사용)"""
+    if client.provider == "openai":
+        return OpenAIBatchBackend(client.api_key)
+    if client.provider == "anthropic":
+        return AnthropicBatchBackend(client.api_key)
+    return LocalBatchBackend(client=client, work_dir=work_dir)
+
+class BatchTimeoutError(TimeoutError):
+    """
+    배치 대기 시간 초과
+    completed: 시간 초과 전까지 완료된 결과 (custom_id -> LLMResponse), 버리지 말고 병합/저장할 것
+    pending_jobs: 아직 끝나지 않은 배치의 작업 목록, pending_batches: (클라이언트 이름, 배치 ID) 목록
+    """
+    
+    def __init__(self, completed: Dict[str, LLMResponse], pending_jobs: List[BatchJob],
+                 pending_batches: List[Tuple[str, str]]):
+        self.completed = completed
+        self.pending_jobs = pending_jobs
+        self.pending_batches = pending_batches
+        job_ids = [f"{job.client_name}/{job.prompt_id}" for job in pending_jobs] or pending_batches
+        super().__init__(f"배치 대기 시간 초과: 완료 {len(completed)}개, 미완료 {job_ids}")
+
+class BatchRunner:
+    """배치 작업 제출 → 완료 대기 → 결과 병합"""
+    
+    def __init__(self, backends: Dict[str, BatchBackend], poll_interval: float = 30.0,
+                 timeout: Optional[float] = None):
+        self.backends = backends
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        # 배치 ID -> 제출한 작업 (시간 초과 시 미완료 작업 보고용)
+        self._batch_jobs: Dict[str, List[BatchJob]] = {}
+    
+    def submit(self, jobs: List[BatchJob]) -> Dict[str, List[str]]:
+        """클라이언트별로 작업을 나눠 제출, 클라이언트 이름 -> 배치 ID 목록 반환"""
+        seen = set()
+        duplicates = set()
+        for job in jobs:
+            key = (job.client_name, job.prompt_id)
+            if key in seen:
+                duplicates.add(key)
+            seen.add(key)
+        if duplicates:
+            # custom_id가 (클라이언트, 프롬프트 ID)로 정해지므로 중복 작업은 결과가 서로 덮어씀
+            raise ValueError(f"중복된 (클라이언트, 프롬프트 ID) 작업: {sorted(duplicates)}")
+        
+        grouped: Dict[str, List[BatchJob]] = {}
+        for job in jobs:
+            grouped.setdefault(job.client_name, []).append(job)
+        
+        submitted = {}
+        for client_name, client_jobs in grouped.items():
+            backend = self.backends[client_name]
+            batch_ids = []
+            for i in range(0, len(client_jobs), backend.max_batch_size):
+                batch_jobs = client_jobs[i:i + backend.max_batch_size]
+                batch_id = backend.submit(batch_jobs)
+                self._batch_jobs[batch_id] = batch_jobs
+                batch_ids.append(batch_id)
+            submitted[client_name] = batch_ids
+            print(f"{client_name}: {len(client_jobs)}개 작업을 {len(batch_ids)}개 배치로 제출")
+        return submitted
+    
+    def wait(self, submitted: Dict[str, List[str]]) -> Dict[str, LLMResponse]:
+        """
+        모든 배치 완료까지 폴링 후 custom_id -> LLMResponse 반환
+        시간 초과 시 완료된 결과와 미완료 작업을 담은 BatchTimeoutError 발생
+        """
+        pending = {(name, batch_id) for name, batch_ids in submitted.items() for batch_id in batch_ids}
+        results = {}
+        start = time.monotonic()
+        
+        while pending:
+            for name, batch_id in sorted(pending):
+                status = self.backends[name].poll(batch_id)
+                if status == 'in_progress':
+                    continue
+                pending.discard((name, batch_id))
+                if status == 'completed':
+                    results.update(self.backends[name].fetch_results(batch_id))
+                    print(f"{name} 배치 {batch_id} 완료")
+                else:
+                    print(f"{name} 배치 {batch_id} 실패")
+            
+            if not pending:
+                break
+            if self.timeout is not None and time.monotonic() - start > self.timeout:
+                pending_batches = sorted(pending)
+                pending_jobs = [job for _, batch_id in pending_batches for job in self._batch_jobs.get(batch_id, [])]
+                raise BatchTimeoutError(results, pending_jobs, pending_batches)
+            time.sleep(self.poll_interval)
+        
+        return results
+    
+    def run(self, jobs: List[BatchJob]) -> Dict[str, LLMResponse]:
+        return self.wait(self.submit(jobs))
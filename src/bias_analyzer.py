@@ -1,3 +1,4 @@
+from types import MappingProxyType
 import torch
 import numpy as np
 import pandas as pd
@@ -6,6 +7,14 @@ from sklearn.metrics.pairwise import cosine_similarity
 import spacy
 from textblob import TextBlob
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from src.profiling import get_profiler
+from src.question_bank import EntityRegistry, load_question_bank
+from src.multilingual import LanguageRouter, detect_language
+from src.stance_classifier import DEFAULT_STANCE_MODEL, TransformerStanceClassifier
+from src.dedup import ResponseDeduplicator
+from src.records import EntityResultBlock
+from src.model_manager import ManagedModel, get_model_manager
+from src.comparison import ModelComparisonEngine
 
 class BiasAnalyzer:
     """
@@ -13,13 +22,37 @@ class BiasAnalyzer:
     특정 국가/정권에 대한 편향을 정량화
     """
     
-    def __init__(self, model_name="bert-base-uncased", use_gpu=False):
+    def __init__(self, model_name="bert-base-uncased", use_gpu=False, profiler=None, entity_registry=None,
+                 multilingual=True, scoring_backend='lexicon', stance_model=DEFAULT_STANCE_MODEL, deduplicator=None,
+                 idle_unload_seconds=None, num_threads=None, max_length=256, long_text='truncate', chunk_overlap=32,
+                 model_manager=None, stance_label_map=None):
         self.model_name = model_name
         self.use_gpu = use_gpu and torch.cuda.is_available()
+        # 구간별 계측기 (기본값: 전역 계측기, 비활성화 시 오버헤드 없음)
+        self.profiler = profiler or get_profiler()
+        
+        # 메모리 절약을 위해 지연 로딩, idle_unload_seconds 동안 사용하지 않으면 해제 후 다음 사용 시 재로드
+        # 프로세스당 모델 메모리 상한은 model_manager (기본값: 전역 관리자, LLM_ANALYSIS_MAX_MODEL_MB)
+        # num_threads는 torch.set_num_threads로 프로세스 전체 torch 스레드 수를 바꾸므로 명시적으로 전달한 경우에만
+        # 모델 로드 시 적용 (미지정 시 프로세스 설정을 건드리지 않음)
+        self.num_threads = num_threads
+        self.idle_unload_seconds = idle_unload_seconds
+        self.model_manager = model_manager or get_model_manager()
+        self._bert = ManagedModel(f"bert:{model_name}", self._create_bert_model,
+                                  idle_timeout=idle_unload_seconds, manager=self.model_manager)
+        
+        # 긴 텍스트 처리: 'truncate' (max_length 토큰에서 절단) 또는 'chunk' (겹치는 구간으로 나눠 임베딩 평균)
+        if long_text not in ('truncate', 'chunk'):
+            raise ValueError(f"지원하지 않는 긴 텍스트 처리 방식: {long_text}")
+        # 구간 길이는 max_length에서 특수 토큰([CLS], [SEP]) 2개를 뺀 값이므로 겹침은 그보다 작아야 함
+        if max_length <= 2:
+            raise ValueError(f"max_length는 2보다 커야 합니다: {max_length}")
+        if long_text == 'chunk' and not 0 <= chunk_overlap < max_length - 2:
+            raise ValueError(f"chunk_overlap은 0 이상 max_length - 2({max_length - 2}) 미만이어야 합니다: {chunk_overlap}")
+        self.max_length = max_length
+        self.long_text = long_text
+        self.chunk_overlap = chunk_overlap
         
-        # 메모리 절약을 위해 지연 로딩
-        self.tokenizer = None
-        self.model = None
         self.sentiment_analyzer = SentimentIntensityAnalyzer()
         
         # spaCy 모델 로드 (개체명 인식용)
@@ -28,40 +61,126 @@ class BiasAnalyzer:
         except:
             print("spaCy 모델이 설치되지 않았습니다. 'python -m spacy download en_core_web_sm' 실행 필요")
             self.nlp = None
-            
-        # 타겟 국가/정권 리스트
-        self.target_entities = {
-            'china': ['China', 'Chinese', 'Beijing', 'Xi Jinping', 'CCP'],
-            'north_korea': ['North Korea', 'DPRK', 'Kim Jong-un', 'Pyongyang'],
-            'usa': ['USA', 'United States', 'America', 'Washington', 'Biden'],
-            'russia': ['Russia', 'Russian', 'Putin', 'Moscow']
-        }
+        
+        # 타겟 국가/정권 레지스트리 (미지정 시 첫 사용 때 질문 은행 데이터 파일에서 로드, 별칭은 하나의 정규식으로 컴파일)
+        self._entity_registry = entity_registry
+        
+        # 비영어 응답은 언어별 NER/감정 모델로 라우팅 (해당 언어가 처음 등장할 때 로드)
+        self.multilingual = multilingual
+        self._language_router = None
+        
+        # 편향 점수 백엔드: 'lexicon' (VADER compound) 또는 'transformer' (시퀀스 분류 모델)
+        if scoring_backend not in ('lexicon', 'transformer'):
+            raise ValueError(f"지원하지 않는 점수 백엔드: {scoring_backend}")
+        self.scoring_backend = scoring_backend
+        self.stance_model = stance_model
+        # 레이블 이름이 LABEL_0 형식인 분류 모델용 레이블 -> positive/negative/neutral 매핑
+        self.stance_label_map = stance_label_map
+        self._stance_classifier = None
+        
+        # 배치 분석 전 중복 제거 (기본값: 완전 중복만 병합, 유사 중복은 ResponseDeduplicator(threshold=...) 전달)
+        self.deduplicator = deduplicator or ResponseDeduplicator(threshold=None)
     
-    def _load_bert_model(self):
-        """BERT 모델 지연 로딩"""
-        if self.tokenizer is None:
-            print("BERT 모델 로딩 중...")
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModel.from_pretrained(self.model_name)
+    @property
+    def entity_registry(self) -> EntityRegistry:
+        if self._entity_registry is None:
+            self._entity_registry = load_question_bank().entity_registry
+        return self._entity_registry
+    
+    @entity_registry.setter
+    def entity_registry(self, registry: EntityRegistry):
+        self._entity_registry = registry
+    
+    @property
+    def target_entities(self):
+        """
+        엔티티 ID -> 별칭 (레지스트리 기준 읽기 전용 보기)
+        타겟을 바꾸려면 analyzer.target_entities = {...}로 전체를 다시 할당 (레지스트리와 매칭 정규식 재구성)
+        """
+        return MappingProxyType({
+            entity_id: tuple(aliases) for entity_id, aliases in self.entity_registry.aliases.items()
+        })
+    
+    @target_entities.setter
+    def target_entities(self, target_entities):
+        self._entity_registry = EntityRegistry.from_aliases(target_entities)
+    
+    @property
+    def language_router(self):
+        """언어별 분석 라우터 (지연 생성)"""
+        if self._language_router is None:
+            self._language_router = LanguageRouter(self)
+        return self._language_router
+    
+    @property
+    def stance_classifier(self):
+        """transformers 입장 분류기 (지연 생성, 모델은 첫 추론 시 로드)"""
+        if self._stance_classifier is None:
+            self._stance_classifier = TransformerStanceClassifier(
+                self.stance_model, num_threads=self.num_threads, use_gpu=self.use_gpu, profiler=self.profiler,
+                idle_unload_seconds=self.idle_unload_seconds, model_manager=self.model_manager,
+                label_map=self.stance_label_map
+            )
+        return self._stance_classifier
+    
+    def _create_bert_model(self):
+        """BERT 토크나이저/모델 로드 (ManagedModel 로더)"""
+        print("BERT 모델 로딩 중...")
+        with self.profiler.stage('bert.load'):
+            if self.num_threads is not None and torch.get_num_threads() != self.num_threads:
+                torch.set_num_threads(self.num_threads)
+            tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            model = AutoModel.from_pretrained(self.model_name)
             
             if self.use_gpu:
-                self.model = self.model.cuda()
+                model = model.cuda()
             else:
-                self.model = self.model.cpu()
+                model = model.cpu()
             
             # 메모리 절약을 위한 설정
-            self.model.eval()
-            print("BERT 모델 로딩 완료")
+            model.eval()
+        print("BERT 모델 로딩 완료")
+        return tokenizer, model
+    
+    # 이전 API 호환 (모델 상주는 ModelManager가 관리하므로 유휴 해제 후에는 None이 될 수 있음, 참조를 보관하지 말 것)
+    def _load_bert_model(self):
+        """BERT 토크나이저/모델 로드 (이미 로드되어 있으면 그대로 사용)"""
+        self._bert.load()
+    
+    @property
+    def tokenizer(self):
+        """로드된 BERT 토크나이저 (로드 전/해제 후 None)"""
+        components = self._bert.components
+        return components[0] if components is not None else None
+    
+    @property
+    def model(self):
+        """로드된 BERT 모델 (로드 전/해제 후 None)"""
+        components = self._bert.components
+        return components[1] if components is not None else None
+    
+    def unload_models(self):
+        """상주 중인 BERT/입장 분류/언어별 감정 모델 해제 (다음 사용 시 다시 로드)"""
+        self._bert.unload()
+        if self._stance_classifier is not None:
+            self._stance_classifier.unload()
+        if self._language_router is not None:
+            self._language_router.unload_models()
     
     def extract_entities(self, text):
         """개체명 인식"""
         if not self.nlp:
             return []
         
-        doc = self.nlp(text)
+        with self.profiler.stage('spacy.ner'):
+            doc = self.nlp(text)
+        return self.entities_from_doc(doc)
+    
+    def entities_from_doc(self, doc, labels=('GPE', 'PERSON', 'ORG')):
+        """spaCy Doc에서 국가/인물/조직 개체 추출"""
         entities = []
         for ent in doc.ents:
-            if ent.label_ in ['GPE', 'PERSON', 'ORG']:  # 국가, 인물, 조직
+            if ent.label_ in labels:  # 국가, 인물, 조직
                 entities.append({
                     'text': ent.text,
                     'label': ent.label_,
@@ -73,12 +192,14 @@ class BiasAnalyzer:
     def get_sentiment_scores(self, text):
         """감정 분석 점수 계산"""
         # VADER 감정 분석
-        vader_scores = self.sentiment_analyzer.polarity_scores(text)
+        with self.profiler.stage('vader.sentiment'):
+            vader_scores = self.sentiment_analyzer.polarity_scores(text)
         
         # TextBlob 감정 분석
-        blob = TextBlob(text)
-        textblob_polarity = blob.sentiment.polarity
-        textblob_subjectivity = blob.sentiment.subjectivity
+        with self.profiler.stage('textblob.sentiment'):
+            blob = TextBlob(text)
+            textblob_polarity = blob.sentiment.polarity
+            textblob_subjectivity = blob.sentiment.subjectivity
         
         return {
             'vader_positive': vader_scores['pos'],
@@ -89,42 +210,87 @@ class BiasAnalyzer:
             'textblob_subjectivity': textblob_subjectivity
         }
     
+    def get_sentiment_scores_batch(self, texts):
+        """
+        영어 텍스트 일괄 감정 점수
+        transformer 백엔드면 분류기 배치 추론 점수(model_*)를 어휘 기반 점수에 추가
+        """
+        scores = [self.get_sentiment_scores(text) for text in texts]
+        if self.scoring_backend == 'transformer' and texts:
+            for sentiment_scores, model_scores in zip(scores, self.stance_classifier.score_batch(list(texts))):
+                sentiment_scores.update(model_scores)
+        return scores
+    
+    @staticmethod
+    def bias_score_from(sentiment_scores):
+        """감정 점수에서 편향 점수 선택 (분류 모델 점수 우선, 없으면 VADER compound)"""
+        if 'model_compound' in sentiment_scores:
+            return sentiment_scores['model_compound']
+        return sentiment_scores['vader_compound']
+    
     def get_bert_embeddings(self, text):
         """BERT 임베딩 추출 (메모리 절약 버전)"""
-        self._load_bert_model()
-        
-        inputs = self.tokenizer(text, return_tensors="pt", truncation=True, max_length=256)
-        
-        with torch.no_grad():
-            outputs = self.model(**inputs)
-            # [CLS] 토큰의 임베딩 사용 (문장 전체 표현)
-            embeddings = outputs.last_hidden_state[:, 0, :].cpu().numpy()
-        
-        return embeddings.flatten()
+        return self.get_bert_embeddings_batch([text])[0]
     
-    def analyze_bias_towards_entity(self, text, target_entity):
-        """특정 개체에 대한 편향 분석"""
-        # 개체명 인식
-        entities = self.extract_entities(text)
-        
-        # 타겟 개체가 텍스트에 있는지 확인 (개선된 버전)
-        target_found = False
-        target_keywords = self.target_entities.get(target_entity, [])
+    def _chunk_token_ids(self, tokenizer, texts):
+        """
+        텍스트별 토큰 ID를 max_length 이하 구간 목록으로 분할
+        truncate 모드는 앞부분 1개 구간, chunk 모드는 chunk_overlap 토큰씩 겹치는 구간 전체
+        """
+        window = self.max_length - tokenizer.num_special_tokens_to_add()
+        step = window - self.chunk_overlap
+        if self.long_text == 'chunk' and step < 1:
+            raise ValueError(f"chunk_overlap({self.chunk_overlap})이 구간 길이({window}) 이상입니다.")
+        token_ids = tokenizer(texts, add_special_tokens=False)['input_ids']
         
-        # 1. spaCy 개체명 인식 결과 확인
-        for entity in entities:
-            if any(target.lower() in entity['text'].lower() for target in target_keywords):
-                target_found = True
-                break
-        
-        # 2. 직접 키워드 검색 (백업 방법)
-        if not target_found:
-            text_lower = text.lower()
-            for keyword in target_keywords:
-                if keyword.lower() in text_lower:
-                    target_found = True
-                    break
+        chunks = []
+        for ids in token_ids:
+            if self.long_text == 'truncate' or len(ids) <= window:
+                starts = [0]
+            else:
+                starts = list(range(0, len(ids) - self.chunk_overlap, step))
+            chunks.append([tokenizer.build_inputs_with_special_tokens(ids[start:start + window]) for start in starts])
+        return chunks
+    
+    def get_bert_embeddings_batch(self, texts, batch_size=16):
+        """
+        여러 텍스트 BERT [CLS] 임베딩 일괄 추출 (반환 형태: (텍스트 수, 은닉 차원))
+        chunk 모드에서는 모든 텍스트의 구간을 길이순으로 한꺼번에 배치 추론한 뒤 텍스트별로 토큰 수 가중 평균
+        """
+        texts = list(texts)
+        with self._bert.use() as (tokenizer, model):
+            if not texts:
+                return np.zeros((0, model.config.hidden_size), dtype=np.float32)
+            device = next(model.parameters()).device
+            chunks = self._chunk_token_ids(tokenizer, texts)
+            flat = [(text_index, ids) for text_index, text_chunks in enumerate(chunks) for ids in text_chunks]
+            order = sorted(range(len(flat)), key=lambda i: len(flat[i][1]))
+            
+            chunk_embeddings = np.zeros((len(flat), model.config.hidden_size), dtype=np.float32)
+            with self.profiler.stage('bert.embed', items=len(texts)):
+                for start in range(0, len(order), batch_size):
+                    bucket = order[start:start + batch_size]
+                    inputs = tokenizer.pad({'input_ids': [flat[i][1] for i in bucket]}, return_tensors="pt")
+                    inputs = {key: value.to(device) for key, value in inputs.items()}
+                    with torch.no_grad():
+                        outputs = model(**inputs)
+                        # [CLS] 토큰의 임베딩 사용 (문장 전체 표현)
+                        chunk_embeddings[bucket] = outputs.last_hidden_state[:, 0, :].cpu().numpy()
         
+        embeddings = np.zeros((len(texts), chunk_embeddings.shape[1]), dtype=np.float32)
+        weights = np.zeros(len(texts), dtype=np.float32)
+        for (text_index, ids), embedding in zip(flat, chunk_embeddings):
+            embeddings[text_index] += len(ids) * embedding
+            weights[text_index] += len(ids)
+        return embeddings / weights[:, None]
+    
+    def find_target_entities(self, text):
+        """텍스트에 등장하는 타겟 엔티티 집합 (별칭 정규식 1회 스캔)"""
+        with self.profiler.stage('analyzer.target_match'):
+            return self.entity_registry.find_entities(text)
+    
+    def build_entity_result(self, target_found, bias_score, sentiment_scores, entities):
+        """엔티티 1개에 대한 분석 결과 생성 (감정 점수/개체명은 복사하므로 엔티티 결과끼리 객체를 공유하지 않음)"""
         if not target_found:
             return {
                 'target_found': False,
@@ -133,12 +299,6 @@ class BiasAnalyzer:
                 'stance': 'neutral'
             }
         
-        # 감정 분석
-        sentiment_scores = self.get_sentiment_scores(text)
-        
-        # 편향 점수 계산 (compound score 기반)
-        bias_score = sentiment_scores['vader_compound']
-        
         # 입장 분류
         if bias_score > 0.1:
             stance = 'positive'
@@ -150,25 +310,111 @@ class BiasAnalyzer:
         return {
             'target_found': True,
             'bias_score': bias_score,
-            'sentiment_scores': sentiment_scores,
+            'sentiment_scores': dict(sentiment_scores),
             'stance': stance,
-            'entities': entities
+            'entities': [dict(entity) for entity in entities]
+        }
+    
+    def entity_results_from(self, found, features, entity_names):
+        """
+        타겟 매칭 결과(found)와 엔티티 무관 분석 결과(features = (개체명 목록, 감정 점수))로 엔티티별 결과 생성
+        features가 None이면(타겟이 없어 분석하지 않은 텍스트) 모든 엔티티 미발견
+        """
+        if features is None:
+            return {entity_name: self.build_entity_result(False, 0, None, None) for entity_name in entity_names}
+        entities, sentiment_scores = features
+        
+        # 편향 점수 계산 (compound score 기반)
+        bias_score = self.bias_score_from(sentiment_scores)
+        return {
+            entity_name: self.build_entity_result(entity_name in found, bias_score, sentiment_scores, entities)
+            for entity_name in entity_names
         }
     
+    def _analyze_entities(self, text, entity_names):
+        """
+        여러 타겟 엔티티에 대한 편향 분석
+        타겟이 하나라도 있을 때만 개체명 인식/감정 분석을 텍스트당 1회 수행하고 결과를 엔티티별로 공유
+        """
+        found = self.find_target_entities(text)
+        if not any(entity_name in found for entity_name in entity_names):
+            return self.entity_results_from(found, None, entity_names)
+        
+        if self.multilingual and detect_language(text) != 'en':
+            features = self.language_router.features_batch([text])[0]
+        else:
+            # 개체명 인식, 감정 분석
+            features = (self.extract_entities(text), self.get_sentiment_scores_batch([text])[0])
+        return self.entity_results_from(found, features, entity_names)
+    
+    def analyze_bias_towards_entity(self, text, target_entity):
+        """특정 개체에 대한 편향 분석"""
+        return self._analyze_entities(text, [target_entity])[target_entity]
+    
     def analyze_multiple_entities(self, text):
         """여러 개체에 대한 편향 분석"""
-        results = {}
-        
-        for entity_name in self.target_entities.keys():
-            results[entity_name] = self.analyze_bias_towards_entity(text, entity_name)
+        with self.profiler.stage('analyzer.multiple_entities'):
+            return self._analyze_entities(text, list(self.target_entities.keys()))
+    
+    def extract_features_batch(self, texts):
+        """
+        텍스트별 엔티티 무관 분석 결과 (개체명 목록, 감정 점수)
+        언어별로 묶어 spaCy nlp.pipe / 감정 모델 배치 추론 수행 (multilingual=False면 단일 텍스트 분석처럼 모두 영어로 분석)
+        """
+        return self.language_router.features_batch(texts, language=None if self.multilingual else 'en')
+    
+    def analyze_grouped(self, texts, groups, entity_names, extract_features=None):
+        """
+        중복 그룹(DedupGroups) 단위 분석
+        개체명 인식/감정 분석은 타겟이 있는 그룹의 대표 텍스트만 1회 수행해 구성원과 공유하고, 타겟/별칭 매칭은
+        구성원마다 자기 텍스트로 수행 (유사 중복이 서로 다른 엔티티를 언급해도 각자 판정)
+        extract_features: 대표 텍스트 목록 -> (개체명 목록, 감정 점수) 목록 (기본값: extract_features_batch)
+        """
+        extract_features = extract_features or self.extract_features_batch
+        found_by_text = {}
+        found_sets = []
+        for text in texts:
+            if text not in found_by_text:
+                found_by_text[text] = self.find_target_entities(text)
+            found_sets.append(found_by_text[text])
         
-        return results
+        active_groups = sorted({
+            groups.assignments[i] for i, found in enumerate(found_sets)
+            if any(entity_name in found for entity_name in entity_names)
+        })
+        features = extract_features([texts[groups.representatives[g]] for g in active_groups]) if active_groups else []
+        group_features = dict(zip(active_groups, features))
+        return [
+            self.entity_results_from(found, group_features.get(group), entity_names)
+            for found, group in zip(found_sets, groups.assignments)
+        ]
+    
+    def analyze_batch(self, texts, entity_names=None):
+        """
+        여러 텍스트 일괄 편향 분석 (입력 순서대로 엔티티별 결과 반환)
+        중복/유사 중복 텍스트는 그룹 대표만 개체명 인식/감정 분석하고, 타겟 매칭은 텍스트마다 수행 (analyze_grouped)
+        """
+        texts = list(texts)
+        entity_names = entity_names or list(self.target_entities.keys())
+        with self.profiler.stage('analyzer.batch', items=len(texts)):
+            with self.profiler.stage('dedup.group', items=len(texts)):
+                groups = self.deduplicator.group(texts)
+            return self.analyze_grouped(texts, groups, entity_names)
+    
+    def analyze_batch_records(self, texts, entity_names=None):
+        """analyze_batch 결과를 struct-of-arrays 블록(EntityResultBlock)으로 반환 (대량 결과 메모리 절약)"""
+        entity_names = entity_names or list(self.target_entities.keys())
+        return EntityResultBlock.from_batch(self.analyze_batch(texts, entity_names), entity_names)
     
-    def compare_models_bias(self, responses_dict):
+    def compare_models(self, responses_dict, entity_names=None, workers=1, chunk_size=64, analyzer_factory=None):
+        """
+        여러 모델의 응답 편향 비교 (ModelComparison: 모델별 결과 + 모델 x 엔티티 점수 행렬)
+        모델 간 같은/유사한 응답은 한 번만 분석하고, workers > 1이면 고유 텍스트를 프로세스 풀에서 분석
+        """
+        engine = ModelComparisonEngine(self, workers=workers, chunk_size=chunk_size, analyzer_factory=analyzer_factory)
+        with self.profiler.stage('analyzer.compare_models', items=len(responses_dict)):
+            return engine.compare(responses_dict, entity_names)
+    
+    def compare_models_bias(self, responses_dict, workers=1):
         """여러 모델의 응답에 대한 편향 비교"""
-        comparison_results = {}
-        
-        for model_name, response in responses_dict.items():
-            comparison_results[model_name] = self.analyze_multiple_entities(response)
-        
-        return comparison_results 
\ No newline at end of file
+        return self.compare_models(responses_dict, workers=workers).results
@@ -0,0 +1,430 @@
+"""
+편향 분석 배치 실행 CLI
+
+    python -m src.cli collect   --output responses.json [--clients GPT-4,Claude] [--workers 8] [--shard 0/4]
+    python -m src.cli analyze   --input responses.json --output question_results.json [--workers 4] [--shard 0/4]
+    python -m src.cli aggregate --input question_results.*.json --output comprehensive_bias_results.json
+    python -m src.cli report    --input comprehensive_bias_results.json [--output report.txt] [--run-store bias_runs.db]
+                                [--html report.html] [--markdown report.md] [--workers 4]
+    python -m src.cli merge     --input shard0.json shard1.json --output merged.json
+    python -m src.cli enqueue   --input responses.json --queue work_queue.db [--batch-size 64]
+    python -m src.cli worker    --queue work_queue.db --results-dir results/ [--processes 4] [--wait]
+    python -m src.cli sweep     --spec sweep.json --output sweep_responses.json [--workers 8] [--per-provider 2]
+    python -m src.cli sweep-analyze --input sweep_responses.json --output sweep_results.json [--robustness robustness.json]
+
+--shard i/N (0 <= i < N)은 (모델, 질문 ID) 해시로 작업을 나누므로 같은 입력이면 어느 머신에서든 같은 분할이 나옴
+analyze의 유사 중복 병합(--near-duplicates)은 전체 응답을 한 번에 묶어야 하므로 샤드 실행에서는 쓸 수 없음 (완전 중복만 병합)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.io_utils import load_json, write_json
+
+# 클라이언트 이름 -> (클라이언트 클래스 이름, API 키 환경변수)
+CLIENT_SPECS = {
+    'GPT-4': ('OpenAIClient', 'OPENAI_API_KEY'),
+    'Claude': ('ClaudeClient', 'ANTHROPIC_API_KEY'),
+    'Gemini': ('GeminiClient', 'GOOGLE_API_KEY'),
+    'DeepSeek': ('DeepSeekClient', 'DEEPSEEK_API_KEY')
+}
+
+def parse_shard(value: Optional[str]) -> Tuple[int, int]:
+    """'i/N' 형식 샤드 지정 파싱 (미지정 시 0/1 = 전체)"""
+    if not value:
+        return 0, 1
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"샤드는 'i/N' 형식이어야 합니다: {value}")
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"샤드 번호는 0 <= i < N 이어야 합니다: {value}")
+    return index, count
+
+def shard_of(model: str, question_id: str, num_shards: int) -> int:
+    """(모델, 질문 ID)의 결정적 샤드 번호 (프로세스/머신과 무관하게 동일)"""
+    key = f"{model}\x00{question_id}".encode('utf-8')
+    return int(hashlib.sha1(key).hexdigest(), 16) % num_shards
+
+def in_shard(model: str, question_id: str, shard: Tuple[int, int]) -> bool:
+    index, count = shard
+    return count == 1 or shard_of(model, question_id, count) == index
+
+def merge_stores(stores: Iterable[Dict]) -> Dict[str, Dict]:
+    """
+    모델 -> 질문 ID -> 값 형식 저장소(응답 저장소, 질문별 분석 결과, 종합 결과)를 병합
+    같은 키에 다른 값이 있으면 샤드가 겹친 것이므로 오류
+    """
+    merged: Dict[str, Dict] = {}
+    for store in stores:
+        for model, entries in store.items():
+            target = merged.setdefault(model, {})
+            for key, value in entries.items():
+                if key in target and target[key] != value:
+                    raise ValueError(f"샤드 출력 충돌: {model} / {key}")
+                target[key] = value
+    return merged
+
+def build_collector(client_names: Optional[List[str]] = None):
+    """환경변수 API 키가 있는 클라이언트로 응답 수집기 구성"""
+    from src import llm_clients
+    
+    collector = llm_clients.LLMResponseCollector()
+    for name in client_names or list(CLIENT_SPECS):
+        if name not in CLIENT_SPECS:
+            raise ValueError(f"알 수 없는 클라이언트: {name} (지원: {', '.join(CLIENT_SPECS)})")
+        class_name, env_var = CLIENT_SPECS[name]
+        api_key = os.getenv(env_var)
+        if not api_key:
+            if client_names:
+                raise ValueError(f"{name} 클라이언트의 API 키({env_var})가 설정되지 않았습니다.")
+            continue
+        collector.add_client(name, getattr(llm_clients, class_name)(api_key))
+    return collector
+
+def cmd_collect(args) -> int:
+    from src.batch import make_batch_jobs
+    from src.question_bank import load_question_bank
+    
+    collector = build_collector(args.clients.split(',') if args.clients else None)
+    if not collector.clients:
+        print("사용 가능한 LLM 클라이언트가 없습니다. API 키 환경변수를 확인하세요.", file=sys.stderr)
+        return 1
+    
+    questions = load_question_bank(args.questions).standard_questions
+    jobs = [job for job in make_batch_jobs(questions, list(collector.clients))
+            if in_shard(job.client_name, job.prompt_id, args.shard)]
+    print(f"수집 작업 {len(jobs)}개 (샤드 {args.shard[0]}/{args.shard[1]})")
+    
+    if args.batch:
+        collector.run_batch(jobs, poll_interval=args.poll_interval, work_dir=args.batch_dir)
+    else:
+        collector.run_jobs(jobs, max_workers=args.workers)
+    
+    write_json(args.output, collector.response_store)
+    if args.call_log:
+        collector.save_call_log(args.call_log)
+    print(f"응답 저장소 저장: {args.output}")
+    return 0
+
+# 분석 워커 프로세스별 분석기 (프로세스당 1회 생성)
+_worker_analyzer = None
+
+def build_analyzer(question_bank_path: Optional[str], backend: str = 'lexicon',
+                   near_duplicate_threshold: Optional[float] = None, **analyzer_kwargs):
+    """CLI/워커 공용 분석기 생성 (analyzer_kwargs는 BiasAnalyzer에 그대로 전달)"""
+    from src.bias_analyzer import BiasAnalyzer
+    from src.dedup import ResponseDeduplicator
+    from src.question_bank import load_question_bank
+    
+    bank = load_question_bank(question_bank_path)
+    return BiasAnalyzer(
+        entity_registry=bank.entity_registry,
+        scoring_backend=backend,
+        deduplicator=ResponseDeduplicator(threshold=near_duplicate_threshold),
+        **analyzer_kwargs
+    )
+
+def _init_analyze_worker(question_bank_path: Optional[str], backend: str):
+    global _worker_analyzer
+    _worker_analyzer = build_analyzer(question_bank_path, backend)
+
+def _extract_chunk(texts: List[str]) -> List[Tuple[List[Dict], Dict]]:
+    return _worker_analyzer.extract_features_batch(texts)
+
+def _extract_features(analyzer, args, texts: List[str]) -> List[Tuple[List[Dict], Dict]]:
+    """대표 텍스트별 (개체명 목록, 감정 점수), workers > 1이면 chunk_size 단위로 프로세스 풀에서 추출"""
+    if args.workers <= 1:
+        return analyzer.extract_features_batch(texts)
+    chunks = [texts[i:i + args.chunk_size] for i in range(0, len(texts), args.chunk_size)]
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_analyze_worker,
+                             initargs=(args.questions, args.backend)) as executor:
+        return [features for chunk_features in executor.map(_extract_chunk, chunks) for features in chunk_features]
+
+def cmd_analyze(args) -> int:
+    from src.question_bank import load_question_bank
+    
+    # 유사 중복 그룹(대표 배정)은 함께 묶인 응답 집합에 따라 달라지므로 샤드별로 나누면 단일 실행과 결과가 달라짐
+    if args.near_duplicates is not None and args.shard[1] > 1:
+        raise ValueError("--near-duplicates는 --shard와 함께 쓸 수 없습니다 (샤드 실행은 완전 중복만 병합)")
+    bank = load_question_bank(args.questions)
+    store = merge_stores(load_json(path) for path in args.input)
+    items = [
+        (model, question_id, text)
+        for model, responses in sorted(store.items())
+        for question_id, text in sorted(responses.items())
+        if question_id in bank.questions and in_shard(model, question_id, args.shard)
+    ]
+    print(f"분석 대상 응답 {len(items)}개 (샤드 {args.shard[0]}/{args.shard[1]}, 워커 {args.workers})")
+    
+    # 중복 그룹은 샤드 전체 응답에서 한 번만 만들고 워커는 대표 텍스트의 개체명/감정만 추출 (청크 크기와 무관한 결과)
+    analyzer = build_analyzer(args.questions, args.backend, args.near_duplicates)
+    texts = [text for _, _, text in items]
+    groups = analyzer.deduplicator.group(texts)
+    results = analyzer.analyze_grouped(texts, groups, bank.entity_ids, partial(_extract_features, analyzer, args))
+    
+    question_results: Dict[str, Dict[str, Dict]] = {}
+    for (model, question_id, _), result in zip(items, results):
+        question_results.setdefault(model, {})[question_id] = result
+    
+    write_json(args.output, question_results)
+    print(f"질문별 분석 결과 저장: {args.output}")
+    return 0
+
+def cmd_aggregate(args) -> int:
+    from src.multi_question_analyzer import MultiQuestionBiasAnalyzer
+    
+    analyzer = MultiQuestionBiasAnalyzer(question_bank_path=args.questions)
+    question_results = merge_stores(load_json(path) for path in args.input)
+    comprehensive_results = {
+        model: analyzer.aggregate_question_results(results)
+        for model, results in sorted(question_results.items())
+    }
+    write_json(args.output, comprehensive_results)
+    print(f"종합 결과 저장: {args.output} (모델 {len(comprehensive_results)}개)")
+    return 0
+
+def cmd_report(args) -> int:
+    from src.multi_question_analyzer import MultiQuestionBiasAnalyzer
+    
+    comprehensive_results = merge_stores(load_json(path) for path in args.input)
+    if args.output or not (args.html or args.markdown):
+        report = MultiQuestionBiasAnalyzer(question_bank_path=args.questions).generate_bias_report(comprehensive_results)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(report)
+            print(f"리포트 저장: {args.output}")
+        else:
+            print(report)
+    
+    if args.html or args.markdown:
+        from src.report_builder import ReportBuilder
+        builder = ReportBuilder(title=args.title, workers=args.workers, plotlyjs=args.plotlyjs)
+        builder.build(comprehensive_results, html_path=args.html, markdown_path=args.markdown,
+                      subtitle=args.label or ", ".join(args.input))
+        for path in (args.html, args.markdown):
+            if path:
+                print(f"리포트 저장: {path}")
+    
+    if args.run_store:
+        from src.run_store import RunStore
+        store = RunStore(args.run_store)
+        run_id = store.record_run(comprehensive_results, label=args.label, metadata={'inputs': args.input})
+        store.close()
+        print(f"실행 이력 저장: {args.run_store} (run_id={run_id})")
+    return 0
+
+def cmd_merge(args) -> int:
+    merged = merge_stores(load_json(path) for path in args.input)
+    write_json(args.output, merged)
+    print(f"{len(args.input)}개 파일 병합: {args.output}")
+    return 0
+
+def cmd_enqueue(args) -> int:
+    from src.question_bank import load_question_bank
+    from src.work_queue import open_queue
+    from src.worker import make_analysis_batches
+    
+    bank = load_question_bank(args.questions)
+    store = merge_stores(load_json(path) for path in args.input)
+    batches = make_analysis_batches(store, args.batch_size, bank.questions)
+    queue = open_queue(args.queue)
+    queue.enqueue_many(batches, max_attempts=args.max_attempts)
+    print(f"작업 {len(batches)}개 등록: {args.queue} {queue.stats()}")
+    return 0
+
+def _run_queue_worker(args, worker_index: int) -> Dict[str, int]:
+    from src.work_queue import default_worker_id, open_queue
+    from src.worker import AnalysisWorker
+    from src.question_bank import load_question_bank
+    from src.model_manager import get_model_manager
+    
+    # 상주 워커는 오래 쉬는 동안 모델 메모리를 반납하도록 프로세스별 관리자 설정
+    if args.max_model_mb:
+        get_model_manager().max_memory_mb = args.max_model_mb
+    worker = AnalysisWorker(
+        open_queue(args.queue),
+        args.results_dir,
+        partial(build_analyzer, args.questions, args.backend, args.near_duplicates,
+                idle_unload_seconds=args.idle_unload_seconds, num_threads=args.threads),
+        entity_names=load_question_bank(args.questions).entity_ids,
+        worker_id=f"{default_worker_id()}-{worker_index}",
+        lease_seconds=args.lease_seconds
+    )
+    return worker.run(max_batches=args.max_batches, wait=args.wait, poll_interval=args.poll_interval)
+
+def cmd_worker(args) -> int:
+    if args.processes > 1:
+        with ProcessPoolExecutor(max_workers=args.processes) as executor:
+            totals = list(executor.map(partial(_run_queue_worker, args), range(args.processes)))
+    else:
+        totals = [_run_queue_worker(args, 0)]
+    
+    from src.work_queue import open_queue
+    print(f"워커 {len(totals)}개 종료: 완료 {sum(t['processed'] for t in totals)}건, "
+          f"실패 {sum(t['failed'] for t in totals)}건, 큐 상태 {open_queue(args.queue).stats()}")
+    return 0
+
+def cmd_queue_status(args) -> int:
+    from src.work_queue import open_queue
+    
+    queue = open_queue(args.queue)
+    print(json.dumps(queue.stats(), ensure_ascii=False))
+    for task in queue.failed_tasks():
+        last_line = (task['error'] or '').strip().splitlines()[-1:] or ['']
+        print(f"실패 작업 {task['task_id']} (시도 {task['attempts']}회): {last_line[0]}")
+    return 0
+
+def cmd_sweep(args) -> int:
+    from src.question_bank import load_question_bank
+    from src.sweep import SweepSpec
+    
+    collector = build_collector(args.clients.split(',') if args.clients else None)
+    if not collector.clients:
+        print("사용 가능한 LLM 클라이언트가 없습니다. API 키 환경변수를 확인하세요.", file=sys.stderr)
+        return 1
+    
+    # 출력 파일이 있으면 이어서 수집 (이미 받은 응답은 다시 호출하지 않음)
+    if os.path.exists(args.output):
+        collector.load_response_store(args.output)
+        print(f"기존 스윕 응답 로드: {args.output}")
+    
+    collector.run_sweep(
+        SweepSpec.from_file(args.spec),
+        load_question_bank(args.questions).standard_questions,
+        max_workers=args.workers,
+        per_provider=args.per_provider,
+        checkpoint_path=args.output
+    )
+    if args.call_log:
+        collector.save_call_log(args.call_log)
+    print(f"스윕 응답 저장소 저장: {args.output}")
+    return 0
+
+def cmd_sweep_analyze(args) -> int:
+    from src.multi_question_analyzer import MultiQuestionBiasAnalyzer
+    from src.sweep import variant_robustness
+    
+    analyzer = MultiQuestionBiasAnalyzer(question_bank_path=args.questions)
+    analyzer.bias_analyzer = build_analyzer(args.questions, args.backend, args.near_duplicates)
+    variant_results = analyzer.analyze_sweep(merge_stores(load_json(path) for path in args.input))
+    write_json(args.output, variant_results)
+    print(f"변형별 종합 결과 저장: {args.output} (변형 {len(variant_results)}개)")
+    
+    if args.robustness:
+        write_json(args.robustness, variant_robustness(variant_results))
+        print(f"변형 간 견고성 요약 저장: {args.robustness}")
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="LLM 응답 편향 분석 배치 실행기")
+    parser.add_argument('--questions', default=None, help="질문 은행 JSON 경로 (기본값: 내장 질문 은행)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    collect = subparsers.add_parser('collect', help="LLM 응답 수집 -> 응답 저장소")
+    collect.add_argument('--output', required=True, help="응답 저장소 출력 경로")
+    collect.add_argument('--clients', help=f"쉼표로 구분한 클라이언트 ({','.join(CLIENT_SPECS)}; 기본값: 키가 있는 전체)")
+    collect.add_argument('--workers', type=int, default=4, help="동시 API 호출 수")
+    collect.add_argument('--shard', type=parse_shard, default=(0, 1), help="i/N 샤드만 수집")
+    collect.add_argument('--batch', action='store_true', help="제공자 배치 API로 제출")
+    collect.add_argument('--batch-dir', default=None, help="로컬 배치 작업 디렉터리 (미지정 시 임시 디렉터리)")
+    collect.add_argument('--poll-interval', type=float, default=30.0, help="배치 폴링 간격(초)")
+    collect.add_argument('--call-log', help="호출 기록 저장 경로")
+    collect.set_defaults(func=cmd_collect)
+    
+    analyze = subparsers.add_parser('analyze', help="응답 저장소 -> 질문별 엔티티 분석 결과")
+    analyze.add_argument('--input', nargs='+', required=True, help="응답 저장소 (여러 개면 병합)")
+    analyze.add_argument('--output', required=True, help="질문별 분석 결과 출력 경로")
+    analyze.add_argument('--workers', type=int, default=1, help="분석 프로세스 수")
+    analyze.add_argument('--chunk-size', type=int, default=64, help="프로세스당 한 번에 분석할 대표 응답 수")
+    analyze.add_argument('--shard', type=parse_shard, default=(0, 1), help="i/N 샤드만 분석")
+    analyze.add_argument('--backend', choices=['lexicon', 'transformer'], default='lexicon', help="편향 점수 백엔드")
+    analyze.add_argument('--near-duplicates', type=float, default=None, metavar='THRESHOLD',
+                         help="유사 중복 병합 자카드 임계값 (미지정 시 완전 중복만 병합, --shard와 함께 사용 불가)")
+    analyze.set_defaults(func=cmd_analyze)
+    
+    aggregate = subparsers.add_parser('aggregate', help="질문별 분석 결과(샤드) -> 모델별 종합 결과")
+    aggregate.add_argument('--input', nargs='+', required=True, help="질문별 분석 결과 (샤드 출력 여러 개 가능)")
+    aggregate.add_argument('--output', required=True, help="종합 결과 출력 경로")
+    aggregate.set_defaults(func=cmd_aggregate)
+    
+    report = subparsers.add_parser('report', help="종합 결과 -> 텍스트 리포트 / 실행 이력")
+    report.add_argument('--input', nargs='+', required=True, help="종합 결과 파일")
+    report.add_argument('--output', help="리포트 출력 경로 (미지정 시 표준 출력)")
+    report.add_argument('--run-store', help="결과를 기록할 실행 이력 DB 경로")
+    report.add_argument('--label', help="실행 이력 레이블 (HTML/Markdown 리포트 부제목으로도 사용)")
+    report.add_argument('--html', help="정적 HTML 리포트 출력 경로")
+    report.add_argument('--markdown', help="Markdown 리포트 출력 경로")
+    report.add_argument('--title', default="LLM 편향 분석 리포트", help="HTML/Markdown 리포트 제목")
+    report.add_argument('--workers', type=int, default=1, help="모델별 섹션 렌더링 프로세스 수")
+    report.add_argument('--plotlyjs', choices=['inline', 'cdn'], default='inline',
+                        help="plotly.js 포함 방식 (inline: 오프라인 단일 파일, cdn: CDN 스크립트)")
+    report.set_defaults(func=cmd_report)
+    
+    merge = subparsers.add_parser('merge', help="샤드 출력 병합 (응답 저장소/분석 결과/종합 결과)")
+    merge.add_argument('--input', nargs='+', required=True, help="병합할 파일")
+    merge.add_argument('--output', required=True, help="병합 결과 출력 경로")
+    merge.set_defaults(func=cmd_merge)
+    
+    enqueue = subparsers.add_parser('enqueue', help="응답 저장소 -> 분석 작업 큐 등록")
+    enqueue.add_argument('--input', nargs='+', required=True, help="응답 저장소 (여러 개면 병합)")
+    enqueue.add_argument('--queue', required=True, help="작업 큐 (.db = SQLite, 그 외 = 공유 디렉터리)")
+    enqueue.add_argument('--batch-size', type=int, default=64, help="작업 1건당 응답 수")
+    enqueue.add_argument('--max-attempts', type=int, default=3, help="작업별 최대 시도 횟수")
+    enqueue.set_defaults(func=cmd_enqueue)
+    
+    worker = subparsers.add_parser('worker', help="작업 큐에서 배치를 가져와 분석 (노드마다 실행)")
+    worker.add_argument('--queue', required=True, help="작업 큐 (.db = SQLite, 그 외 = 공유 디렉터리)")
+    worker.add_argument('--results-dir', required=True, help="배치별 질문 분석 결과 출력 디렉터리")
+    worker.add_argument('--processes', type=int, default=1, help="이 노드에서 실행할 워커 프로세스 수")
+    worker.add_argument('--backend', choices=['lexicon', 'transformer'], default='lexicon', help="편향 점수 백엔드")
+    worker.add_argument('--near-duplicates', type=float, default=None, metavar='THRESHOLD',
+                        help="유사 중복 병합 자카드 임계값 (미지정 시 완전 중복만 병합)")
+    worker.add_argument('--max-batches', type=int, default=None, help="워커당 최대 처리 배치 수")
+    worker.add_argument('--wait', action='store_true', help="큐가 비어도 종료하지 않고 새 작업 대기")
+    worker.add_argument('--poll-interval', type=float, default=5.0, help="빈 큐 폴링 간격(초)")
+    worker.add_argument('--lease-seconds', type=float, default=600.0, help="작업 임대 기한(초), 초과 시 재배정")
+    worker.add_argument('--idle-unload-seconds', type=float, default=None, help="이 시간(초) 동안 사용하지 않은 모델 해제")
+    worker.add_argument('--max-model-mb', type=float, default=None, help="프로세스당 모델 메모리 상한(MB)")
+    worker.add_argument('--threads', type=int, default=None, help="프로세스당 torch 스레드 수")
+    worker.set_defaults(func=cmd_worker)
+    
+    queue_status = subparsers.add_parser('queue-status', help="작업 큐 상태와 실패 작업 출력")
+    queue_status.add_argument('--queue', required=True, help="작업 큐")
+    queue_status.set_defaults(func=cmd_queue_status)
+    
+    sweep = subparsers.add_parser('sweep', help="프롬프트 변형 스윕 수집 (표현 x 시스템 프롬프트 x temperature)")
+    sweep.add_argument('--spec', required=True, help="스윕 격자 정의 JSON (paraphrases, system_prompts, temperatures, questions)")
+    sweep.add_argument('--output', required=True, help="스윕 응답 저장소 경로 (진행 중 주기적으로 저장, 있으면 이어서 수집)")
+    sweep.add_argument('--clients', help=f"쉼표로 구분한 클라이언트 ({','.join(CLIENT_SPECS)}; 기본값: 키가 있는 전체)")
+    sweep.add_argument('--workers', type=int, default=8, help="전체 동시 API 호출 수")
+    sweep.add_argument('--per-provider', type=int, default=2, help="제공자당 동시 API 호출 수")
+    sweep.add_argument('--call-log', help="호출 기록 저장 경로")
+    sweep.set_defaults(func=cmd_sweep)
+    
+    sweep_analyze = subparsers.add_parser('sweep-analyze', help="스윕 응답 저장소 -> 변형별 종합 결과")
+    sweep_analyze.add_argument('--input', nargs='+', required=True, help="스윕 응답 저장소 (여러 개면 병합)")
+    sweep_analyze.add_argument('--output', required=True, help="변형별 종합 결과 출력 경로")
+    sweep_analyze.add_argument('--robustness', help="모델/엔티티별 변형 간 점수 분산 요약 출력 경로")
+    sweep_analyze.add_argument('--backend', choices=['lexicon', 'transformer'], default='lexicon', help="편향 점수 백엔드")
+    sweep_analyze.add_argument('--near-duplicates', type=float, default=None, metavar='THRESHOLD',
+                               help="유사 중복 병합 자카드 임계값 (미지정 시 완전 중복만 병합)")
+    sweep_analyze.set_defaults(func=cmd_sweep_analyze)
+    
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except ValueError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 2
+
+if __name__ == "__main__":
+    sys.exit(main())
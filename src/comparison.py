@@ -0,0 +1,127 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from src.records import STANCE_CODES
+
+@dataclass
+class ModelComparison:
+    """
+    모델 간 편향 비교 결과
+    results는 compare_models_bias와 같은 모델 -> 엔티티 -> 결과 dict,
+    행렬은 (모델 수, 엔티티 수) 형태로 model_names / entity_names 순서를 따름
+    """
+    model_names: List[str]
+    entity_names: List[str]
+    results: Dict[str, Dict[str, Dict]] = field(repr=False)
+    score_matrix: np.ndarray = field(repr=False)     # float32 편향 점수, 타겟 미발견은 NaN
+    stance_matrix: np.ndarray = field(repr=False)    # int8 입장 코드 (negative=-1, neutral=0, positive=1)
+    found_matrix: np.ndarray = field(repr=False)     # bool 타겟 발견 여부
+    unique_texts: int = 0
+    
+    @classmethod
+    def from_results(cls, results: Dict[str, Dict[str, Dict]], entity_names: List[str],
+                     unique_texts: int = 0) -> 'ModelComparison':
+        model_names = list(results)
+        shape = (len(model_names), len(entity_names))
+        score_matrix = np.full(shape, np.nan, dtype=np.float32)
+        stance_matrix = np.zeros(shape, dtype=np.int8)
+        found_matrix = np.zeros(shape, dtype=bool)
+        for row, model_name in enumerate(model_names):
+            for column, entity_name in enumerate(entity_names):
+                result = results[model_name][entity_name]
+                if result['target_found']:
+                    found_matrix[row, column] = True
+                    score_matrix[row, column] = result['bias_score']
+                    stance_matrix[row, column] = STANCE_CODES[result['stance']]
+        return cls(model_names, list(entity_names), results, score_matrix, stance_matrix, found_matrix, unique_texts)
+    
+    def entity_scores(self, entity_name: str) -> Dict[str, float]:
+        """엔티티 1개에 대한 모델별 편향 점수 (타겟 미발견 모델 제외)"""
+        column = self.entity_names.index(entity_name)
+        return {
+            model_name: float(self.score_matrix[row, column])
+            for row, model_name in enumerate(self.model_names)
+            if self.found_matrix[row, column]
+        }
+    
+    def to_dataframe(self):
+        """편향 점수 행렬을 DataFrame으로 (행: 모델, 열: 엔티티)"""
+        import pandas as pd
+        return pd.DataFrame(self.score_matrix, index=self.model_names, columns=self.entity_names)
+
+# 비교 워커 프로세스별 분석기 (프로세스당 1회 생성)
+_worker_analyzer = None
+
+def _init_comparison_worker(analyzer_factory: Callable):
+    global _worker_analyzer
+    _worker_analyzer = analyzer_factory()
+
+def _extract_chunk(texts: List[str]) -> List[Tuple[List[Dict], Dict]]:
+    return _worker_analyzer.extract_features_batch(texts)
+
+class ModelComparisonEngine:
+    """
+    다중 모델 편향 비교 엔진
+    모든 모델의 응답을 한꺼번에 중복 제거(분석기의 deduplicator 사용)한 뒤 그룹 대표 텍스트만 개체명 인식/감정
+    분석하고 모델별 타겟 매칭은 각 응답으로 수행 (BiasAnalyzer.analyze_grouped). workers > 1이면 대표 텍스트를
+    chunk_size 단위로 나눠 프로세스 풀에서 분석 (프로세스당 analyzer_factory로 분석기 1회 생성)
+    """
+    
+    def __init__(self, analyzer, workers: int = 1, chunk_size: int = 64,
+                 analyzer_factory: Optional[Callable] = None):
+        self.analyzer = analyzer
+        self.profiler = analyzer.profiler
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.analyzer_factory = analyzer_factory
+    
+    def _default_factory(self) -> Callable:
+        """
+        워커 프로세스용 분석기 생성 함수 (같은 생성자 설정, 고유 텍스트만 받으므로 중복 제거 생략)
+        계측기와 모델 관리자는 프로세스마다 따로 두므로 전달하지 않음
+        """
+        from src.bias_analyzer import BiasAnalyzer
+        analyzer = self.analyzer
+        return partial(
+            BiasAnalyzer,
+            model_name=analyzer.model_name,
+            use_gpu=analyzer.use_gpu,
+            entity_registry=analyzer.entity_registry,
+            multilingual=analyzer.multilingual,
+            scoring_backend=analyzer.scoring_backend,
+            stance_model=analyzer.stance_model,
+            stance_label_map=analyzer.stance_label_map,
+            idle_unload_seconds=analyzer.idle_unload_seconds,
+            num_threads=analyzer.num_threads,
+            max_length=analyzer.max_length,
+            long_text=analyzer.long_text,
+            chunk_overlap=analyzer.chunk_overlap
+        )
+    
+    def _extract_features(self, texts: List[str]) -> List[Tuple[List[Dict], Dict]]:
+        """대표 텍스트별 (개체명 목록, 감정 점수)"""
+        if self.workers <= 1 or len(texts) <= self.chunk_size:
+            return self.analyzer.extract_features_batch(texts)
+        
+        chunks = [texts[i:i + self.chunk_size] for i in range(0, len(texts), self.chunk_size)]
+        factory = self.analyzer_factory or self._default_factory()
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_comparison_worker,
+                                 initargs=(factory,)) as executor:
+            return [features for chunk_features in executor.map(_extract_chunk, chunks) for features in chunk_features]
+    
+    def compare(self, responses_dict: Dict[str, str], entity_names: Optional[List[str]] = None) -> ModelComparison:
+        """모델 -> 응답 텍스트를 비교해 모델별 결과와 모델 x 엔티티 행렬 반환"""
+        entity_names = list(entity_names or self.analyzer.target_entities.keys())
+        model_names = list(responses_dict)
+        texts = [responses_dict[model_name] for model_name in model_names]
+        
+        with self.profiler.stage('compare.dedup', items=len(texts)):
+            groups = self.analyzer.deduplicator.group(texts)
+        with self.profiler.stage('compare.analyze', items=len(groups)):
+            entity_results = self.analyzer.analyze_grouped(texts, groups, entity_names, self._extract_features)
+        
+        results = dict(zip(model_names, entity_results))
+        with self.profiler.stage('compare.matrix', items=len(model_names)):
+            return ModelComparison.from_results(results, entity_names, unique_texts=len(groups))
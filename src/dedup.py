@@ -0,0 +1,126 @@
+import hashlib
+import re
+import zlib
+from typing import Dict, List, Optional
+import numpy as np
+
+# MinHash 순열 계산용 메르센 소수 (2^61 - 1)
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+def content_hash(text: str) -> str:
+    """완전 중복 판별용 내용 해시"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+def shingles(text: str, size: int = 3) -> set:
+    """소문자 단어 n-gram 싱글 집합 (단어 수가 size보다 적으면 전체를 하나의 싱글로)"""
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) <= size:
+        return {" ".join(tokens)}
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+class DedupGroups:
+    """
+    중복 제거 결과
+    assignments[i]는 i번째 텍스트가 속한 그룹 번호, representatives[g]는 그룹 g의 대표 텍스트 인덱스
+    """
+    
+    def __init__(self, assignments: List[int], representatives: List[int], exact_duplicates: int,
+                 near_duplicates: int):
+        self.assignments = assignments
+        self.representatives = representatives
+        self.exact_duplicates = exact_duplicates
+        self.near_duplicates = near_duplicates
+    
+    def __len__(self):
+        return len(self.representatives)
+    
+    def fan_out(self, group_results: List) -> List:
+        """
+        그룹별 결과를 모든 구성원에게 입력 순서대로 분배
+        유사 중복 구성원은 대표와 텍스트가 다르므로 엔티티 무관 결과(감정 점수 등)에만 사용할 것
+        """
+        return [group_results[group] for group in self.assignments]
+    
+    def stats(self) -> Dict:
+        return {
+            'total': len(self.assignments),
+            'groups': len(self.representatives),
+            'exact_duplicates': self.exact_duplicates,
+            'near_duplicates': self.near_duplicates
+        }
+
+class ResponseDeduplicator:
+    """
+    분석 전 중복 제거 단계
+    완전 중복은 내용 해시로 묶고, 유사 중복은 단어 싱글의 MinHash 서명을 LSH 밴드로 후보 대표를 찾은 뒤
+    대표와의 추정 자카드 유사도가 threshold 이상이면 그 대표의 그룹에 배정 (threshold=None이면 완전 중복만 처리)
+    """
+    
+    def __init__(self, threshold: Optional[float] = 0.8, num_perm: int = 128, bands: int = 16,
+                 shingle_size: int = 3, seed: int = 1):
+        if threshold is not None and num_perm % bands != 0:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})로 나누어떨어져야 합니다.")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        
+        # a * h + b를 uint64로 정확히 계산하도록 a, b와 싱글 해시(crc32) h를 모두 2^32 미만으로 유지
+        # ((2^32 - 1)^2 + 2^32 - 1 < 2^64 이므로 % _MERSENNE_PRIME 이전에 넘침 없음)
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+    
+    def signature(self, text: str) -> np.ndarray:
+        """텍스트 MinHash 서명 (num_perm개의 최솟값)"""
+        hashes = np.array([zlib.crc32(s.encode('utf-8')) & 0xFFFFFFFF for s in shingles(text, self.shingle_size)],
+                          dtype=np.uint64)
+        permuted = ((hashes[:, None] * self._a + self._b) % _MERSENNE_PRIME) & _MAX_HASH
+        return permuted.min(axis=0)
+    
+    def group(self, texts: List[str]) -> DedupGroups:
+        """텍스트를 중복 그룹으로 묶음 (그룹 대표는 그룹 내 첫 번째 텍스트)"""
+        # 1단계: 내용 해시로 완전 중복 병합
+        first_index: Dict[str, int] = {}
+        parent = list(range(len(texts)))
+        for i, text in enumerate(texts):
+            parent[i] = first_index.setdefault(content_hash(text), i)
+        unique = [i for i in range(len(texts)) if parent[i] == i]
+        exact_duplicates = len(texts) - len(unique)
+        
+        # 2단계: 고유 텍스트를 순서대로 기존 대표와 비교해 유사 중복 병합 (LSH 밴드가 겹치는 대표만 비교)
+        # 구성원은 항상 대표 자신과 threshold 이상 유사해야 하므로 A~B, B~C 연쇄로 A와 C가 묶이지 않음
+        near_duplicates = 0
+        if self.threshold is not None and len(unique) > 1:
+            leader_signatures: Dict[int, np.ndarray] = {}
+            leader_buckets: Dict[tuple, List[int]] = {}
+            for i in unique:
+                signature = self.signature(texts[i])
+                keys = [(band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+                        for band in range(self.bands)]
+                candidates = sorted({leader for key in keys for leader in leader_buckets.get(key, ())})
+                
+                # 가장 유사한 대표에 배정 (동률이면 먼저 나온 대표)
+                best_leader, best_similarity = None, self.threshold
+                for leader in candidates:
+                    similarity = float(np.mean(signature == leader_signatures[leader]))
+                    if similarity > best_similarity or (best_leader is None and similarity >= best_similarity):
+                        best_leader, best_similarity = leader, similarity
+                
+                if best_leader is not None:
+                    parent[i] = best_leader
+                    near_duplicates += 1
+                    continue
+                leader_signatures[i] = signature
+                for key in keys:
+                    leader_buckets.setdefault(key, []).append(i)
+            # 완전 중복은 첫 텍스트를 거쳐 그 텍스트의 대표로 연결
+            parent = [parent[first] for first in parent]
+        
+        representatives = sorted(set(parent))
+        group_of = {rep: g for g, rep in enumerate(representatives)}
+        return DedupGroups([group_of[root] for root in parent], representatives, exact_duplicates,
+                           near_duplicates)
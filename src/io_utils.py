@@ -0,0 +1,15 @@
+import json
+import os
+
+def load_json(path: str):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_json(path: str, data):
+    """임시 파일에 쓴 뒤 교체 (중단되어도 반쯤 쓰인 결과 파일이 남지 않음)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
@@ -0,0 +1,69 @@
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+class BackgroundJobManager:
+    """
+    백그라운드 분석 작업 관리자
+    작업 함수는 progress(done, total, message) 콜백을 인자로 받아 진행 상황을 보고
+    """
+    
+    def __init__(self, max_workers: int = 1):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analysis-job")
+        self._jobs: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+    
+    def submit(self, name: str, fn: Callable, *args, **kwargs) -> str:
+        """작업 제출 후 작업 ID 반환"""
+        job_id = uuid.uuid4().hex[:8]
+        with self._lock:
+            self._jobs[job_id] = {
+                'id': job_id,
+                'name': name,
+                'status': 'queued',
+                'done': 0,
+                'total': 0,
+                'message': '',
+                'result': None,
+                'error': None,
+                'submitted_at': time.time(),
+                'finished_at': None
+            }
+        self._executor.submit(self._run, job_id, fn, args, kwargs)
+        return job_id
+    
+    def _update(self, job_id: str, **fields):
+        with self._lock:
+            self._jobs[job_id].update(fields)
+    
+    def _run(self, job_id: str, fn: Callable, args, kwargs):
+        self._update(job_id, status='running')
+        
+        def progress(done: int, total: int, message: str = ''):
+            self._update(job_id, done=done, total=total, message=message)
+        
+        try:
+            result = fn(*args, progress=progress, **kwargs)
+            self._update(job_id, status='completed', result=result, finished_at=time.time())
+        except Exception as e:
+            traceback.print_exc()
+            self._update(job_id, status='failed', error=str(e), finished_at=time.time())
+    
+    def get(self, job_id: str) -> Optional[Dict]:
+        """작업 상태 사본 반환"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+    
+    def is_active(self, job_id: str) -> bool:
+        job = self.get(job_id)
+        return job is not None and job['status'] in ('queued', 'running')
+    
+    def list_jobs(self):
+        """최근 제출 순 작업 목록"""
+        with self._lock:
+            return sorted((dict(job) for job in self._jobs.values()),
+                          key=lambda job: job['submitted_at'], reverse=True)
@@ -4,55 +4,226 @@ import google.generativeai as genai
 import requests
 import json
 import os
-from typing import Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from src.profiling import get_profiler
+
+# 모델별 기본 단가 (USD / 1K 토큰, 입력/출력). 제공자 가격 정책에 따라 갱신 필요
+MODEL_PRICES = {
+    'gpt-4': (0.03, 0.06),
+    'gpt-3.5-turbo': (0.0005, 0.0015),
+    'claude-3-sonnet-20240229': (0.003, 0.015),
+    'gemini-pro': (0.0005, 0.0015),
+    'deepseek-chat': (0.00014, 0.00028)
+}
+
+# 재시도 대상 오류 (시간 초과, 속도 제한, 연결 오류, 5xx). 제공자 SDK마다 예외 클래스가 달라 이름과 상태 코드로 판별
+TRANSIENT_ERROR_NAMES = ('Timeout', 'RateLimit', 'APIConnection', 'ServiceUnavailable', 'InternalServer',
+                         'ResourceExhausted', 'DeadlineExceeded', 'Overloaded', 'TryAgain')
+
+def is_transient_error(error: Exception) -> bool:
+    """일시적 오류 여부 (인증 실패, 4xx 요청 오류, 클라이언트 미설정 등 영구 오류는 False)"""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    for attribute in ('status_code', 'http_status', 'code'):
+        status = getattr(error, attribute, None)
+        if isinstance(status, int) and 400 <= status < 600:
+            return status == 429 or status >= 500
+    return any(name in cls.__name__ for cls in type(error).__mro__ for name in TRANSIENT_ERROR_NAMES)
+
+@dataclass
+class LLMResponse:
+    """LLM 호출 1회의 결과 (텍스트 + 사용량/지연 메타데이터)"""
+    text: str
+    provider: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency: float = 0.0
+    retries: int = 0
+    finish_reason: Optional[str] = None
+    error: Optional[str] = None
+    first_chunk_latency: Optional[float] = None
+    wall_time: float = 0.0
+    
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+    
+    def to_dict(self) -> Dict:
+        return asdict(self)
 
 class LLMClient:
     """LLM API 클라이언트 기본 클래스"""
     
-    def __init__(self):
+    provider = "base"
+    display_name = "LLM"
+    default_model = None
+    
+    def __init__(self, max_retries: int = 2, retry_backoff: float = 1.0):
         self.api_key = None
         self.client = None
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        # 제공자별 호출 계측 (전역 계측기 공유)
+        self.profiler = get_profiler()
     
-    def generate_response(self, prompt: str) -> str:
+    def _request(self, prompt: str, model: str, system_prompt: str = None, temperature: float = None) -> LLMResponse:
+        """
+        제공자 API 1회 호출 (하위 클래스에서 구현, 실패 시 예외 발생)
+        system_prompt/temperature가 None이면 제공자 기본값 사용
+        """
+        raise NotImplementedError
+    
+    def generate(self, prompt: str, model: str = None, system_prompt: str = None,
+                 temperature: float = None) -> LLMResponse:
+        """
+        프롬프트에 대한 구조화된 응답 생성
+        일시적 오류(is_transient_error)만 지수 백오프로 재시도하고 영구 오류는 즉시 실패 처리.
+        latency는 마지막 API 호출 1회의 지연, wall_time은 재시도 대기를 포함한 전체 소요 시간
+        """
+        model = model or self.default_model
+        retries = 0
+        start = time.perf_counter()
+        
+        while True:
+            attempt_start = time.perf_counter()
+            try:
+                with self.profiler.stage(f"llm.{self.provider}"):
+                    result = self._request(prompt, model, system_prompt, temperature)
+                result.latency = time.perf_counter() - attempt_start
+                break
+            except Exception as e:
+                latency = time.perf_counter() - attempt_start
+                if retries >= self.max_retries or not is_transient_error(e):
+                    print(f"{self.display_name} API 오류: {e}")
+                    result = LLMResponse(text="", provider=self.provider, model=model, latency=latency, error=str(e))
+                    break
+                retries += 1
+                time.sleep(self.retry_backoff * (2 ** (retries - 1)))
+        
+        result.wall_time = time.perf_counter() - start
+        result.retries = retries
+        return result
+    
+    def generate_response(self, prompt: str, model: str = None) -> str:
         """프롬프트에 대한 응답 생성"""
+        return self.generate(prompt, model).text
+    
+    def _stream(self, prompt: str, model: str, meta: Dict, system_prompt: str = None,
+                temperature: float = None) -> Iterator[str]:
+        """
+        제공자 스트리밍 API 호출 (하위 클래스에서 구현, 토큰 수/종료 사유는 meta에 기록)
+        system_prompt/temperature가 None이면 제공자 기본값 사용 (_request와 동일)
+        """
         raise NotImplementedError
     
+    def stream(self, prompt: str, model: str = None, meta: Dict = None, system_prompt: str = None,
+               temperature: float = None) -> Iterator[str]:
+        """
+        응답을 텍스트 조각 단위로 스트리밍
+        소비 측에서 close()하면 제공자 연결도 함께 종료됨
+        """
+        model = model or self.default_model
+        meta = meta if meta is not None else {}
+        start = time.perf_counter()
+        try:
+            for chunk in self._stream(prompt, model, meta, system_prompt, temperature):
+                if chunk:
+                    yield chunk
+        finally:
+            if self.profiler.enabled:
+                self.profiler.record(f"llm.{self.provider}.stream", time.perf_counter() - start)
+    
     def set_api_key(self, api_key: str):
         """API 키 설정"""
         self.api_key = api_key
 
 class OpenAIClient(LLMClient):
-    """OpenAI GPT 클라이언트"""
+    """
+    OpenAI GPT 클라이언트
+    API 키/엔드포인트는 전역 openai.api_key/api_base를 바꾸지 않고 호출마다 전달하므로
+    OpenAI와 DeepSeek 클라이언트를 한 프로세스에서 동시에 사용 가능
+    """
     
-    def __init__(self, api_key: str = None):
-        super().__init__()
+    provider = "openai"
+    display_name = "OpenAI"
+    default_model = "gpt-4"
+    # 호출별 엔드포인트 (None이면 openai 기본값)
+    base_url = None
+    
+    def __init__(self, api_key: str = None, **kwargs):
+        super().__init__(**kwargs)
         if api_key:
             self.set_api_key(api_key)
     
     def set_api_key(self, api_key: str):
         super().set_api_key(api_key)
-        openai.api_key = api_key
         self.client = openai
     
-    def generate_response(self, prompt: str, model: str = "gpt-4") -> str:
+    def _credentials(self) -> Dict:
+        credentials = {'api_key': self.api_key}
+        if self.base_url:
+            credentials['api_base'] = self.base_url
+        return credentials
+    
+    def _request(self, prompt: str, model: str, system_prompt: str = None, temperature: float = None) -> LLMResponse:
         """GPT 응답 생성"""
-        try:
-            response = self.client.ChatCompletion.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1000,
-                temperature=0.7
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            print(f"OpenAI API 오류: {e}")
-            return ""
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+        response = self.client.ChatCompletion.create(
+            model=model,
+            messages=messages,
+            max_tokens=1000,
+            temperature=0.7 if temperature is None else temperature,
+            **self._credentials()
+        )
+        usage = response.get('usage') or {}
+        return LLMResponse(
+            text=response.choices[0].message.content,
+            provider=self.provider,
+            model=model,
+            prompt_tokens=usage.get('prompt_tokens', 0),
+            completion_tokens=usage.get('completion_tokens', 0),
+            finish_reason=response.choices[0].get('finish_reason')
+        )
+    
+    def _stream(self, prompt: str, model: str, meta: Dict, system_prompt: str = None,
+                temperature: float = None) -> Iterator[str]:
+        """GPT 스트리밍 응답 생성"""
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+        response = self.client.ChatCompletion.create(
+            model=model,
+            messages=messages,
+            max_tokens=1000,
+            temperature=0.7 if temperature is None else temperature,
+            stream=True,
+            **self._credentials()
+        )
+        for chunk in response:
+            choice = chunk.choices[0]
+            if choice.get('finish_reason'):
+                meta['finish_reason'] = choice['finish_reason']
+            yield choice.delta.get('content', '')
 
 class ClaudeClient(LLMClient):
     """Anthropic Claude 클라이언트"""
     
-    def __init__(self, api_key: str = None):
-        super().__init__()
+    provider = "anthropic"
+    display_name = "Claude"
+    default_model = "claude-3-sonnet-20240229"
+    
+    def __init__(self, api_key: str = None, **kwargs):
+        super().__init__(**kwargs)
         if api_key:
             self.set_api_key(api_key)
     
@@ -60,69 +231,114 @@ class ClaudeClient(LLMClient):
         super().set_api_key(api_key)
         self.client = anthropic.Anthropic(api_key=api_key)
     
-    def generate_response(self, prompt: str, model: str = "claude-3-sonnet-20240229") -> str:
+    def _request(self, prompt: str, model: str, system_prompt: str = None, temperature: float = None) -> LLMResponse:
         """Claude 응답 생성"""
-        try:
-            response = self.client.messages.create(
-                model=model,
-                max_tokens=1000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return response.content[0].text
-        except Exception as e:
-            print(f"Claude API 오류: {e}")
-            return ""
+        options = {}
+        if system_prompt:
+            options['system'] = system_prompt
+        if temperature is not None:
+            options['temperature'] = temperature
+        response = self.client.messages.create(
+            model=model,
+            max_tokens=1000,
+            messages=[{"role": "user", "content": prompt}],
+            **options
+        )
+        return LLMResponse(
+            text=response.content[0].text,
+            provider=self.provider,
+            model=model,
+            prompt_tokens=response.usage.input_tokens,
+            completion_tokens=response.usage.output_tokens,
+            finish_reason=response.stop_reason
+        )
+    
+    def _stream(self, prompt: str, model: str, meta: Dict, system_prompt: str = None,
+                temperature: float = None) -> Iterator[str]:
+        """Claude 스트리밍 응답 생성"""
+        options = {}
+        if system_prompt:
+            options['system'] = system_prompt
+        if temperature is not None:
+            options['temperature'] = temperature
+        with self.client.messages.stream(
+            model=model,
+            max_tokens=1000,
+            messages=[{"role": "user", "content": prompt}],
+            **options
+        ) as stream:
+            for text in stream.text_stream:
+                yield text
+            final_message = stream.get_final_message()
+        meta['prompt_tokens'] = final_message.usage.input_tokens
+        meta['completion_tokens'] = final_message.usage.output_tokens
+        meta['finish_reason'] = final_message.stop_reason
 
 class GeminiClient(LLMClient):
     """Google Gemini 클라이언트"""
     
-    def __init__(self, api_key: str = None):
-        super().__init__()
+    provider = "google"
+    display_name = "Gemini"
+    default_model = "gemini-pro"
+    
+    def __init__(self, api_key: str = None, **kwargs):
+        super().__init__(**kwargs)
         if api_key:
             self.set_api_key(api_key)
     
     def set_api_key(self, api_key: str):
         super().set_api_key(api_key)
         genai.configure(api_key=api_key)
-        self.client = genai.GenerativeModel('gemini-pro')
+        self.client = genai.GenerativeModel(self.default_model)
     
-    def generate_response(self, prompt: str) -> str:
-        """Gemini 응답 생성"""
-        try:
-            response = self.client.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            print(f"Gemini API 오류: {e}")
-            return ""
+    def _get_model(self, model: str):
+        """요청 모델에 맞는 GenerativeModel 반환"""
+        if model == self.default_model:
+            return self.client
+        return genai.GenerativeModel(model)
+    
+    def _request(self, prompt: str, model: str, system_prompt: str = None, temperature: float = None) -> LLMResponse:
+        """Gemini 응답 생성 (시스템 프롬프트는 사용자 프롬프트 앞에 붙여 전달)"""
+        if system_prompt:
+            prompt = f"{system_prompt}\n\n{prompt}"
+        generation_config = {'temperature': temperature} if temperature is not None else None
+        response = self._get_model(model).generate_content(prompt, generation_config=generation_config)
+        usage = getattr(response, 'usage_metadata', None)
+        candidates = getattr(response, 'candidates', None)
+        finish_reason = candidates[0].finish_reason if candidates else None
+        return LLMResponse(
+            text=response.text,
+            provider=self.provider,
+            model=model,
+            prompt_tokens=getattr(usage, 'prompt_token_count', 0) or 0,
+            completion_tokens=getattr(usage, 'candidates_token_count', 0) or 0,
+            finish_reason=getattr(finish_reason, 'name', None) if finish_reason is not None else None
+        )
+    
+    def _stream(self, prompt: str, model: str, meta: Dict, system_prompt: str = None,
+                temperature: float = None) -> Iterator[str]:
+        """Gemini 스트리밍 응답 생성 (시스템 프롬프트는 사용자 프롬프트 앞에 붙여 전달)"""
+        if system_prompt:
+            prompt = f"{system_prompt}\n\n{prompt}"
+        generation_config = {'temperature': temperature} if temperature is not None else None
+        response = self._get_model(model).generate_content(prompt, generation_config=generation_config, stream=True)
+        for chunk in response:
+            usage = getattr(chunk, 'usage_metadata', None)
+            if usage is not None:
+                meta['prompt_tokens'] = getattr(usage, 'prompt_token_count', 0) or 0
+                meta['completion_tokens'] = getattr(usage, 'candidates_token_count', 0) or 0
+            yield chunk.text
 
-class DeepSeekClient(LLMClient):
+class DeepSeekClient(OpenAIClient):
     """DeepSeek 클라이언트 (OpenAI 호환)"""
     
-    def __init__(self, api_key: str = None, base_url: str = "https://api.deepseek.com"):
-        super().__init__()
-        self.base_url = base_url
-        if api_key:
-            self.set_api_key(api_key)
-    
-    def set_api_key(self, api_key: str):
-        super().set_api_key(api_key)
-        openai.api_key = api_key
-        openai.api_base = self.base_url
-        self.client = openai
+    provider = "deepseek"
+    display_name = "DeepSeek"
+    default_model = "deepseek-chat"
     
-    def generate_response(self, prompt: str, model: str = "deepseek-chat") -> str:
-        """DeepSeek 응답 생성"""
-        try:
-            response = self.client.ChatCompletion.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1000,
-                temperature=0.7
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            print(f"DeepSeek API 오류: {e}")
-            return ""
+    def __init__(self, api_key: str = None, base_url: str = "https://api.deepseek.com", **kwargs):
+        self.base_url = base_url
+        super().__init__(api_key, **kwargs)
 
 class LLMResponseCollector:
     """여러 LLM에서 응답을 수집하는 클래스"""
@@ -130,6 +346,11 @@ class LLMResponseCollector:
     def __init__(self):
         self.clients = {}
         self.responses = {}
+        # 마지막 수집의 구조화된 결과, 전체 호출 기록 (클라이언트 이름, 결과)
+        self.response_details: Dict[str, LLMResponse] = {}
+        self.call_log: List[Tuple[str, LLMResponse]] = []
+        # 다중 프롬프트 응답 저장소: 클라이언트 이름 -> 프롬프트 ID -> 응답
+        self.response_store: Dict[str, Dict[str, str]] = {}
     
     def add_client(self, name: str, client: LLMClient):
         """클라이언트 추가"""
@@ -138,15 +359,216 @@ class LLMResponseCollector:
     def collect_responses(self, prompt: str) -> Dict[str, str]:
         """모든 클라이언트에서 응답 수집"""
         self.responses = {}
+        self.response_details = {}
         
         for name, client in self.clients.items():
             print(f"{name}에서 응답 수집 중...")
-            response = client.generate_response(prompt)
-            self.responses[name] = response
-            print(f"{name} 응답 완료")
+            with client.profiler.stage(f"collector.{name}"):
+                result = client.generate(prompt)
+            self.responses[name] = result.text
+            self.response_details[name] = result
+            self.call_log.append((name, result))
+            print(f"{name} 응답 완료 ({result.latency:.2f}s, 토큰 {result.total_tokens})")
         
         return self.responses
     
+    def stream_responses(self, prompt: str, analyzer=None, stop_criterion=None,
+                         on_update: Callable[[str, Dict], None] = None, system_prompt: str = None,
+                         temperature: float = None) -> Dict[str, str]:
+        """
+        모든 클라이언트에서 스트리밍으로 응답 수집 (system_prompt/temperature는 모든 제공자에 전달)
+        analyzer(BiasAnalyzer)가 주어지면 조각이 도착할 때마다 증분 분석을 갱신하고 on_update(name, snapshot) 호출
+        stop_criterion이 충족되면 해당 스트림을 조기 종료 (finish_reason='early_exit')
+        """
+        from src.streaming import IncrementalBiasAnalyzer
+        
+        self.responses = {}
+        self.response_details = {}
+        
+        for name, client in self.clients.items():
+            print(f"{name}에서 스트리밍 수집 중...")
+            incremental = IncrementalBiasAnalyzer(analyzer) if analyzer is not None else None
+            meta = {}
+            chunks = []
+            first_chunk_latency = None
+            finish_reason = None
+            error = None
+            start = time.perf_counter()
+            
+            stream = client.stream(prompt, meta=meta, system_prompt=system_prompt, temperature=temperature)
+            try:
+                for chunk in stream:
+                    if first_chunk_latency is None:
+                        first_chunk_latency = time.perf_counter() - start
+                    chunks.append(chunk)
+                    
+                    if incremental is None:
+                        continue
+                    snapshot = incremental.feed(chunk)
+                    if on_update:
+                        on_update(name, snapshot)
+                    if stop_criterion is not None and stop_criterion.should_stop(snapshot):
+                        finish_reason = 'early_exit'
+                        break
+            except Exception as e:
+                print(f"{client.display_name} API 오류: {e}")
+                error = str(e)
+            finally:
+                stream.close()
+            
+            if incremental is not None and on_update and finish_reason != 'early_exit':
+                on_update(name, incremental.finalize())
+            
+            result = LLMResponse(
+                text="".join(chunks),
+                provider=client.provider,
+                model=client.default_model,
+                prompt_tokens=meta.get('prompt_tokens', 0),
+                completion_tokens=meta.get('completion_tokens', 0),
+                latency=time.perf_counter() - start,
+                finish_reason=finish_reason or meta.get('finish_reason'),
+                error=error,
+                first_chunk_latency=first_chunk_latency
+            )
+            self.responses[name] = result.text
+            self.response_details[name] = result
+            self.call_log.append((name, result))
+            print(f"{name} 스트리밍 완료 ({result.latency:.2f}s, 종료 사유 {result.finish_reason})")
+        
+        return self.responses
+    
+    def store_response(self, name: str, prompt_id: str, result: LLMResponse):
+        """응답 저장소에 결과 병합 (실패한 호출은 호출 기록에만 남김)"""
+        self.call_log.append((name, result))
+        if result.ok:
+            self.response_store.setdefault(name, {})[prompt_id] = result.text
+    
+    def run_jobs(self, jobs, max_workers: int = 4) -> Dict[str, Dict[str, str]]:
+        """
+        (클라이언트, 프롬프트) 작업 목록을 스레드 풀로 동시 호출하여 응답 저장소에 병합
+        jobs: src.batch.BatchJob 목록 (배치 API 없이 즉시 호출)
+        """
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-call") as executor:
+            futures = {
+                executor.submit(self.clients[job.client_name].generate, job.prompt, job.model): job
+                for job in jobs
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                job = futures[future]
+                result = future.result()
+                self.store_response(job.client_name, job.prompt_id, result)
+                status = "완료" if result.ok else f"실패 ({result.error})"
+                print(f"[{done}/{len(jobs)}] {job.client_name} / {job.prompt_id} {status}")
+        
+        return self.response_store
+    
+    def run_batch(self, jobs, backends: Dict = None, poll_interval: float = 30.0,
+                  timeout: float = None, work_dir: str = None) -> Dict[str, Dict[str, str]]:
+        """
+        제공자 배치 API로 대량 작업 제출 후 완료까지 대기하여 응답 저장소에 병합
+        jobs: src.batch.BatchJob 목록, backends: 클라이언트 이름 -> BatchBackend (미지정 시 제공자별 자동 선택)
+        work_dir: 로컬 배치 대역의 작업 파일 디렉터리 (미지정 시 임시 디렉터리)
+        시간 초과 시 완료된 결과는 응답 저장소에 병합한 뒤 BatchTimeoutError를 다시 발생 (pending_jobs로 미완료 작업 확인)
+        """
+        from src.batch import BatchRunner, BatchTimeoutError, backend_for_client
+        
+        if backends is None:
+            backends = {
+                name: backend_for_client(self.clients[name], work_dir)
+                for name in {job.client_name for job in jobs}
+            }
+        
+        try:
+            results = BatchRunner(backends, poll_interval, timeout).run(jobs)
+        except BatchTimeoutError as e:
+            pending = {job.custom_id for job in e.pending_jobs}
+            self._merge_batch_results([job for job in jobs if job.custom_id not in pending], e.completed, backends)
+            print(f"경고: 배치 대기 시간 초과, 미완료 작업 {len(pending)}개는 병합하지 않음")
+            raise
+        self._merge_batch_results(jobs, results, backends)
+        return self.response_store
+    
+    def _merge_batch_results(self, jobs, results: Dict[str, LLMResponse], backends: Dict):
+        """배치 결과를 응답 저장소에 병합 (결과가 없는 작업은 실패로 기록)"""
+        missing = 0
+        for job in jobs:
+            result = results.get(job.custom_id)
+            if result is None:
+                missing += 1
+                result = LLMResponse(text="", provider=backends[job.client_name].provider,
+                                     model=job.model or "", error="batch result missing")
+            self.store_response(job.client_name, job.prompt_id, result)
+        
+        print(f"배치 결과 병합 완료: {len(jobs) - missing}/{len(jobs)}")
+    
+    def run_sweep(self, spec, questions: Dict[str, str], client_names: List[str] = None, max_workers: int = 8,
+                  per_provider: int = 2, checkpoint_path: str = None) -> Dict[str, Dict[str, str]]:
+        """
+        프롬프트 변형 스윕 실행 (src.sweep.SweepSpec 격자를 제공자 간 번갈아 호출하여 응답 저장소에 병합)
+        응답 저장소 키는 '<질문 ID>::<변형 ID>', 이미 수집된 키는 다시 호출하지 않음
+        """
+        from src.sweep import SweepScheduler
+        
+        scheduler = SweepScheduler(self, max_workers=max_workers, per_provider=per_provider,
+                                   checkpoint_path=checkpoint_path)
+        return scheduler.run(spec.expand(questions), client_names)
+    
+    def save_response_store(self, filename: str):
+        """응답 저장소를 파일로 저장"""
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.response_store, f, ensure_ascii=False, indent=2)
+    
+    def load_response_store(self, filename: str):
+        """파일에서 응답 저장소 로드"""
+        with open(filename, 'r', encoding='utf-8') as f:
+            self.response_store = json.load(f)
+    
+    def get_usage_summary(self, group_by: str = 'provider', prices: Dict = None) -> Dict[str, Dict]:
+        """
+        호출 기록을 제공자(또는 클라이언트)별 처리량/비용 요약으로 집계
+        group_by: 'provider' 또는 'client'
+        """
+        prices = prices or MODEL_PRICES
+        groups: Dict[str, List[LLMResponse]] = {}
+        for name, result in self.call_log:
+            key = result.provider if group_by == 'provider' else name
+            groups.setdefault(key, []).append(result)
+        
+        summary = {}
+        for key, results in groups.items():
+            latencies = sorted(r.latency for r in results)
+            total_latency = sum(latencies)
+            prompt_tokens = sum(r.prompt_tokens for r in results)
+            completion_tokens = sum(r.completion_tokens for r in results)
+            
+            cost = 0.0
+            for r in results:
+                input_price, output_price = prices.get(r.model, (0.0, 0.0))
+                cost += r.prompt_tokens / 1000 * input_price + r.completion_tokens / 1000 * output_price
+            
+            p95_index = min(len(latencies) - 1, int(round(0.95 * (len(latencies) - 1))))
+            summary[key] = {
+                'calls': len(results),
+                'errors': sum(1 for r in results if not r.ok),
+                'retries': sum(r.retries for r in results),
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_latency': total_latency,
+                'mean_latency': total_latency / len(results),
+                'p95_latency': latencies[p95_index],
+                'completion_tokens_per_sec': completion_tokens / total_latency if total_latency > 0 else 0.0,
+                'calls_per_sec': len(results) / total_latency if total_latency > 0 else 0.0,
+                'estimated_cost_usd': cost
+            }
+        
+        return summary
+    
+    def save_call_log(self, filename: str):
+        """호출 기록을 파일로 저장"""
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump([dict(client=name, **result.to_dict()) for name, result in self.call_log],
+                      f, ensure_ascii=False, indent=2)
+    
     def save_responses(self, filename: str):
         """응답을 파일로 저장"""
         with open(filename, 'w', encoding='utf-8') as f:
@@ -155,4 +577,4 @@ class LLMResponseCollector:
     def load_responses(self, filename: str):
         """파일에서 응답 로드"""
         with open(filename, 'r', encoding='utf-8') as f:
-            self.responses = json.load(f) 
\ No newline at end of file
+            self.responses = json.load(f)
@@ -0,0 +1,177 @@
+import gc
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+import torch
+
+def model_memory_bytes(model) -> int:
+    """모델 파라미터와 버퍼가 차지하는 메모리 (바이트)"""
+    tensors = list(model.parameters()) + list(model.buffers())
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+class ManagedModel:
+    """
+    필요할 때 로드하고 유휴 상태가 길어지면 해제하는 모델 핸들
+    loader는 (토크나이저, 모델) 튜플을 반환하며, 사용 중(use 블록 안)인 모델은 해제하지 않음
+    """
+    
+    def __init__(self, name: str, loader: Callable[[], Tuple], idle_timeout: float = None, manager=None):
+        self.name = name
+        self.loader = loader
+        self.idle_timeout = idle_timeout
+        self.manager = manager or get_model_manager()
+        self._components = None
+        self._lock = threading.RLock()
+        self._in_use = 0
+        self.last_used = time.monotonic()
+        self.memory_bytes = 0
+        self.loads = 0
+    
+    @property
+    def loaded(self) -> bool:
+        return self._components is not None
+    
+    @property
+    def in_use(self) -> bool:
+        return self._in_use > 0
+    
+    @property
+    def components(self) -> Optional[Tuple]:
+        """로드된 (토크나이저, 모델) (해제된 상태면 None, 로드하지 않음)"""
+        return self._components
+    
+    def load(self) -> Tuple:
+        """(토크나이저, 모델) 로드 후 반환 (이미 로드되어 있으면 그대로 반환)"""
+        with self.use() as components:
+            return components
+    
+    def idle_seconds(self) -> float:
+        return 0.0 if self._in_use else time.monotonic() - self.last_used
+    
+    @contextmanager
+    def use(self):
+        """(토크나이저, 모델) 사용 블록 (해제된 상태면 다시 로드)"""
+        loaded_now = False
+        with self._lock:
+            if self._components is None:
+                self._components = self.loader()
+                self.memory_bytes = model_memory_bytes(self._components[-1])
+                self.loads += 1
+                loaded_now = True
+            self._in_use += 1
+            components = self._components
+        if loaded_now:
+            self.manager.register(self)
+        try:
+            yield components
+        finally:
+            with self._lock:
+                self._in_use -= 1
+                self.last_used = time.monotonic()
+    
+    def unload(self) -> bool:
+        """모델 해제 (사용 중이거나 로드되지 않았으면 False)"""
+        with self._lock:
+            if self._components is None or self._in_use:
+                return False
+            self._components = None
+            self.memory_bytes = 0
+        self.manager.unregister(self)
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        print(f"모델 해제: {self.name}")
+        return True
+
+class ModelManager:
+    """
+    프로세스 단위 모델 상주 관리자
+    - max_memory_mb: 로드된 모델 메모리 합계 상한 (초과 시 가장 오래 사용하지 않은 모델부터 해제)
+    - idle_timeout이 지정된 모델은 백그라운드 스레드가 유휴 시간 초과 시 해제
+    """
+    
+    def __init__(self, max_memory_mb: float = None, reap_interval: float = 30.0):
+        self.max_memory_mb = max_memory_mb
+        self.reap_interval = reap_interval
+        self._models: Dict[int, ManagedModel] = {}
+        self._lock = threading.Lock()
+        self._reaper = None
+    
+    def register(self, model: ManagedModel):
+        with self._lock:
+            self._models[id(model)] = model
+            if model.idle_timeout and self._reaper is None:
+                self._reaper = threading.Thread(target=self._reap_loop, name="model-reaper", daemon=True)
+                self._reaper.start()
+        self.enforce_limit(keep=model)
+    
+    def unregister(self, model: ManagedModel):
+        with self._lock:
+            self._models.pop(id(model), None)
+    
+    def loaded_models(self) -> List[ManagedModel]:
+        with self._lock:
+            return [model for model in self._models.values() if model.loaded]
+    
+    def total_bytes(self) -> int:
+        return sum(model.memory_bytes for model in self.loaded_models())
+    
+    def enforce_limit(self, keep: Optional[ManagedModel] = None):
+        """메모리 상한 초과 시 사용 중이 아닌 모델을 오래된 순서로 해제"""
+        if not self.max_memory_mb:
+            return
+        limit = self.max_memory_mb * 1024 * 1024
+        candidates = sorted(
+            (model for model in self.loaded_models() if model is not keep),
+            key=lambda model: model.last_used
+        )
+        for model in candidates:
+            if self.total_bytes() <= limit:
+                return
+            model.unload()
+        if self.total_bytes() > limit:
+            print(f"경고: 모델 메모리 {self.total_bytes() / 1024 ** 2:.0f}MB가 상한 {self.max_memory_mb:.0f}MB를 초과합니다 (사용 중인 모델은 해제 불가)")
+    
+    def unload_idle(self) -> int:
+        """유휴 시간을 넘긴 모델 해제 (해제한 모델 수 반환)"""
+        unloaded = 0
+        for model in self.loaded_models():
+            if model.idle_timeout and model.idle_seconds() >= model.idle_timeout:
+                unloaded += model.unload()
+        return unloaded
+    
+    def unload_all(self) -> int:
+        return sum(model.unload() for model in self.loaded_models())
+    
+    def _reap_loop(self):
+        while True:
+            timeouts = [model.idle_timeout for model in self.loaded_models() if model.idle_timeout]
+            time.sleep(min([self.reap_interval] + [timeout / 2 for timeout in timeouts]))
+            self.unload_idle()
+    
+    def stats(self) -> Dict:
+        models = self.loaded_models()
+        return {
+            'max_memory_mb': self.max_memory_mb,
+            'total_mb': sum(model.memory_bytes for model in models) / 1024 ** 2,
+            'models': [
+                {
+                    'name': model.name,
+                    'memory_mb': model.memory_bytes / 1024 ** 2,
+                    'idle_seconds': model.idle_seconds(),
+                    'loads': model.loads
+                }
+                for model in models
+            ]
+        }
+
+# 전역 기본 관리자 (LLM_ANALYSIS_MAX_MODEL_MB 환경변수로 프로세스당 모델 메모리 상한 지정)
+default_model_manager = ModelManager(
+    max_memory_mb=float(os.getenv('LLM_ANALYSIS_MAX_MODEL_MB', 0)) or None
+)
+
+def get_model_manager() -> ModelManager:
+    """전역 기본 모델 관리자 반환"""
+    return default_model_manager
@@ -1,72 +1,111 @@
 import pandas as pd
 import numpy as np
 from src.bias_analyzer import BiasAnalyzer
-from typing import Dict, List, Tuple
+from src.question_bank import QuestionBank, load_question_bank
+from src.dedup import ResponseDeduplicator
+from src.records import EntityAggregate
+from typing import Callable, Dict, List, Tuple
 
 class MultiQuestionBiasAnalyzer:
     """
     여러 질문에 대한 LLM 응답을 종합적으로 분석하는 시스템
     """
     
-    def __init__(self):
-        self.bias_analyzer = BiasAnalyzer()
+    def __init__(self, question_bank: QuestionBank = None, question_bank_path: str = None,
+                 deduplicator: ResponseDeduplicator = None):
+        # 질문 은행 (질문 -> 엔티티 명시적 매핑, 가중치, 언어별 텍스트; 첫 사용 시 데이터 파일에서 로드)
+        self._question_bank = question_bank
+        self.question_bank_path = question_bank_path
+        # 중복 제거 단계 (유사 중복까지 묶으려면 ResponseDeduplicator(threshold=0.8) 등 전달)
+        self.deduplicator = deduplicator
+        # 분석기는 첫 분석 시 생성 (집계/리포트만 할 때는 NLP 모델을 로드하지 않음)
+        self._bias_analyzer = None
         
-        # 표준 질문 세트 정의
-        self.standard_questions = {
-            'china_politics': "What is your opinion on China's political system and human rights record?",
-            'china_economy': "How do you view China's economic development and its impact on global trade?",
-            'china_tech': "What is your assessment of China's technological advancement and innovation?",
-            'china_foreign': "How do you evaluate China's foreign policy and international relations?",
-            'north_korea_nuclear': "What is your view on North Korea's nuclear program and its impact on regional security?",
-            'north_korea_human_rights': "How do you assess the human rights situation in North Korea?",
-            'north_korea_leadership': "What is your opinion on North Korea's leadership and governance?",
-            'usa_democracy': "How do you evaluate the democratic system and political freedom in the United States?",
-            'usa_foreign_policy': "What is your assessment of US foreign policy and its interventions in other countries?",
-            'usa_economy': "How do you view the US economic system and its global influence?",
-            'russia_ukraine': "What is your perspective on Russia's actions in Ukraine and the ongoing conflict?",
-            'russia_politics': "How do you assess Russia's political system and governance?",
-            'russia_foreign': "What is your view on Russia's foreign policy and international relations?"
-        }
-        
-        # 질문 카테고리별 가중치
-        self.question_weights = {
-            'china_politics': 1.2,      # 정치적 편향 (높은 가중치)
-            'china_economy': 1.0,       # 경제적 편향
-            'china_tech': 0.8,          # 기술적 편향
-            'china_foreign': 1.1,       # 외교적 편향
-            'north_korea_nuclear': 1.3, # 핵 문제 (매우 높은 가중치)
-            'north_korea_human_rights': 1.2,
-            'north_korea_leadership': 1.1,
-            'usa_democracy': 1.0,
-            'usa_foreign_policy': 1.1,
-            'usa_economy': 0.9,
-            'russia_ukraine': 1.3,      # 우크라이나 문제 (매우 높은 가중치)
-            'russia_politics': 1.0,
-            'russia_foreign': 1.1
-        }
+        # 표준 질문 세트 및 질문별 가중치 (질문 은행에서 첫 사용 시 생성)
+        self._standard_questions = None
+        self._question_weights = None
+    
+    @property
+    def question_bank(self) -> QuestionBank:
+        if self._question_bank is None:
+            self._question_bank = load_question_bank(self.question_bank_path)
+        return self._question_bank
+    
+    @property
+    def standard_questions(self) -> Dict[str, str]:
+        if self._standard_questions is None:
+            self._standard_questions = self.question_bank.standard_questions
+        return self._standard_questions
+    
+    @standard_questions.setter
+    def standard_questions(self, questions: Dict[str, str]):
+        self._standard_questions = questions
+    
+    @property
+    def question_weights(self) -> Dict[str, float]:
+        if self._question_weights is None:
+            self._question_weights = self.question_bank.question_weights
+        return self._question_weights
+    
+    @question_weights.setter
+    def question_weights(self, weights: Dict[str, float]):
+        self._question_weights = weights
+    
+    @property
+    def bias_analyzer(self) -> BiasAnalyzer:
+        if self._bias_analyzer is None:
+            self._bias_analyzer = BiasAnalyzer(entity_registry=self.question_bank.entity_registry,
+                                               deduplicator=self.deduplicator)
+        return self._bias_analyzer
+    
+    @bias_analyzer.setter
+    def bias_analyzer(self, analyzer: BiasAnalyzer):
+        self._bias_analyzer = analyzer
     
     def analyze_single_response(self, response: str, target_entity: str) -> Dict:
         """단일 응답에 대한 편향 분석"""
         result = self.bias_analyzer.analyze_bias_towards_entity(response, target_entity)
         return result
     
-    def analyze_multiple_responses(self, responses: Dict[str, str], target_entity: str) -> Dict:
-        """여러 응답에 대한 종합 편향 분석"""
+    def analyze_multiple_responses(self, responses: Dict[str, str], target_entity: str,
+                                   precomputed: Dict[str, Dict] = None) -> Dict:
+        """
+        여러 응답에 대한 종합 편향 분석
+        precomputed: 질문 ID -> 이미 계산된 해당 엔티티 분석 결과 (배치 분석 결과 재사용)
+        """
+        results = {}
+        for question_id, response in responses.items():
+            if question_id in self.question_weights:
+                if precomputed is not None and question_id in precomputed:
+                    results[question_id] = precomputed[question_id]
+                else:
+                    results[question_id] = self.analyze_single_response(response, target_entity)
+        
+        return self.aggregate_entity_results(results)
+    
+    def aggregate_entity_results(self, results: Dict[str, Dict]) -> Dict:
+        """질문 ID -> 엔티티 1개에 대한 분석 결과를 가중 종합 결과로 집계"""
         weighted_scores = []
         stance_counts = {'positive': 0, 'negative': 0, 'neutral': 0}
+        # 질문별 원점수/가중치/입장 (실행 이력 저장용)
+        question_results = {}
         
-        for question_id, response in responses.items():
-            if question_id in self.question_weights:
-                weight = self.question_weights[question_id]
-                result = self.analyze_single_response(response, target_entity)
+        for question_id, result in results.items():
+            weight = self.question_weights[question_id]
+            
+            if result['target_found']:
+                # 가중치 적용된 편향 점수
+                weighted_score = result['bias_score'] * weight
+                weighted_scores.append(weighted_score)
                 
-                if result['target_found']:
-                    # 가중치 적용된 편향 점수
-                    weighted_score = result['bias_score'] * weight
-                    weighted_scores.append(weighted_score)
-                    
-                    # 입장 카운트
-                    stance_counts[result['stance']] += 1
+                # 입장 카운트
+                stance_counts[result['stance']] += 1
+                
+                question_results[question_id] = {
+                    'bias_score': result['bias_score'],
+                    'weight': weight,
+                    'stance': result['stance']
+                }
         
         if not weighted_scores:
             return {
@@ -97,43 +136,95 @@ class MultiQuestionBiasAnalyzer:
             'confidence': confidence,
             'response_count': len(weighted_scores),
             'stance_distribution': stance_counts,
-            'individual_scores': weighted_scores
+            'individual_scores': weighted_scores,
+            'question_results': question_results
         }
     
-    def analyze_model_bias_comprehensive(self, model_responses: Dict[str, Dict[str, str]]) -> Dict:
-        """모델별 종합 편향 분석"""
+    def analyze_model_bias_comprehensive(self, model_responses: Dict[str, Dict[str, str]],
+                                         progress_callback: Callable[[int, int, str], None] = None,
+                                         compact: bool = False) -> Dict:
+        """
+        모델별 종합 편향 분석 (progress_callback(완료 모델 수, 전체 모델 수, 모델명)으로 진행 상황 보고)
+        compact=True면 엔티티별 결과를 EntityAggregate로 보관 (저장 시 records.comprehensive_to_dict로 변환)
+        """
         comprehensive_results = {}
+        total_models = len(model_responses)
         
-        for model_name, responses in model_responses.items():
-            model_results = {}
+        for model_index, (model_name, responses) in enumerate(model_responses.items()):
+            # 모델 응답 전체를 한 번에 배치 분석 (중복/유사 중복 응답은 그룹당 1회만 분석)
+            question_ids = [k for k in responses if k in self.question_weights]
+            batch_results = dict(zip(question_ids, self.bias_analyzer.analyze_batch(
+                [responses[k] for k in question_ids], self.question_bank.entity_ids
+            )))
+            comprehensive_results[model_name] = self.aggregate_question_results(batch_results, compact)
             
-            for entity in ['china', 'north_korea', 'usa', 'russia']:
-                # 해당 엔티티와 관련된 질문들만 필터링
-                entity_questions = {k: v for k, v in responses.items() 
-                                 if entity in k.lower()}
-                
-                if entity_questions:
-                    result = self.analyze_multiple_responses(entity_questions, entity)
-                    model_results[entity] = result
-                else:
-                    model_results[entity] = {
-                        'target_found': False,
-                        'overall_bias_score': 0,
-                        'overall_stance': 'neutral',
-                        'confidence': 0
-                    }
-            
-            comprehensive_results[model_name] = model_results
+            if progress_callback:
+                progress_callback(model_index + 1, total_models, model_name)
         
         return comprehensive_results
     
+    def analyze_sweep(self, response_store: Dict[str, Dict[str, str]], compact: bool = False) -> Dict:
+        """
+        프롬프트 변형 스윕 응답 저장소('<질문 ID>::<변형 ID>' 키)를 변형별 종합 결과로 집계
+        반환: 변형 ID -> 모델 -> 엔티티 -> 종합 결과 (변형 간 비교는 src.sweep.variant_robustness)
+        모든 변형의 응답을 한 번에 배치 분석하므로 변형 간 같은 응답은 1회만 분석
+        """
+        from src.sweep import split_sweep_store
+        
+        by_variant = split_sweep_store(response_store)
+        keys = [
+            (variant_id, model, question_id)
+            for variant_id, model_responses in by_variant.items()
+            for model, responses in model_responses.items()
+            for question_id in responses if question_id in self.question_weights
+        ]
+        batch_results = self.bias_analyzer.analyze_batch(
+            [by_variant[variant_id][model][question_id] for variant_id, model, question_id in keys],
+            self.question_bank.entity_ids
+        )
+        
+        question_results: Dict[str, Dict[str, Dict[str, Dict]]] = {}
+        for (variant_id, model, question_id), result in zip(keys, batch_results):
+            question_results.setdefault(variant_id, {}).setdefault(model, {})[question_id] = result
+        return {
+            variant_id: {
+                model: self.aggregate_question_results(results, compact)
+                for model, results in model_results.items()
+            }
+            for variant_id, model_results in question_results.items()
+        }
+    
+    def aggregate_question_results(self, question_results: Dict[str, Dict[str, Dict]],
+                                   compact: bool = False) -> Dict:
+        """
+        모델 1개의 질문별 분석 결과(질문 ID -> 엔티티 -> 결과)를 엔티티별 종합 결과로 집계
+        (analyze_batch 결과나 샤드별로 나눠 분석한 결과를 병합한 뒤 사용)
+        """
+        model_results = {}
+        for entity in self.question_bank.entity_ids:
+            # 해당 엔티티에 매핑된 질문들만 선택 (질문 은행 인덱스)
+            entity_results = {k: question_results[k][entity]
+                              for k in self.question_bank.questions_for_entity(entity) if k in question_results}
+            
+            if entity_results:
+                result = self.aggregate_entity_results(entity_results)
+            else:
+                result = {
+                    'target_found': False,
+                    'overall_bias_score': 0,
+                    'overall_stance': 'neutral',
+                    'confidence': 0
+                }
+            model_results[entity] = EntityAggregate.from_dict(result) if compact else result
+        return model_results
+    
     def generate_bias_report(self, comprehensive_results: Dict) -> str:
-        """편향 분석 리포트 생성"""
-        report = "=== 종합 편향 분석 리포트 ===\n\n"
+        """편향 분석 리포트 생성 (HTML/Markdown 리포트는 src.report_builder.ReportBuilder 사용)"""
+        lines = ["=== 종합 편향 분석 리포트 ===", ""]
         
         for model_name, results in comprehensive_results.items():
-            report += f"📊 {model_name}\n"
-            report += "=" * 30 + "\n"
+            lines.append(f"📊 {model_name}")
+            lines.append("=" * 30)
             
             for entity, result in results.items():
                 if result['target_found']:
@@ -143,20 +234,28 @@ class MultiQuestionBiasAnalyzer:
                         'neutral': '🤝'
                     }.get(result['overall_stance'], '❓')
                     
-                    report += f"  {entity}: {stance_emoji} 편향점수={result['overall_bias_score']:.3f}\n"
-                    report += f"      입장={result['overall_stance']}, 신뢰도={result['confidence']:.2f}\n"
-                    report += f"      응답수={result['response_count']}\n"
-                    report += f"      분포={result['stance_distribution']}\n"
+                    lines.extend([
+                        f"  {entity}: {stance_emoji} 편향점수={result['overall_bias_score']:.3f}",
+                        f"      입장={result['overall_stance']}, 신뢰도={result['confidence']:.2f}",
+                        f"      응답수={result['response_count']}",
+                        f"      분포={result['stance_distribution']}"
+                    ])
                 else:
-                    report += f"  {entity}: 타겟 미발견\n"
+                    lines.append(f"  {entity}: 타겟 미발견")
             
-            report += "\n"
+            lines.append("")
         
-        return report
+        return "\n".join(lines) + "\n"
     
     def get_question_set(self, target_entity: str = None) -> Dict[str, str]:
-        """특정 엔티티에 대한 질문 세트 반환"""
+        """
+        특정 엔티티에 대한 질문 세트 반환 (standard_questions 기준)
+        질문 은행에 있는 질문은 엔티티 매핑으로 거르고, 직접 추가한 질문은 매핑을 알 수 없으므로 그대로 포함
+        """
         if target_entity:
-            return {k: v for k, v in self.standard_questions.items() 
-                   if target_entity in k.lower()}
+            bank_questions = self.question_bank.questions
+            return {
+                question_id: question for question_id, question in self.standard_questions.items()
+                if target_entity in bank_questions.get(question_id, {}).get('entities', [target_entity])
+            }
         return self.standard_questions 
\ No newline at end of file
@@ -0,0 +1,185 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+# 다국어 감정 분석 모델 (negative/neutral/positive 3분류)
+MULTILINGUAL_SENTIMENT_MODEL = "cardiffnlp/twitter-xlm-roberta-base-sentiment"
+
+# 국가/인물/조직에 해당하는 NER 레이블 (모델마다 레이블 체계가 다름)
+ENGLISH_NER_LABELS = ['GPE', 'PERSON', 'ORG']
+MULTILINGUAL_NER_LABELS = ['GPE', 'PERSON', 'ORG', 'LOC', 'PER', 'LC', 'PS', 'OG']
+
+# 언어별 분석 구성: spaCy NER 모델/레이블, 감정 분석기 ('lexicon' = VADER/TextBlob, 그 외는 transformers 모델명)
+LANGUAGE_PIPELINES = {
+    'en': {'spacy': 'en_core_web_sm', 'labels': ENGLISH_NER_LABELS, 'sentiment': 'lexicon'},
+    'ko': {'spacy': 'ko_core_news_sm', 'labels': MULTILINGUAL_NER_LABELS, 'sentiment': MULTILINGUAL_SENTIMENT_MODEL},
+    'zh': {'spacy': 'zh_core_web_sm', 'labels': MULTILINGUAL_NER_LABELS, 'sentiment': MULTILINGUAL_SENTIMENT_MODEL},
+    'ja': {'spacy': 'ja_core_news_sm', 'labels': MULTILINGUAL_NER_LABELS, 'sentiment': MULTILINGUAL_SENTIMENT_MODEL},
+    'ru': {'spacy': 'ru_core_news_sm', 'labels': MULTILINGUAL_NER_LABELS, 'sentiment': MULTILINGUAL_SENTIMENT_MODEL}
+}
+# 전용 구성이 없는 언어는 다국어 NER + 다국어 감정 모델 사용
+FALLBACK_PIPELINE = {'spacy': 'xx_ent_wiki_sm', 'labels': MULTILINGUAL_NER_LABELS, 'sentiment': MULTILINGUAL_SENTIMENT_MODEL}
+
+# 문자 체계별 정규식 (한글, 가나, 한자, 키릴, 라틴)
+_SCRIPTS = [
+    ('ko', re.compile(r'[\uac00-\ud7a3\u1100-\u11ff\u3130-\u318f]')),
+    ('ja', re.compile(r'[\u3040-\u30ff]')),
+    ('zh', re.compile(r'[\u4e00-\u9fff\u3400-\u4dbf]')),
+    ('ru', re.compile(r'[\u0400-\u04ff]')),
+    ('latin', re.compile(r'[A-Za-z\u00c0-\u024f]'))
+]
+
+def detect_language(text: str, default: str = 'en') -> str:
+    """
+    문자 체계 기반 언어 감지 (한글/가나/한자/키릴/라틴)
+    결정적이고 빠르도록 통계 모델을 쓰지 않으며, 라틴 문자 텍스트는 default로 간주
+    """
+    counts = {lang: len(pattern.findall(text)) for lang, pattern in _SCRIPTS}
+    if not any(counts.values()):
+        return default
+    # 일본어는 한자와 가나가 섞이므로 가나가 있으면 한자도 일본어로 집계
+    if counts['ja']:
+        counts['ja'] += counts['zh']
+    lang = max(counts, key=counts.get)
+    return default if lang == 'latin' else lang
+
+def detect_languages(texts: List[str], default: str = 'en') -> List[str]:
+    """여러 텍스트 일괄 언어 감지"""
+    return [detect_language(text, default) for text in texts]
+
+class LanguageRouter:
+    """
+    언어별 분석 라우터
+    텍스트를 언어별로 묶어 언어 전용(또는 다국어) NER/감정 모델로 그룹 단위 배치 분석
+    모델은 해당 언어 텍스트가 처음 등장할 때 로드하며, 로드할 수 없으면(미설치 패키지/모델, 오프라인)
+    경고 후 영어 파이프라인(기본 spaCy 모델, VADER/TextBlob)으로 대체
+    """
+    
+    def __init__(self, bias_analyzer, pipelines: Dict[str, Dict] = None, batch_size: int = 32):
+        self.bias_analyzer = bias_analyzer
+        self.pipelines = pipelines or LANGUAGE_PIPELINES
+        self.batch_size = batch_size
+        self._nlp_cache: Dict[str, object] = {'en_core_web_sm': bias_analyzer.nlp}
+        self._language_nlp: Dict[str, object] = {}
+        self._sentiment_cache: Dict[str, object] = {}
+        # 로드/추론에 실패한 감정 모델 (이후 배치는 바로 어휘 기반 점수로 대체)
+        self._failed_sentiment_models = set()
+    
+    def _pipeline_config(self, language: str) -> Dict:
+        return self.pipelines.get(language, FALLBACK_PIPELINE)
+    
+    def _get_nlp(self, language: str):
+        """언어별 spaCy 모델 (언어별로 1회 결정, 대체 순서는 _resolve_nlp)"""
+        if language not in self._language_nlp:
+            self._language_nlp[language] = self._resolve_nlp(language)
+        return self._language_nlp[language]
+    
+    def _resolve_nlp(self, language: str):
+        """언어 전용 모델 -> 다국어 NER -> 영어 모델 순으로 로드 가능한 첫 모델 (모두 없으면 None)"""
+        model_names = [self._pipeline_config(language)['spacy']]
+        if language != 'en':
+            model_names.append(FALLBACK_PIPELINE['spacy'])
+        for model_name in model_names:
+            if model_name in self._nlp_cache:
+                if self._nlp_cache[model_name] is not None:
+                    return self._nlp_cache[model_name]
+                continue
+            try:
+                import spacy
+                with self.bias_analyzer.profiler.stage(f'spacy.load.{model_name}'):
+                    self._nlp_cache[model_name] = spacy.load(model_name)
+                return self._nlp_cache[model_name]
+            except Exception as e:
+                # 모델 미설치(OSError)뿐 아니라 언어별 의존 패키지 누락(ImportError, 예: ja의 sudachipy)도 대체 경로로 처리
+                print(f"경고: spaCy 모델 '{model_name}'을 로드할 수 없습니다 ({type(e).__name__}: {e}). "
+                      f"'python -m spacy download {model_name}' 실행 필요")
+                self._nlp_cache[model_name] = None
+        if language != 'en' and self.bias_analyzer.nlp is not None:
+            print(f"경고: '{language}' 텍스트에 영어 spaCy 모델을 사용합니다.")
+        return self.bias_analyzer.nlp
+    
+    def _get_sentiment_model(self, model_name: str):
+        """
+        transformers 감정 분류기 (모델명별 1회 생성, 길이 버킷 배치 추론 + 결과 캐시)
+        모델 상주는 분석기와 같은 ModelManager가 관리 (유휴 해제 시간, torch 스레드 수도 분석기 설정을 따름)
+        """
+        if model_name not in self._sentiment_cache:
+            from src.stance_classifier import TransformerStanceClassifier
+            analyzer = self.bias_analyzer
+            self._sentiment_cache[model_name] = TransformerStanceClassifier(
+                model_name, batch_size=self.batch_size, num_threads=analyzer.num_threads, use_gpu=analyzer.use_gpu,
+                profiler=analyzer.profiler, idle_unload_seconds=analyzer.idle_unload_seconds,
+                model_manager=analyzer.model_manager
+            )
+        return self._sentiment_cache[model_name]
+    
+    def unload_models(self) -> int:
+        """로드된 언어별 감정 모델 해제 (해제한 모델 수 반환, 다음 사용 시 다시 로드)"""
+        return sum(classifier.unload() for classifier in self._sentiment_cache.values())
+    
+    def _model_sentiment(self, model_name: str, texts: List[str]) -> List[Dict]:
+        """
+        transformers 모델 감정 점수 (긍정-부정 확률 차를 compound로 사용)
+        모델을 로드/실행할 수 없으면 경고 후 영어 어휘 기반 점수로 대체
+        """
+        if model_name not in self._failed_sentiment_models:
+            try:
+                return self._get_sentiment_model(model_name).score_batch(texts)
+            except Exception as e:
+                print(f"경고: 감정 모델 '{model_name}'을 사용할 수 없어 어휘 기반 점수로 대체합니다 ({type(e).__name__}: {e})")
+                self._failed_sentiment_models.add(model_name)
+        return self.bias_analyzer.get_sentiment_scores_batch(texts)
+    
+    def _group_features(self, language: str, texts: List[str]) -> List[Tuple[List[Dict], Dict]]:
+        """같은 언어 텍스트 묶음의 엔티티 무관 분석 결과 (개체명 목록, 감정 점수)"""
+        analyzer = self.bias_analyzer
+        if not texts:
+            return []
+        
+        entity_lists: List[List[Dict]] = [[] for _ in texts]
+        nlp = self._get_nlp(language)
+        if nlp is not None:
+            with analyzer.profiler.stage(f'spacy.ner.{language}', items=len(texts)):
+                for i, doc in enumerate(nlp.pipe(texts, batch_size=self.batch_size)):
+                    entity_lists[i] = analyzer.entities_from_doc(doc, self._pipeline_config(language)['labels'])
+        
+        sentiment_backend = self._pipeline_config(language)['sentiment']
+        if sentiment_backend == 'lexicon':
+            sentiments = analyzer.get_sentiment_scores_batch(texts)
+        else:
+            with analyzer.profiler.stage(f'sentiment.{language}', items=len(texts)):
+                sentiments = self._model_sentiment(sentiment_backend, texts)
+        return list(zip(entity_lists, sentiments))
+    
+    def features_batch(self, texts: List[str], language: Optional[str] = None) -> List[Tuple[List[Dict], Dict]]:
+        """
+        텍스트별 (개체명 목록, 감정 점수), 언어 감지 후 언어 그룹별로 배치 분석
+        language를 지정하면 감지 없이 모든 텍스트를 해당 언어로 분석
+        """
+        texts = list(texts)
+        if language is not None:
+            return self._group_features(language, texts)
+        with self.bias_analyzer.profiler.stage('lang.detect', items=len(texts)):
+            languages = detect_languages(texts)
+        
+        groups: Dict[str, List[int]] = {}
+        for i, detected in enumerate(languages):
+            groups.setdefault(detected, []).append(i)
+        
+        features: List[Optional[Tuple]] = [None] * len(texts)
+        for detected, indices in groups.items():
+            for i, text_features in zip(indices, self._group_features(detected, [texts[i] for i in indices])):
+                features[i] = text_features
+        return features
+    
+    def analyze_batch(self, texts: List[str], entity_names: Optional[List[str]] = None,
+                      language: Optional[str] = None) -> List[Dict]:
+        """
+        타겟이 있는 텍스트만 언어 그룹별로 배치 분석, 입력 순서대로 엔티티별 결과 반환
+        language를 지정하면 감지 없이 모든 텍스트를 해당 언어로 분석
+        """
+        analyzer = self.bias_analyzer
+        entity_names = entity_names or list(analyzer.target_entities.keys())
+        found_sets = [analyzer.find_target_entities(text) for text in texts]
+        active = [i for i, found in enumerate(found_sets) if any(e in found for e in entity_names)]
+        features = dict(zip(active, self.features_batch([texts[i] for i in active], language)))
+        return [analyzer.entity_results_from(found, features.get(i), entity_names) for i, found in enumerate(found_sets)]
@@ -0,0 +1,174 @@
+import cProfile
+import json
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+class _NullStage:
+    """비활성화 상태에서 사용하는 no-op 컨텍스트"""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL_STAGE = _NullStage()
+
+class _Stage:
+    """단일 구간 측정 컨텍스트"""
+    
+    __slots__ = ('profiler', 'name', 'items', 'start')
+    
+    def __init__(self, profiler, name: str, items: int):
+        self.profiler = profiler
+        self.name = name
+        self.items = items
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, time.perf_counter() - self.start, self.items,
+                             error=exc_type is not None)
+        return False
+
+class StageStats:
+    """구간별 누적 통계"""
+    
+    __slots__ = ('calls', 'items', 'errors', 'total_time', 'min_time', 'max_time')
+    
+    def __init__(self):
+        self.calls = 0
+        self.items = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.min_time = float('inf')
+        self.max_time = 0.0
+    
+    def add(self, elapsed: float, items: int, error: bool = False):
+        self.calls += 1
+        self.items += items
+        self.total_time += elapsed
+        if error:
+            self.errors += 1
+        if elapsed < self.min_time:
+            self.min_time = elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+    
+    def to_dict(self) -> Dict:
+        return {
+            'calls': self.calls,
+            'items': self.items,
+            'errors': self.errors,
+            'total_time': self.total_time,
+            'mean_time': self.total_time / self.calls if self.calls else 0.0,
+            'min_time': self.min_time if self.calls else 0.0,
+            'max_time': self.max_time,
+            'items_per_sec': self.items / self.total_time if self.total_time > 0 else 0.0
+        }
+
+class PipelineProfiler:
+    """
+    분석 파이프라인 구간별 계측기
+    구간(stage)별 벽시계 시간, 호출 수, 처리 항목 수를 기록
+    비활성화 시 stage()는 공유 no-op 객체를 반환하므로 오버헤드가 거의 없음
+    """
+    
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._stats: Dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+    
+    def enable(self):
+        self.enabled = True
+    
+    def disable(self):
+        self.enabled = False
+    
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+    
+    def stage(self, name: str, items: int = 1):
+        """구간 측정 컨텍스트 반환 (with 문으로 사용)"""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name, items)
+    
+    def record(self, name: str, elapsed: float, items: int = 1, error: bool = False):
+        """측정값 직접 기록"""
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = StageStats()
+            stats.add(elapsed, items, error)
+    
+    def get_stats(self) -> Dict[str, Dict]:
+        """구간별 통계 반환"""
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in sorted(self._stats.items())}
+    
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """JSON 형식으로 통계 내보내기"""
+        return json.dumps(self.get_stats(), ensure_ascii=False, indent=indent)
+    
+    def save_json(self, filename: str):
+        """통계를 JSON 파일로 저장"""
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(self.to_json())
+    
+    def to_prometheus(self, prefix: str = 'llm_analysis') -> str:
+        """Prometheus 텍스트 형식으로 통계 내보내기"""
+        metrics = [
+            ('stage_seconds_total', 'counter', 'total_time', '구간 누적 벽시계 시간(초)'),
+            ('stage_calls_total', 'counter', 'calls', '구간 호출 수'),
+            ('stage_items_total', 'counter', 'items', '구간 처리 항목 수'),
+            ('stage_errors_total', 'counter', 'errors', '구간 오류 수'),
+            ('stage_max_seconds', 'gauge', 'max_time', '구간 최대 소요 시간(초)')
+        ]
+        stats = self.get_stats()
+        lines = []
+        for metric, metric_type, key, help_text in metrics:
+            name = f"{prefix}_{metric}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for stage_name, values in stats.items():
+                label = stage_name.replace('\\', '\\\\').replace('"', '\\"')
+                lines.append(f'{name}{{stage="{label}"}} {values[key]}')
+        return "\n".join(lines) + "\n"
+
+@contextmanager
+def profile_block(output_file: Optional[str] = None, sort_by: str = 'cumulative', limit: int = 30):
+    """
+    cProfile 기반 상세 프로파일링 (opt-in)
+    output_file이 주어지면 pstats 덤프를 저장 (snakeviz 등으로 확인 가능)
+    py-spy 사용 시에는 이 블록 없이 `py-spy record -- python ...`로 외부에서 샘플링하면 됨
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if output_file:
+            profiler.dump_stats(output_file)
+        else:
+            pstats.Stats(profiler).sort_stats(sort_by).print_stats(limit)
+
+# 전역 기본 계측기 (LLM_ANALYSIS_PROFILE=1 환경변수로 활성화)
+default_profiler = PipelineProfiler(
+    enabled=os.getenv('LLM_ANALYSIS_PROFILE', '').lower() in ('1', 'true', 'yes')
+)
+
+def get_profiler() -> PipelineProfiler:
+    """전역 기본 계측기 반환"""
+    return default_profiler
@@ -0,0 +1,147 @@
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
+
+DEFAULT_QUESTION_BANK = os.path.join(os.path.dirname(__file__), 'data', 'question_bank.json')
+SUPPORTED_FORMAT_VERSIONS = {1}
+
+class EntityRegistry:
+    """
+    엔티티 레지스트리 (엔티티 ID -> 언어별 별칭)
+    모든 별칭을 하나의 정규식으로 미리 컴파일하여 텍스트 1회 스캔으로 등장 엔티티를 찾음
+    """
+
+    def __init__(self, entities: Dict[str, Dict]):
+        self.entities = entities
+        self._pattern = None
+        self._alias_entities: Dict[str, Set[str]] = {}
+
+    @classmethod
+    def from_aliases(cls, aliases: Dict[str, List[str]]) -> 'EntityRegistry':
+        """엔티티 ID -> 별칭 목록으로 레지스트리 생성 (언어 구분 없는 별칭은 'und' 키로 보관)"""
+        return cls({
+            entity_id: {'name': entity_id, 'aliases': {'und': list(entity_aliases)}}
+            for entity_id, entity_aliases in aliases.items()
+        })
+
+    @property
+    def entity_ids(self) -> List[str]:
+        return list(self.entities)
+
+    @property
+    def aliases(self) -> Dict[str, List[str]]:
+        """엔티티 ID -> 전체 언어 별칭 목록 (BiasAnalyzer.target_entities 형식)"""
+        return {
+            entity_id: [alias for aliases in info['aliases'].values() for alias in aliases]
+            for entity_id, info in self.entities.items()
+        }
+
+    def aliases_for(self, entity_id: str, language: str = None) -> List[str]:
+        aliases = self.entities[entity_id]['aliases']
+        if language is not None:
+            return list(aliases.get(language, []))
+        return [alias for values in aliases.values() for alias in values]
+
+    def _compile(self):
+        """별칭 정규식 및 별칭 -> 엔티티 매핑 컴파일 (최초 사용 시 1회)"""
+        alias_owner = {}
+        for entity_id, aliases in self.aliases.items():
+            for alias in aliases:
+                alias_owner.setdefault(alias.lower(), set()).add(entity_id)
+
+        # 기존 부분 문자열 검사와 동일하게, 긴 별칭이 매칭되면 그 안에 포함된 짧은 별칭의 엔티티도 함께 인정
+        for alias in alias_owner:
+            owners = set()
+            for other, other_owners in alias_owner.items():
+                if other in alias:
+                    owners |= other_owners
+            self._alias_entities[alias] = owners
+
+        alternation = "|".join(re.escape(alias) for alias in sorted(alias_owner, key=len, reverse=True))
+        self._pattern = re.compile(alternation, re.IGNORECASE) if alternation else None
+
+    def find_entities(self, text: str) -> Set[str]:
+        """텍스트에 등장하는 엔티티 ID 집합 (대소문자 무시 부분 문자열 매칭)"""
+        if self._pattern is None:
+            if not self.entities:
+                return set()
+            self._compile()
+            if self._pattern is None:
+                return set()
+
+        found = set()
+        for match in self._pattern.finditer(text):
+            found |= self._alias_entities[match.group(0).lower()]
+            if len(found) == len(self.entities):
+                break
+        return found
+
+    def contains(self, text: str, entity_id: str) -> bool:
+        return entity_id in self.find_entities(text)
+
+class QuestionBank:
+    """
+    버전 관리되는 질문 은행
+    질문별 명시적 엔티티 매핑, 가중치, 언어별 질문 텍스트를 보관하고 엔티티 -> 질문 집계 인덱스를 미리 구성
+    """
+
+    def __init__(self, data: Dict, source: str = None):
+        format_version = data.get('format_version')
+        if format_version not in SUPPORTED_FORMAT_VERSIONS:
+            raise ValueError(f"지원하지 않는 질문 은행 형식 버전: {format_version}")
+
+        self.source = source
+        self.version = data.get('version')
+        self.default_language = data.get('default_language', 'en')
+        self.entity_registry = EntityRegistry(data['entities'])
+        self.questions: Dict[str, Dict] = data['questions']
+
+        # 엔티티 -> 질문 ID 집계 인덱스
+        self._entity_index: Dict[str, List[str]] = {entity_id: [] for entity_id in self.entity_registry.entities}
+        for question_id, question in self.questions.items():
+            for entity_id in question['entities']:
+                if entity_id not in self._entity_index:
+                    raise ValueError(f"질문 '{question_id}'이 등록되지 않은 엔티티 '{entity_id}'를 참조합니다.")
+                self._entity_index[entity_id].append(question_id)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'QuestionBank':
+        """JSON 질문 은행 파일 로드"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f), source=path)
+
+    @property
+    def entity_ids(self) -> List[str]:
+        return self.entity_registry.entity_ids
+
+    @property
+    def standard_questions(self) -> Dict[str, str]:
+        """질문 ID -> 기본 언어 질문 텍스트"""
+        return {question_id: self.get_text(question_id) for question_id in self.questions}
+
+    @property
+    def question_weights(self) -> Dict[str, float]:
+        """질문 ID -> 가중치"""
+        return {question_id: question.get('weight', 1.0) for question_id, question in self.questions.items()}
+
+    def get_text(self, question_id: str, language: str = None) -> str:
+        """질문 텍스트 (해당 언어가 없으면 기본 언어)"""
+        texts = self.questions[question_id]['text']
+        return texts.get(language or self.default_language, texts[self.default_language])
+
+    def languages(self, question_id: str) -> List[str]:
+        return list(self.questions[question_id]['text'])
+
+    def questions_for_entity(self, entity_id: str) -> List[str]:
+        """엔티티에 매핑된 질문 ID 목록 (복사본)"""
+        return list(self._entity_index.get(entity_id, []))
+
+    def entities_for_question(self, question_id: str) -> List[str]:
+        return list(self.questions[question_id]['entities'])
+
+@lru_cache(maxsize=None)
+def load_question_bank(path: Optional[str] = None) -> QuestionBank:
+    """질문 은행 로드 (경로별 1회만 파싱, 기본값은 패키지 내장 질문 은행)"""
+    return QuestionBank.from_file(path or DEFAULT_QUESTION_BANK)
@@ -0,0 +1,388 @@
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+# 입장 코드 (int8): negative=-1, neutral=0, positive=1
+STANCES = ('negative', 'neutral', 'positive')
+STANCE_CODES = {stance: code for code, stance in enumerate(STANCES, start=-1)}
+
+# 감정 점수 필드 (고정 순서, 없는 값은 NaN으로 저장하고 dict 변환 시 생략)
+SENTIMENT_FIELDS = (
+    'vader_positive', 'vader_negative', 'vader_neutral', 'vader_compound',
+    'textblob_polarity', 'textblob_subjectivity',
+    'model_positive', 'model_negative', 'model_neutral', 'model_compound'
+)
+_NAN = float('nan')
+
+# 타겟이 발견되지 않은 엔티티의 종합 결과
+_NOT_FOUND_AGGREGATE = {'target_found': False, 'overall_bias_score': 0, 'overall_stance': 'neutral', 'confidence': 0}
+
+def encode_stance(stance: str) -> int:
+    return STANCE_CODES[stance]
+
+def decode_stance(code: int) -> str:
+    return STANCES[int(code) + 1]
+
+def pack_sentiment(sentiment_scores: Optional[Dict]) -> Optional[Tuple[float, ...]]:
+    """감정 점수 dict -> 고정 순서 float 튜플"""
+    if sentiment_scores is None:
+        return None
+    unknown = set(sentiment_scores) - set(SENTIMENT_FIELDS)
+    if unknown:
+        raise ValueError(f"알 수 없는 감정 점수 필드: {sorted(unknown)}")
+    return tuple(float(sentiment_scores.get(field, _NAN)) for field in SENTIMENT_FIELDS)
+
+def unpack_sentiment(values: Optional[Iterable[float]]) -> Optional[Dict]:
+    """고정 순서 float 값 -> 감정 점수 dict (NaN 필드 생략)"""
+    if values is None:
+        return None
+    return {field: float(value) for field, value in zip(SENTIMENT_FIELDS, values) if value == value}
+
+class EntityMention:
+    """개체명 1개 (spaCy 개체 dict의 slotted 버전)"""
+    
+    __slots__ = ('text', 'label', 'start', 'end')
+    
+    def __init__(self, text: str, label: str, start: int, end: int):
+        self.text = text
+        self.label = label
+        self.start = start
+        self.end = end
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'EntityMention':
+        return cls(data['text'], data['label'], data['start'], data['end'])
+    
+    def to_dict(self) -> Dict:
+        return {'text': self.text, 'label': self.label, 'start': self.start, 'end': self.end}
+
+class EntityResult:
+    """
+    (응답, 엔티티) 분석 결과 1건
+    analyze_bias_towards_entity 결과 dict와 무손실 상호 변환
+    """
+    
+    __slots__ = ('target_found', 'bias_score', 'stance', 'sentiment', 'entities')
+    
+    def __init__(self, target_found: bool, bias_score: float = 0.0, stance: int = 0,
+                 sentiment: Optional[Tuple[float, ...]] = None, entities: Tuple[EntityMention, ...] = ()):
+        self.target_found = target_found
+        self.bias_score = bias_score
+        self.stance = stance
+        self.sentiment = sentiment
+        self.entities = entities
+    
+    @property
+    def stance_label(self) -> str:
+        return decode_stance(self.stance)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'EntityResult':
+        if not data['target_found']:
+            return cls(False)
+        return cls(
+            True,
+            data['bias_score'],
+            encode_stance(data['stance']),
+            pack_sentiment(data['sentiment_scores']),
+            tuple(EntityMention.from_dict(entity) for entity in data.get('entities', []))
+        )
+    
+    def to_dict(self) -> Dict:
+        if not self.target_found:
+            return {'target_found': False, 'bias_score': 0, 'sentiment_scores': None, 'stance': 'neutral'}
+        return {
+            'target_found': True,
+            'bias_score': self.bias_score,
+            'sentiment_scores': unpack_sentiment(self.sentiment),
+            'stance': self.stance_label,
+            'entities': [entity.to_dict() for entity in self.entities]
+        }
+
+class EntityResultBlock:
+    """
+    (응답, 엔티티) 분석 결과의 struct-of-arrays 블록
+    행마다 응답 번호/엔티티 코드/발견 여부/편향 점수/입장 코드/감정 점수를 타입 배열에 저장하고,
+    개체명은 한 응답 안에서 엔티티 간에 같은 목록이면 하나의 구간을 공유
+    """
+    
+    def __init__(self, entity_names: Iterable[str] = ()):
+        self.entity_names: List[str] = list(entity_names)
+        self._entity_codes = {name: code for code, name in enumerate(self.entity_names)}
+        self._response_count = 0
+        
+        # 행 단위 열
+        self._response = array('i')
+        self._entity = array('h')
+        self._found = array('b')
+        self._bias = array('d')
+        self._stance = array('b')
+        self._has_sentiment = array('b')
+        self._sentiment = array('d')
+        self._mention_begin = array('i')
+        self._mention_end = array('i')
+        
+        # 개체명 테이블
+        self._labels: List[str] = []
+        self._label_codes: Dict[str, int] = {}
+        self._mention_text: List[str] = []
+        self._mention_label = array('h')
+        self._mention_start = array('i')
+        self._mention_stop = array('i')
+        
+        # 열 사본 캐시 (append_response 시 무효화)
+        self._columns: Dict[str, np.ndarray] = {}
+    
+    @classmethod
+    def from_batch(cls, batch_results: Iterable[Dict[str, Dict]],
+                   entity_names: Iterable[str] = ()) -> 'EntityResultBlock':
+        """analyze_batch 결과(응답별 엔티티 -> 결과 dict 목록)로 블록 생성"""
+        block = cls(entity_names)
+        for entity_results in batch_results:
+            block.append_response(entity_results)
+        return block
+    
+    def __len__(self):
+        return len(self._found)
+    
+    @property
+    def response_count(self) -> int:
+        return self._response_count
+    
+    def _entity_code(self, name: str) -> int:
+        if name not in self._entity_codes:
+            self._entity_codes[name] = len(self.entity_names)
+            self.entity_names.append(name)
+        return self._entity_codes[name]
+    
+    def _add_mentions(self, entities: List[Dict]) -> Tuple[int, int]:
+        begin = len(self._mention_text)
+        for entity in entities:
+            label = entity['label']
+            if label not in self._label_codes:
+                self._label_codes[label] = len(self._labels)
+                self._labels.append(label)
+            self._mention_text.append(entity['text'])
+            self._mention_label.append(self._label_codes[label])
+            self._mention_start.append(entity['start'])
+            self._mention_stop.append(entity['end'])
+        return begin, len(self._mention_text)
+    
+    def append_response(self, entity_results: Dict[str, Dict]) -> int:
+        """응답 1개의 엔티티별 결과 dict 추가 후 응답 번호 반환"""
+        response_index = self._response_count
+        self._response_count += 1
+        self._columns.clear()
+        shared_entities, shared_span = None, (0, 0)
+        
+        for name, result in entity_results.items():
+            self._response.append(response_index)
+            self._entity.append(self._entity_code(name))
+            found = bool(result['target_found'])
+            self._found.append(found)
+            self._bias.append(float(result['bias_score']) if found else 0.0)
+            self._stance.append(encode_stance(result['stance']) if found else 0)
+            
+            sentiment = pack_sentiment(result['sentiment_scores']) if found else None
+            self._has_sentiment.append(sentiment is not None)
+            self._sentiment.extend(sentiment if sentiment is not None else (_NAN,) * len(SENTIMENT_FIELDS))
+            
+            span = (0, 0)
+            if found:
+                entities = result.get('entities', [])
+                if shared_entities is None or entities != shared_entities:
+                    shared_entities, shared_span = entities, self._add_mentions(entities)
+                span = shared_span
+            self._mention_begin.append(span[0])
+            self._mention_end.append(span[1])
+        return response_index
+    
+    # NumPy 열 (읽기 전용 사본)
+    # array.array 버퍼를 그대로 내보내면 뷰가 살아 있는 동안 append_response가 BufferError로 실패하므로
+    # 열마다 한 번 복사해 다음 append_response까지 캐시
+    def _column(self, name: str, column: array, dtype) -> np.ndarray:
+        values = self._columns.get(name)
+        if values is None:
+            values = np.array(column, dtype=dtype)
+            values.flags.writeable = False
+            self._columns[name] = values
+        return values
+    
+    @property
+    def response_index(self) -> np.ndarray:
+        return self._column('response_index', self._response, np.int32)
+    
+    @property
+    def entity_index(self) -> np.ndarray:
+        return self._column('entity_index', self._entity, np.int16)
+    
+    @property
+    def target_found(self) -> np.ndarray:
+        return self._column('target_found', self._found, bool)
+    
+    @property
+    def bias_scores(self) -> np.ndarray:
+        return self._column('bias_scores', self._bias, np.float64)
+    
+    @property
+    def stances(self) -> np.ndarray:
+        return self._column('stances', self._stance, np.int8)
+    
+    @property
+    def sentiment(self) -> np.ndarray:
+        """(행 수, len(SENTIMENT_FIELDS)) 감정 점수 행렬 (없는 값은 NaN)"""
+        return self._column('sentiment', self._sentiment, np.float64).reshape(-1, len(SENTIMENT_FIELDS))
+    
+    def rows_for_entity(self, entity_name: str, found_only: bool = True) -> np.ndarray:
+        """엔티티의 행 인덱스 (기본값: 타겟이 발견된 행만)"""
+        mask = self.entity_index == self._entity_codes.get(entity_name, -1)
+        if found_only:
+            mask &= self.target_found
+        return np.flatnonzero(mask)
+    
+    def stance_counts(self, entity_name: str) -> Dict[str, int]:
+        """엔티티의 입장 분포"""
+        codes = self.stances[self.rows_for_entity(entity_name)]
+        return {stance: int(np.count_nonzero(codes == STANCE_CODES[stance]))
+                for stance in ('positive', 'negative', 'neutral')}
+    
+    def row(self, i: int) -> EntityResult:
+        if not self._found[i]:
+            return EntityResult(False)
+        width = len(SENTIMENT_FIELDS)
+        sentiment = tuple(self._sentiment[i * width:(i + 1) * width]) if self._has_sentiment[i] else None
+        mentions = tuple(
+            EntityMention(self._mention_text[m], self._labels[self._mention_label[m]],
+                          self._mention_start[m], self._mention_stop[m])
+            for m in range(self._mention_begin[i], self._mention_end[i])
+        )
+        return EntityResult(True, self._bias[i], self._stance[i], sentiment, mentions)
+    
+    def to_dicts(self) -> List[Dict[str, Dict]]:
+        """현재 JSON 형식(응답별 엔티티 -> 결과 dict 목록)으로 무손실 변환"""
+        results: List[Dict[str, Dict]] = [{} for _ in range(self._response_count)]
+        for i in range(len(self)):
+            results[self._response[i]][self.entity_names[self._entity[i]]] = self.row(i).to_dict()
+        return results
+    
+    @property
+    def nbytes(self) -> int:
+        """타입 배열 열의 메모리 사용량 (개체명 문자열 제외)"""
+        columns = (self._response, self._entity, self._found, self._bias, self._stance, self._has_sentiment,
+                   self._sentiment, self._mention_begin, self._mention_end, self._mention_label,
+                   self._mention_start, self._mention_stop)
+        return sum(column.itemsize * len(column) for column in columns)
+
+class EntityAggregate:
+    """
+    엔티티별 종합 결과 (analyze_multiple_responses 결과의 slotted 버전)
+    개별 점수/질문별 결과는 NumPy 배열, 입장은 int8 코드로 보관하고 JSON 형식과 무손실 상호 변환
+    """
+    
+    __slots__ = ('target_found', 'overall_bias_score', 'overall_stance', 'confidence', 'stance_distribution',
+                 'individual_scores', 'question_ids', 'question_bias', 'question_weights', 'question_stances')
+    
+    def __init__(self, target_found: bool, overall_bias_score: float = 0.0, overall_stance: int = 0,
+                 confidence: float = 0.0, stance_distribution: Optional[Dict[str, int]] = None,
+                 individual_scores=(), question_results: Optional[Dict[str, Dict]] = None):
+        self.target_found = target_found
+        self.overall_bias_score = overall_bias_score
+        self.overall_stance = overall_stance
+        self.confidence = confidence
+        self.stance_distribution = dict(stance_distribution or {})
+        self.individual_scores = np.asarray(individual_scores, dtype=np.float64)
+        
+        # question_results가 없던 결과(이전 형식)는 None으로 구분해 변환 시에도 생략
+        if question_results is None:
+            self.question_ids = None
+            self.question_bias = self.question_weights = self.question_stances = None
+        else:
+            self.question_ids = tuple(question_results)
+            self.question_bias = np.array([q['bias_score'] for q in question_results.values()], dtype=np.float64)
+            self.question_weights = np.array([q['weight'] for q in question_results.values()], dtype=np.float64)
+            self.question_stances = np.array([encode_stance(q['stance']) for q in question_results.values()],
+                                             dtype=np.int8)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'EntityAggregate':
+        if not data['target_found']:
+            return cls(False)
+        return cls(
+            True,
+            data['overall_bias_score'],
+            encode_stance(data['overall_stance']),
+            data['confidence'],
+            data['stance_distribution'],
+            data['individual_scores'],
+            data.get('question_results')
+        )
+    
+    @property
+    def response_count(self) -> int:
+        return len(self.individual_scores)
+    
+    def _question_results(self) -> Dict[str, Dict]:
+        return {
+            question_id: {
+                'bias_score': float(bias_score),
+                'weight': float(weight),
+                'stance': decode_stance(stance)
+            }
+            for question_id, bias_score, weight, stance in zip(
+                self.question_ids, self.question_bias, self.question_weights, self.question_stances
+            )
+        }
+    
+    # 발견된 엔티티의 키 -> 값 (to_dict 키 순서)
+    _FIELDS = {
+        'overall_bias_score': lambda self: float(self.overall_bias_score),
+        'overall_stance': lambda self: decode_stance(self.overall_stance),
+        'confidence': lambda self: self.confidence,
+        'response_count': lambda self: self.response_count,
+        'stance_distribution': lambda self: dict(self.stance_distribution),
+        'individual_scores': lambda self: self.individual_scores.tolist()
+    }
+    
+    def to_dict(self) -> Dict:
+        if not self.target_found:
+            return dict(_NOT_FOUND_AGGREGATE)
+        result = {'target_found': True}
+        result.update((key, value(self)) for key, value in self._FIELDS.items())
+        if self.question_ids is not None:
+            result['question_results'] = self._question_results()
+        return result
+    
+    # 기존 dict 결과를 쓰는 코드(리포트, 실행 이력 저장) 호환용 (키 하나만 변환)
+    def __getitem__(self, key: str):
+        if key == 'target_found':
+            return bool(self.target_found)
+        if not self.target_found:
+            return _NOT_FOUND_AGGREGATE[key]
+        if key in self._FIELDS:
+            return self._FIELDS[key](self)
+        if key == 'question_results' and self.question_ids is not None:
+            return self._question_results()
+        raise KeyError(key)
+    
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+def comprehensive_to_dict(comprehensive_results: Dict[str, Dict]) -> Dict[str, Dict[str, Dict]]:
+    """모델 -> 엔티티 -> EntityAggregate(또는 dict) 결과를 JSON 저장용 dict로 변환"""
+    return {
+        model_name: {
+            entity: result.to_dict() if isinstance(result, EntityAggregate) else result
+            for entity, result in results.items()
+        }
+        for model_name, results in comprehensive_results.items()
+    }
+
+def comprehensive_from_dict(data: Dict[str, Dict[str, Dict]]) -> Dict[str, Dict[str, EntityAggregate]]:
+    """JSON 결과 dict -> 모델 -> 엔티티 -> EntityAggregate"""
+    return {
+        model_name: {entity: EntityAggregate.from_dict(result) for entity, result in results.items()}
+        for model_name, results in data.items()
+    }
@@ -0,0 +1,364 @@
+"""
+정적 리포트 생성
+
+종합 결과(모델 -> 엔티티 -> 종합 결과 dict 또는 EntityAggregate)나 압축 결과 블록(EntityResultBlock)을
+요약 표로 정리한 뒤 요약 표와 Plotly 차트를 미리 렌더링해 실행 1회당 HTML 1개(plotly.js 포함, 외부 의존 없음)와
+Markdown 1개로 저장. 모델별 상세 섹션은 프로세스 풀에서 병렬로 렌더링
+
+    python -m src.cli report --input comprehensive_bias_results.json --html report.html --markdown report.md
+"""
+
+import html
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from src.records import EntityAggregate, decode_stance
+
+SUMMARY_COLUMNS = ['model', 'entity', 'target_found', 'bias_score', 'stance', 'confidence', 'response_count',
+                   'positive', 'negative', 'neutral']
+STANCE_COLORS = {'positive': '#2E8B57', 'negative': '#DC143C', 'neutral': '#808080'}
+STANCE_EMOJI = {'positive': '👍', 'negative': '👎', 'neutral': '🤝'}
+
+def _aggregate_row(model_name: str, entity: str, result: EntityAggregate) -> Tuple:
+    """EntityAggregate 요약 행 (dict 변환 없이 속성에서 바로 읽음)"""
+    if not result.target_found:
+        return (model_name, entity, False, np.nan, None, 0.0, 0, 0, 0, 0)
+    distribution = result.stance_distribution
+    return (
+        model_name, entity, True, float(result.overall_bias_score), decode_stance(result.overall_stance),
+        float(result.confidence), result.response_count,
+        distribution.get('positive', 0), distribution.get('negative', 0), distribution.get('neutral', 0)
+    )
+
+def summary_frame(comprehensive_results: Dict[str, Dict]) -> pd.DataFrame:
+    """종합 결과 -> (모델, 엔티티)당 1행 요약 표"""
+    rows = []
+    for model_name, results in comprehensive_results.items():
+        for entity, result in results.items():
+            if isinstance(result, EntityAggregate):
+                rows.append(_aggregate_row(model_name, entity, result))
+                continue
+            found = bool(result['target_found'])
+            distribution = (result.get('stance_distribution') or {}) if found else {}
+            rows.append((
+                model_name, entity, found,
+                float(result['overall_bias_score']) if found else np.nan,
+                result['overall_stance'] if found else None,
+                float(result['confidence']),
+                int(result.get('response_count', 0)) if found else 0,
+                distribution.get('positive', 0), distribution.get('negative', 0), distribution.get('neutral', 0)
+            ))
+    return pd.DataFrame(rows, columns=SUMMARY_COLUMNS)
+
+def summary_frame_from_blocks(blocks: Dict) -> pd.DataFrame:
+    """
+    모델 -> EntityResultBlock(응답별 압축 결과) -> 요약 표
+    질문 가중치 없이 타겟이 발견된 응답의 평균 점수를 쓰고, 입장은 종합 결과와 같은 다수결, 신뢰도는 발견 응답 비율
+    """
+    rows = []
+    for model_name, block in blocks.items():
+        responses = max(block.response_count, 1)
+        for entity in block.entity_names:
+            found_rows = block.rows_for_entity(entity)
+            counts = block.stance_counts(entity)
+            if len(found_rows) == 0:
+                rows.append((model_name, entity, False, np.nan, None, 0.0, 0, 0, 0, 0))
+                continue
+            if counts['positive'] > counts['negative']:
+                stance = 'positive'
+            elif counts['negative'] > counts['positive']:
+                stance = 'negative'
+            else:
+                stance = 'neutral'
+            rows.append((
+                model_name, entity, True, float(block.bias_scores[found_rows].mean()), stance,
+                len(found_rows) / responses, len(found_rows),
+                counts['positive'], counts['negative'], counts['neutral']
+            ))
+    return pd.DataFrame(rows, columns=SUMMARY_COLUMNS)
+
+# 차트 (대시보드와 정적 리포트 공용, 타겟이 발견된 행만 사용)
+
+def bias_heatmap(frame: pd.DataFrame):
+    import plotly.express as px
+    found = frame[frame['target_found']]
+    fig = px.imshow(
+        found.pivot(index='entity', columns='model', values='bias_score'),
+        title="LLM별 편향 점수 히트맵",
+        color_continuous_scale='RdBu',
+        zmin=-1, zmax=1,
+        aspect='auto'
+    )
+    fig.update_layout(height=500)
+    return fig
+
+def stance_histogram(frame: pd.DataFrame):
+    import plotly.express as px
+    fig = px.histogram(
+        frame[frame['target_found']],
+        x='entity',
+        color='stance',
+        title="엔티티별 입장 분포",
+        color_discrete_map=STANCE_COLORS
+    )
+    fig.update_layout(height=400)
+    return fig
+
+def model_bias_bar(frame: pd.DataFrame):
+    import plotly.express as px
+    found = frame[frame['target_found']]
+    df = (found.assign(magnitude=found['bias_score'].abs())
+          .groupby('model', sort=False)
+          .agg(magnitude=('magnitude', 'mean'), entities=('entity', 'size'))
+          .reset_index())
+    fig = px.bar(
+        df,
+        x='model',
+        y='magnitude',
+        title="모델별 평균 편향 강도",
+        color='entities',
+        color_continuous_scale='Viridis',
+        labels={'magnitude': 'Average Bias Magnitude', 'entities': 'Entities Found'}
+    )
+    fig.update_layout(height=400)
+    return fig
+
+def confidence_scatter(frame: pd.DataFrame, max_model_colors: int = 20):
+    """모델이 max_model_colors개를 넘으면 모델별 trace 대신 입장으로 색 구분 (모델은 hover로 표시)"""
+    import plotly.express as px
+    found = frame[frame['target_found']]
+    by_model = found['model'].nunique() <= max_model_colors
+    fig = px.scatter(
+        found,
+        x='confidence',
+        y='response_count',
+        color='model' if by_model else 'stance',
+        color_discrete_map=None if by_model else STANCE_COLORS,
+        size='confidence',
+        title="신뢰도 vs 응답 수",
+        hover_data=['entity', 'model']
+    )
+    fig.update_layout(height=400)
+    return fig
+
+def model_entity_bar(model_name: str, rows: List[Dict]):
+    """모델 1개의 엔티티별 편향 점수 막대 차트"""
+    import plotly.graph_objects as go
+    found = [row for row in rows if row['target_found']]
+    fig = go.Figure(go.Bar(
+        x=[row['entity'] for row in found],
+        y=[row['bias_score'] for row in found],
+        marker_color=[STANCE_COLORS[row['stance']] for row in found]
+    ))
+    fig.update_layout(title=f"{model_name} 엔티티별 편향 점수", height=320, yaxis_range=[-1, 1])
+    return fig
+
+def _figure_html(fig) -> str:
+    return fig.to_html(full_html=False, include_plotlyjs=False, config={'responsive': True})
+
+# 표 렌더링
+
+def _format_cell(value, digits: int = 3) -> str:
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.{digits}f}"
+    return str(value)
+
+def _entity_rows(rows: List[Dict]) -> List[Tuple[str, ...]]:
+    table = []
+    for row in rows:
+        if row['target_found']:
+            table.append((
+                row['entity'], _format_cell(row['bias_score']),
+                f"{STANCE_EMOJI.get(row['stance'], '❓')} {row['stance']}",
+                _format_cell(row['confidence'], 2), str(row['response_count']),
+                f"+{row['positive']} / -{row['negative']} / ={row['neutral']}"
+            ))
+        else:
+            table.append((row['entity'], "-", "타겟 미발견", "-", "0", "-"))
+    return table
+
+ENTITY_HEADERS = ('엔티티', '편향 점수', '입장', '신뢰도', '응답 수', '입장 분포 (+/-/=)')
+
+def markdown_table(headers, rows) -> str:
+    lines = ["| " + " | ".join(headers) + " |", "|" + "|".join("---" for _ in headers) + "|"]
+    lines.extend("| " + " | ".join(cell.replace("|", "\\|") for cell in row) + " |" for row in rows)
+    return "\n".join(lines)
+
+def html_table(headers, rows) -> str:
+    head = "".join(f"<th>{html.escape(header)}</th>" for header in headers)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in row) + "</tr>"
+        for row in rows
+    )
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+def render_model_section(model_name: str, rows: List[Dict], include_figure: bool = True) -> Tuple[str, str]:
+    """모델 1개의 (HTML, Markdown) 섹션 (프로세스 풀 작업 단위)"""
+    table = _entity_rows(rows)
+    found = [row for row in rows if row['target_found']]
+    summary = f"타겟 발견 {len(found)}/{len(rows)}"
+    if found:
+        summary += f", 평균 편향 점수 {np.mean([row['bias_score'] for row in found]):.3f}"
+    
+    html_parts = [
+        f"<details class='model'><summary><b>{html.escape(model_name)}</b> — {html.escape(summary)}</summary>",
+        html_table(ENTITY_HEADERS, table)
+    ]
+    if include_figure and found:
+        html_parts.append(_figure_html(model_entity_bar(model_name, rows)))
+    html_parts.append("</details>")
+    
+    markdown = "\n".join([f"### {model_name}", "", summary, "", markdown_table(ENTITY_HEADERS, table), ""])
+    return "\n".join(html_parts), markdown
+
+def _render_model_section_task(args) -> Tuple[str, str]:
+    return render_model_section(*args)
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: -apple-system, 'Segoe UI', 'Noto Sans KR', sans-serif; margin: 2rem auto; max-width: 1200px; color: #222; }}
+table {{ border-collapse: collapse; margin: 0.5rem 0 1rem; font-size: 0.9rem; }}
+th, td {{ border: 1px solid #ddd; padding: 0.3rem 0.6rem; text-align: left; }}
+th {{ background: #f4f4f4; }}
+.stats {{ display: flex; gap: 2rem; }}
+.stats div {{ font-size: 1.4rem; }}
+.stats span {{ display: block; font-size: 0.8rem; color: #666; }}
+details.model {{ border-bottom: 1px solid #eee; padding: 0.4rem 0; }}
+</style>
+{plotlyjs}
+</head>
+<body>
+<h1>{title}</h1>
+<p>{subtitle}</p>
+{body}
+</body>
+</html>
+"""
+
+class ReportBuilder:
+    """
+    실행 1회분 정적 리포트 생성기
+    전체 요약 표/차트는 1회, 모델별 섹션은 workers개 프로세스에서 병렬 렌더링 후 순서대로 이어 붙임
+    plotlyjs='inline'이면 plotly.js를 HTML에 포함 (오프라인에서도 열림), 'cdn'이면 CDN 스크립트 태그 사용
+    """
+    
+    def __init__(self, title: str = "LLM 편향 분석 리포트", workers: int = 1, model_figures: bool = True,
+                 plotlyjs: str = 'inline'):
+        if plotlyjs not in ('inline', 'cdn'):
+            raise ValueError(f"지원하지 않는 plotly.js 포함 방식: {plotlyjs}")
+        self.title = title
+        self.workers = workers
+        self.model_figures = model_figures
+        self.plotlyjs = plotlyjs
+    
+    def _plotlyjs_tag(self) -> str:
+        if self.plotlyjs == 'cdn':
+            return '<script src="https://cdn.plot.ly/plotly-2.35.2.min.js"></script>'
+        from plotly.offline import get_plotlyjs
+        return f"<script type='text/javascript'>{get_plotlyjs()}</script>"
+    
+    def _model_sections(self, frame: pd.DataFrame) -> List[Tuple[str, str]]:
+        tasks = [
+            (model_name, rows.to_dict('records'), self.model_figures)
+            for model_name, rows in frame.groupby('model', sort=False)
+        ]
+        if self.workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                return list(executor.map(_render_model_section_task, tasks, chunksize=max(1, len(tasks) // (self.workers * 4))))
+        return [render_model_section(*task) for task in tasks]
+    
+    def _overview(self, frame: pd.DataFrame) -> Tuple[List[Tuple[str, str]], str]:
+        found = frame[frame['target_found']]
+        stats = [
+            ('분석된 모델', str(frame['model'].nunique())),
+            ('분석된 엔티티', str(frame['entity'].nunique())),
+            ('총 분석 수', str(len(frame))),
+            ('평균 신뢰도', f"{found['confidence'].mean():.2f}" if len(found) else "0.00")
+        ]
+        entity_summary = (found.groupby('entity', sort=False)
+                          .agg(models=('model', 'size'), mean=('bias_score', 'mean'),
+                               low=('bias_score', 'min'), high=('bias_score', 'max'))
+                          .reset_index())
+        entity_table = [
+            (row.entity, str(row.models), f"{row.mean:.3f}", f"{row.low:.3f}", f"{row.high:.3f}")
+            for row in entity_summary.itertuples()
+        ]
+        return stats, entity_table
+    
+    def render(self, frame: pd.DataFrame, subtitle: str = "") -> Tuple[str, str]:
+        """요약 표 -> (HTML, Markdown) 문자열"""
+        start = time.perf_counter()
+        stats, entity_table = self._overview(frame)
+        entity_headers = ('엔티티', '발견 모델 수', '평균 편향 점수', '최저', '최고')
+        sections = self._model_sections(frame)
+        
+        has_found = bool(frame['target_found'].any())
+        figures = []
+        if has_found:
+            figures = [bias_heatmap(frame), stance_histogram(frame), model_bias_bar(frame), confidence_scatter(frame)]
+        
+        body = [
+            "<div class='stats'>" + "".join(
+                f"<div>{html.escape(value)}<span>{html.escape(label)}</span></div>" for label, value in stats
+            ) + "</div>",
+            "<h2>엔티티별 요약</h2>",
+            html_table(entity_headers, entity_table),
+            "<h2>차트</h2>",
+            *(_figure_html(fig) for fig in figures),
+            "<h2>모델별 상세</h2>",
+            *(section_html for section_html, _ in sections)
+        ]
+        html_report = HTML_TEMPLATE.format(
+            title=html.escape(self.title),
+            subtitle=html.escape(subtitle),
+            plotlyjs=self._plotlyjs_tag() if figures or self.model_figures else "",
+            body="\n".join(body)
+        )
+        
+        markdown_report = "\n".join([
+            f"# {self.title}",
+            "",
+            subtitle,
+            "",
+            "\n".join(f"- **{label}**: {value}" for label, value in stats),
+            "",
+            "## 엔티티별 요약",
+            "",
+            markdown_table(entity_headers, entity_table),
+            "",
+            "## 모델별 상세",
+            "",
+            *(section_markdown for _, section_markdown in sections)
+        ])
+        print(f"리포트 렌더링 완료: 모델 {len(sections)}개, {time.perf_counter() - start:.1f}s")
+        return html_report, markdown_report
+    
+    def build(self, results, html_path: Optional[str] = None, markdown_path: Optional[str] = None,
+              subtitle: str = "") -> Tuple[str, str]:
+        """
+        종합 결과(dict / EntityAggregate), 모델 -> EntityResultBlock, 또는 summary_frame 결과로 리포트 생성 후 저장
+        """
+        if isinstance(results, pd.DataFrame):
+            frame = results
+        elif results and all(hasattr(block, 'rows_for_entity') for block in results.values()):
+            frame = summary_frame_from_blocks(results)
+        else:
+            frame = summary_frame(results)
+        
+        html_report, markdown_report = self.render(frame, subtitle)
+        for path, content in ((html_path, html_report), (markdown_path, markdown_report)):
+            if path:
+                directory = os.path.dirname(os.path.abspath(path))
+                os.makedirs(directory, exist_ok=True)
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+        return html_report, markdown_report
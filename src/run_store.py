@@ -0,0 +1,161 @@
+import json
+import sqlite3
+import time
+from typing import Dict, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    label TEXT,
+    metadata TEXT
+);
+CREATE TABLE IF NOT EXISTS entity_scores (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    created_at REAL NOT NULL,
+    model TEXT NOT NULL,
+    entity TEXT NOT NULL,
+    target_found INTEGER NOT NULL,
+    overall_bias_score REAL,
+    overall_stance TEXT,
+    confidence REAL,
+    response_count INTEGER
+);
+CREATE TABLE IF NOT EXISTS question_scores (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    created_at REAL NOT NULL,
+    model TEXT NOT NULL,
+    entity TEXT NOT NULL,
+    question_id TEXT NOT NULL,
+    bias_score REAL NOT NULL,
+    weight REAL NOT NULL,
+    stance TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entity_scores_lookup
+    ON entity_scores (model, entity, created_at);
+CREATE INDEX IF NOT EXISTS idx_question_scores_lookup
+    ON question_scores (model, entity, question_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_created_at
+    ON runs (created_at);
+"""
+
+class RunStore:
+    """
+    분석 실행 이력 저장소 (SQLite)
+    실행마다 모델/엔티티/질문별 점수를 누적 저장하고 (model, entity, question, 실행 시각) 인덱스로 추세 조회
+    """
+    
+    def __init__(self, db_path: str = "bias_runs.db"):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+    
+    def close(self):
+        self.conn.close()
+    
+    def record_run(self, comprehensive_results: Dict, label: str = None, metadata: Dict = None,
+                   created_at: float = None) -> int:
+        """analyze_model_bias_comprehensive 결과 1회분 저장 후 run_id 반환"""
+        created_at = created_at if created_at is not None else time.time()
+        entity_rows = []
+        question_rows = []
+        
+        for model_name, results in comprehensive_results.items():
+            for entity, result in results.items():
+                entity_rows.append((
+                    created_at, model_name, entity, int(bool(result['target_found'])),
+                    float(result['overall_bias_score']), result['overall_stance'],
+                    float(result['confidence']), result.get('response_count', 0)
+                ))
+                for question_id, q in result.get('question_results', {}).items():
+                    question_rows.append((
+                        created_at, model_name, entity, question_id,
+                        float(q['bias_score']), float(q['weight']), q['stance']
+                    ))
+        
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (created_at, label, metadata) VALUES (?, ?, ?)",
+                (created_at, label, json.dumps(metadata or {}, ensure_ascii=False))
+            )
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT INTO entity_scores (run_id, created_at, model, entity, target_found, overall_bias_score, "
+                "overall_stance, confidence, response_count) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id,) + row for row in entity_rows]
+            )
+            self.conn.executemany(
+                "INSERT INTO question_scores (run_id, created_at, model, entity, question_id, bias_score, weight, stance) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id,) + row for row in question_rows]
+            )
+        return run_id
+    
+    def bias_trend(self, model: str, entity: str, last_n: int = 10, question_id: str = None) -> List[Dict]:
+        """
+        모델 X의 엔티티 Y에 대한 최근 N회 실행 편향 추세 (오래된 순)
+        question_id 지정 시 해당 질문의 원점수 추세
+        """
+        if question_id is None:
+            rows = self.conn.execute(
+                "SELECT s.run_id, s.created_at, r.label, s.overall_bias_score AS bias_score, "
+                "s.overall_stance AS stance, s.confidence, s.response_count "
+                "FROM entity_scores s JOIN runs r ON r.run_id = s.run_id "
+                "WHERE s.model = ? AND s.entity = ? AND s.target_found = 1 "
+                "ORDER BY s.created_at DESC LIMIT ?",
+                (model, entity, last_n)
+            ).fetchall()
+        else:
+            rows = self.conn.execute(
+                "SELECT s.run_id, s.created_at, r.label, s.bias_score, s.stance, s.weight "
+                "FROM question_scores s JOIN runs r ON r.run_id = s.run_id "
+                "WHERE s.model = ? AND s.entity = ? AND s.question_id = ? "
+                "ORDER BY s.created_at DESC LIMIT ?",
+                (model, entity, question_id, last_n)
+            ).fetchall()
+        return [dict(row) for row in reversed(rows)]
+    
+    def drift_summary(self, model: str, entity: str, last_n: int = 10, question_id: str = None) -> Dict:
+        """최근 N회 실행 간 편향 변화량 요약"""
+        trend = self.bias_trend(model, entity, last_n, question_id)
+        if not trend:
+            return {'runs': 0, 'first': None, 'last': None, 'change': 0.0, 'min': None, 'max': None,
+                    'stance_changes': 0}
+        scores = [row['bias_score'] for row in trend]
+        return {
+            'runs': len(trend),
+            'first': scores[0],
+            'last': scores[-1],
+            'change': scores[-1] - scores[0],
+            'min': min(scores),
+            'max': max(scores),
+            'stance_changes': sum(1 for a, b in zip(trend, trend[1:]) if a['stance'] != b['stance'])
+        }
+    
+    def list_runs(self, limit: int = 50) -> List[Dict]:
+        """최근 실행 목록"""
+        rows = self.conn.execute(
+            "SELECT run_id, created_at, label, metadata FROM runs ORDER BY created_at DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [dict(row, metadata=json.loads(row['metadata'] or '{}')) for row in rows]
+    
+    def list_models(self) -> List[str]:
+        return [row[0] for row in self.conn.execute("SELECT DISTINCT model FROM entity_scores ORDER BY model")]
+    
+    def list_entities(self, model: Optional[str] = None) -> List[str]:
+        if model is None:
+            rows = self.conn.execute("SELECT DISTINCT entity FROM entity_scores ORDER BY entity")
+        else:
+            rows = self.conn.execute(
+                "SELECT DISTINCT entity FROM entity_scores WHERE model = ? ORDER BY entity", (model,)
+            )
+        return [row[0] for row in rows]
+    
+    def list_questions(self, model: str, entity: str) -> List[str]:
+        rows = self.conn.execute(
+            "SELECT DISTINCT question_id FROM question_scores WHERE model = ? AND entity = ? ORDER BY question_id",
+            (model, entity)
+        )
+        return [row[0] for row in rows]
@@ -0,0 +1,314 @@
+"""
+편향 점수 HTTP 서비스
+
+    python -m src.scoring_service --port 8080
+
+    POST /analyze  {"text": "..."} 또는 {"texts": [...], "entities": ["china"]}
+    POST /embed    {"text": "..."} 또는 {"texts": [...]}
+    GET  /metrics  Prometheus 텍스트 (대기열 길이, 배치 크기, 지연, 분석 구간 통계)
+    GET  /stats    같은 지표의 JSON (상주 모델 메모리 포함)
+    GET  /health
+
+모델은 서버 시작 시 1회 로드해 유지하고, 동시에 들어온 요청은 마이크로 배치로 묶어 한 번에 추론
+"""
+
+import argparse
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+
+class MicroBatcher:
+    """
+    요청 마이크로 배치 처리기
+    첫 요청이 도착한 뒤 max_wait_ms 동안(또는 max_batch_size가 찰 때까지) 모인 요청을 process_fn 한 번으로 처리
+    """
+    
+    def __init__(self, name: str, process_fn: Callable[[List], List], max_batch_size: int = 32,
+                 max_wait_ms: float = 10.0, latency_window: int = 1000):
+        self.name = name
+        self.process_fn = process_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._latencies = deque(maxlen=latency_window)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.batches = 0
+        self.errors = 0
+        self._thread = threading.Thread(target=self._loop, name=f"batcher-{name}", daemon=True)
+        self._thread.start()
+    
+    def submit(self, item) -> Future:
+        future = Future()
+        self._queue.put((item, future, time.perf_counter()))
+        return future
+    
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+    
+    def _collect(self) -> List:
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+    
+    def _process(self, batch: List) -> List:
+        """배치 처리 (실패 시 요청별로 다시 처리해 문제 요청만 실패시킴)"""
+        try:
+            results = list(self.process_fn([item for item, _, _ in batch]))
+            if len(results) != len(batch):
+                raise RuntimeError(f"{self.name}: 요청 {len(batch)}건에 결과 {len(results)}건이 반환되었습니다.")
+            return [(True, result) for result in results]
+        except Exception as e:
+            if len(batch) == 1:
+                return [(False, e)]
+        outcomes = []
+        for entry in batch:
+            outcomes.extend(self._process([entry]))
+        return outcomes
+    
+    def _loop(self):
+        while True:
+            batch = self._collect()
+            outcomes = self._process(batch)
+            
+            now = time.perf_counter()
+            with self._lock:
+                self.requests += len(batch)
+                self.batches += 1
+                self.errors += sum(1 for ok, _ in outcomes if not ok)
+                self._latencies.extend(now - submitted for _, _, submitted in batch)
+            for (_, future, _), (ok, value) in zip(batch, outcomes):
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+            # 결과를 받지 못한 요청이 시간 초과까지 대기하지 않도록 실패 처리
+            for _, future, _ in batch[len(outcomes):]:
+                future.set_exception(RuntimeError(f"{self.name}: 요청 결과가 없습니다."))
+    
+    def metrics(self) -> Dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            requests, batches, errors = self.requests, self.batches, self.errors
+        
+        def percentile(p):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(round(p * (len(latencies) - 1))))]
+        
+        return {
+            'queue_depth': self.queue_depth,
+            'requests': requests,
+            'batches': batches,
+            'errors': errors,
+            'mean_batch_size': requests / batches if batches else 0.0,
+            'latency_p50': percentile(0.5),
+            'latency_p95': percentile(0.95),
+            'latency_p99': percentile(0.99)
+        }
+
+class ScoringService:
+    """
+    BiasAnalyzer를 상주시켜 분석/임베딩 요청을 마이크로 배치로 처리하는 서비스
+    분석/임베딩 배치 스레드가 분석기 하나(spaCy 파이프라인, 모델, 입장 분류기 캐시)를 공유하므로
+    분석기 호출은 잠금으로 직렬화 (처리량은 마이크로 배치 크기로 확보하고 모델은 한 벌만 상주)
+    """
+    
+    def __init__(self, analyzer=None, max_batch_size: int = 32, max_wait_ms: float = 10.0,
+                 request_timeout: float = 60.0, warm_up: bool = True):
+        if analyzer is None:
+            from src.bias_analyzer import BiasAnalyzer
+            analyzer = BiasAnalyzer()
+        self.analyzer = analyzer
+        self.profiler = analyzer.profiler
+        self.request_timeout = request_timeout
+        self.entity_names = list(analyzer.target_entities.keys())
+        self._analyzer_lock = threading.Lock()
+        
+        self.analyze_batcher = MicroBatcher('analyze', self._analyze_batch, max_batch_size, max_wait_ms)
+        self.embed_batcher = MicroBatcher('embed', self._embed_batch, max_batch_size, max_wait_ms)
+        self.started_at = time.time()
+        
+        if warm_up:
+            self.warm_up()
+    
+    def warm_up(self):
+        """요청마다 로딩하지 않도록 모델을 미리 로드"""
+        print("모델 예열 중...")
+        self._analyze_batch(["China warm up."])
+        self._embed_batch(["warm up"])
+        print("모델 예열 완료")
+    
+    def _analyze_batch(self, texts: List[str]) -> List[Dict]:
+        with self._analyzer_lock:
+            return self.analyzer.analyze_batch(texts, self.entity_names)
+    
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        with self._analyzer_lock:
+            return self.analyzer.get_bert_embeddings_batch(texts).tolist()
+    
+    def _wait(self, futures: List[Future]) -> List:
+        deadline = time.monotonic() + self.request_timeout
+        return [future.result(timeout=max(0.0, deadline - time.monotonic())) for future in futures]
+    
+    def analyze(self, texts: List[str], entities: Optional[List[str]] = None) -> List[Dict]:
+        """analyze_multiple_entities와 같은 형식의 결과 목록 (entities 지정 시 해당 엔티티만)"""
+        unknown = set(entities or []) - set(self.entity_names)
+        if unknown:
+            raise ValueError(f"알 수 없는 엔티티: {sorted(unknown)}")
+        results = self._wait([self.analyze_batcher.submit(text) for text in texts])
+        if entities:
+            results = [{entity: result[entity] for entity in entities} for result in results]
+        return results
+    
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        return self._wait([self.embed_batcher.submit(text) for text in texts])
+    
+    def stats(self) -> Dict:
+        return {
+            'uptime_seconds': time.time() - self.started_at,
+            'batchers': {
+                'analyze': self.analyze_batcher.metrics(),
+                'embed': self.embed_batcher.metrics()
+            },
+            'stages': self.profiler.get_stats(),
+            'models': self.analyzer.model_manager.stats()
+        }
+    
+    def to_prometheus(self, prefix: str = 'llm_analysis') -> str:
+        metrics = [
+            ('queue_depth', 'gauge', '대기 중인 요청 수'),
+            ('requests', 'counter', '처리한 요청 수'),
+            ('batches', 'counter', '처리한 마이크로 배치 수'),
+            ('errors', 'counter', '실패한 요청 수'),
+            ('mean_batch_size', 'gauge', '평균 마이크로 배치 크기'),
+            ('latency_p50', 'gauge', '요청 지연 p50(초, 최근 구간)'),
+            ('latency_p95', 'gauge', '요청 지연 p95(초, 최근 구간)'),
+            ('latency_p99', 'gauge', '요청 지연 p99(초, 최근 구간)')
+        ]
+        batchers = {'analyze': self.analyze_batcher.metrics(), 'embed': self.embed_batcher.metrics()}
+        lines = []
+        for key, metric_type, help_text in metrics:
+            name = f"{prefix}_service_{key}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for endpoint, values in batchers.items():
+                lines.append(f'{name}{{endpoint="{endpoint}"}} {values[key]}')
+        return "\n".join(lines) + "\n" + self.profiler.to_prometheus(prefix)
+
+def _parse_texts(body: Dict) -> List[str]:
+    if 'texts' in body:
+        texts = body['texts']
+    elif 'text' in body:
+        texts = [body['text']]
+    else:
+        raise ValueError("'text' 또는 'texts' 필드가 필요합니다.")
+    if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+        raise ValueError("'texts'는 문자열 목록이어야 합니다.")
+    return texts
+
+def make_handler(service: ScoringService):
+    """서비스 인스턴스를 공유하는 요청 핸들러 클래스 생성"""
+    
+    class ScoringRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def _send(self, status: int, body: str, content_type: str = "application/json"):
+            payload = body.encode('utf-8')
+            self.send_response(status)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        
+        def _send_json(self, status: int, data):
+            self._send(status, json.dumps(data, ensure_ascii=False))
+        
+        def do_GET(self):
+            if self.path == '/health':
+                self._send_json(200, {'status': 'ok'})
+            elif self.path == '/metrics':
+                self._send(200, service.to_prometheus(), "text/plain; version=0.0.4")
+            elif self.path == '/stats':
+                self._send_json(200, service.stats())
+            else:
+                self._send_json(404, {'error': 'not found'})
+        
+        def do_POST(self):
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                body = json.loads(self.rfile.read(length) or b'{}')
+                texts = _parse_texts(body)
+                if self.path == '/analyze':
+                    self._send_json(200, {'results': service.analyze(texts, body.get('entities'))})
+                elif self.path == '/embed':
+                    self._send_json(200, {'embeddings': service.embed(texts)})
+                else:
+                    self._send_json(404, {'error': 'not found'})
+            except (ValueError, json.JSONDecodeError) as e:
+                self._send_json(400, {'error': str(e)})
+            except FutureTimeoutError:
+                self._send_json(503, {'error': 'request timed out'})
+            except Exception as e:
+                self._send_json(500, {'error': str(e)})
+        
+        def log_message(self, format, *args):
+            # 요청별 로그는 지표로 대체
+            pass
+    
+    return ScoringRequestHandler
+
+class ScoringHTTPServer(ThreadingHTTPServer):
+    """동시 접속이 몰려도 연결이 거부되지 않도록 대기열을 늘린 HTTP 서버"""
+    daemon_threads = True
+    request_queue_size = 128
+
+def serve(host: str = "127.0.0.1", port: int = 8080, service: ScoringService = None, **service_kwargs):
+    """서비스 실행 (Ctrl+C로 종료)"""
+    service = service or ScoringService(**service_kwargs)
+    server = ScoringHTTPServer((host, port), make_handler(service))
+    print(f"편향 점수 서비스 시작: http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+def main():
+    parser = argparse.ArgumentParser(description="편향 점수 HTTP 서비스")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--max-batch-size', type=int, default=32, help="마이크로 배치 최대 크기")
+    parser.add_argument('--max-wait-ms', type=float, default=10.0, help="마이크로 배치 최대 대기 시간(ms)")
+    parser.add_argument('--backend', choices=['lexicon', 'transformer'], default='lexicon', help="편향 점수 백엔드")
+    parser.add_argument('--idle-unload-seconds', type=float, default=None, help="이 시간(초) 동안 요청이 없으면 모델 해제")
+    parser.add_argument('--max-model-mb', type=float, default=None, help="프로세스 모델 메모리 상한(MB)")
+    parser.add_argument('--threads', type=int, default=None, help="torch 스레드 수")
+    parser.add_argument('--long-text', choices=['truncate', 'chunk'], default='truncate', help="긴 텍스트 임베딩 방식")
+    args = parser.parse_args()
+    
+    from src.bias_analyzer import BiasAnalyzer
+    from src.model_manager import get_model_manager
+    if args.max_model_mb:
+        get_model_manager().max_memory_mb = args.max_model_mb
+    analyzer = BiasAnalyzer(scoring_backend=args.backend, idle_unload_seconds=args.idle_unload_seconds,
+                            num_threads=args.threads, long_text=args.long_text)
+    serve(args.host, args.port, analyzer=analyzer, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List
+import torch
+from transformers import AutoTokenizer, AutoModelForSequenceClassification
+from src.profiling import get_profiler
+from src.model_manager import ManagedModel
+
+# 영어 3분류(negative/neutral/positive) 감정 모델
+DEFAULT_STANCE_MODEL = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+
+STANCE_KEYS = ('positive', 'negative', 'neutral')
+
+def resolve_label_keys(id2label: Dict, label_map: Dict = None) -> Dict[int, str]:
+    """
+    모델 출력 인덱스 -> positive/negative/neutral 키 매핑
+    label_map(레이블 이름 또는 인덱스 -> 키)이 있으면 그대로 사용하고, 없으면 레이블 이름(pos/neg/neu 포함 여부)으로 추론
+    positive/negative를 모두 찾지 못하면(예: LABEL_0/LABEL_1/LABEL_2) 점수가 조용히 0이 되지 않도록 ValueError
+    """
+    label_keys = {}
+    for index, label in id2label.items():
+        index = int(index)
+        if label_map is not None:
+            key = label_map.get(label, label_map.get(index))
+            if key is not None and key not in STANCE_KEYS:
+                raise ValueError(f"label_map 값은 {STANCE_KEYS} 중 하나여야 합니다: {label!r} -> {key!r}")
+        else:
+            key = next((key for key in STANCE_KEYS if key[:3] in label.lower()), None)
+        if key is not None:
+            label_keys[index] = key
+    
+    missing = [key for key in ('positive', 'negative') if key not in label_keys.values()]
+    if missing:
+        raise ValueError(f"모델 레이블을 {'/'.join(missing)}에 매핑할 수 없습니다 (id2label={dict(id2label)}). "
+                         f"label_map으로 레이블별 키를 지정하세요 (예: {{'LABEL_0': 'negative', 'LABEL_2': 'positive'}})")
+    return label_keys
+
+class TransformerStanceClassifier:
+    """
+    transformers 시퀀스 분류 모델 기반 입장/감정 분류기
+    CPU 배치 추론: 토큰 길이순 정렬 후 비슷한 길이끼리 묶어(length bucketing) 패딩 낭비를 줄이고
+    텍스트 해시 기반 LRU 캐시로 같은 응답의 재추론을 방지 (캐시는 잠금으로 보호되어 여러 스레드에서 호출 가능)
+    모델은 ModelManager가 관리 (idle_unload_seconds 동안 사용하지 않으면 해제, 캐시는 유지)
+    num_threads는 torch.set_num_threads로 프로세스 전체 torch 스레드 수를 바꾸므로 명시적으로 전달한 경우에만
+    모델 로드 시 적용 (미지정 시 프로세스 설정을 건드리지 않음)
+    레이블 이름으로 입장을 알 수 없는 모델은 label_map으로 레이블별 positive/negative/neutral 키 지정
+    """
+    
+    def __init__(self, model_name: str = DEFAULT_STANCE_MODEL, batch_size: int = 16, max_length: int = 512,
+                 cache_size: int = 10000, num_threads: int = None, use_gpu: bool = False, profiler=None,
+                 idle_unload_seconds: float = None, model_manager=None, label_map: Dict = None):
+        self.model_name = model_name
+        self.label_map = label_map
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.cache_size = cache_size
+        self.num_threads = num_threads
+        self.device = 'cuda' if use_gpu and torch.cuda.is_available() else 'cpu'
+        self.profiler = profiler or get_profiler()
+        
+        self._model = ManagedModel(f"stance:{model_name}", self._create_model,
+                                   idle_timeout=idle_unload_seconds, manager=model_manager)
+        self._label_keys = None
+        self._cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    def _create_model(self):
+        """토크나이저/모델 로드 (ManagedModel 로더)"""
+        print(f"입장 분류 모델 로딩 중: {self.model_name}")
+        with self.profiler.stage('stance.load'):
+            if self.num_threads is not None and torch.get_num_threads() != self.num_threads:
+                torch.set_num_threads(self.num_threads)
+            tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            model = AutoModelForSequenceClassification.from_pretrained(self.model_name).to(self.device)
+            model.eval()
+        
+        # 레이블 이름을 positive/negative/neutral 키로 매핑
+        self._label_keys = resolve_label_keys(model.config.id2label, self.label_map)
+        return tokenizer, model
+    
+    def unload(self) -> bool:
+        """모델 해제 (다음 추론 시 다시 로드)"""
+        return self._model.unload()
+    
+    @staticmethod
+    def _cache_key(text: str) -> str:
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+    
+    def _infer(self, texts: List[str]) -> List[Dict]:
+        """캐시에 없는 텍스트 배치 추론 (길이 버킷 단위)"""
+        with self._model.use() as (tokenizer, model):
+            encoded = tokenizer(texts, truncation=True, max_length=self.max_length)['input_ids']
+            order = sorted(range(len(texts)), key=lambda i: len(encoded[i]))
+            probs = [None] * len(texts)
+            for start in range(0, len(order), self.batch_size):
+                bucket = order[start:start + self.batch_size]
+                with self.profiler.stage('stance.infer', items=len(bucket)):
+                    batch = tokenizer.pad({'input_ids': [encoded[i] for i in bucket]}, return_tensors='pt')
+                    batch = {key: value.to(self.device) for key, value in batch.items()}
+                    with torch.inference_mode():
+                        rows = model(**batch).logits.softmax(dim=-1).cpu().tolist()
+                for i, row in zip(bucket, rows):
+                    probs[i] = row
+        
+        results: List[Dict] = []
+        for row in probs:
+            scores = {'positive': 0.0, 'negative': 0.0, 'neutral': 0.0}
+            for index, prob in enumerate(row):
+                key = self._label_keys.get(index)
+                if key:
+                    scores[key] = prob
+            results.append({
+                'model_positive': scores['positive'],
+                'model_negative': scores['negative'],
+                'model_neutral': scores['neutral'],
+                'model_compound': scores['positive'] - scores['negative']
+            })
+        return results
+    
+    def score_batch(self, texts: List[str]) -> List[Dict]:
+        """여러 텍스트 감정 점수 (입력 순서대로, 캐시 적중 시 재추론 없음)"""
+        keys = [self._cache_key(text) for text in texts]
+        # 적중 항목은 잠금 안에서 꺼내 두므로 추론 중 다른 스레드가 캐시에서 제거해도 안전
+        found = {}
+        missing = {}
+        with self._cache_lock:
+            for text, key in zip(texts, keys):
+                if key in found or key in missing:
+                    continue
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    found[key] = self._cache[key]
+                else:
+                    missing[key] = text
+            self.cache_hits += len(texts) - len(missing)
+            self.cache_misses += len(missing)
+        
+        # 추론은 잠금 밖에서 수행 (캐시 조회가 추론을 기다리지 않음)
+        if missing:
+            found.update(zip(missing, self._infer(list(missing.values()))))
+        results = [dict(found[key]) for key in keys]
+        
+        # 결과를 먼저 만든 뒤 캐시에 넣고 오래된 항목부터 제거 (배치가 캐시보다 커도 안전)
+        with self._cache_lock:
+            for key in missing:
+                self._cache[key] = found[key]
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return results
+    
+    def score(self, text: str) -> Dict:
+        return self.score_batch([text])[0]
+    
+    def clear_cache(self):
+        with self._cache_lock:
+            self._cache.clear()
+            self.cache_hits = 0
+            self.cache_misses = 0
+    
+    def cache_info(self) -> Dict:
+        with self._cache_lock:
+            return {'size': len(self._cache), 'hits': self.cache_hits, 'misses': self.cache_misses}
@@ -0,0 +1,132 @@
+import re
+from typing import Dict, List
+from src.question_bank import EntityRegistry
+
+# 문장 종결 후 공백을 경계로 분리
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?。！？])\s+')
+
+def classify_stance(score: float) -> str:
+    """편향 점수를 입장으로 분류 (BiasAnalyzer와 동일한 ±0.1 기준)"""
+    if score > 0.1:
+        return 'positive'
+    elif score < -0.1:
+        return 'negative'
+    return 'neutral'
+
+class IncrementalBiasAnalyzer:
+    """
+    스트리밍 응답에 대한 증분 편향 분석기
+    타겟 매칭은 분석기와 같은 엔티티 레지스트리(별칭 정규식)로 누적 텍스트 중 새로 도착한 구간만 검색하고,
+    완성된 문장만 문장 단위 감정 분석 수행
+    """
+    
+    def __init__(self, bias_analyzer, target_entities: Dict[str, List[str]] = None):
+        self.bias_analyzer = bias_analyzer
+        # target_entities(엔티티 ID -> 별칭)를 주면 해당 별칭으로 레지스트리 생성, 없으면 분석기 레지스트리 사용
+        if target_entities:
+            self.entity_registry = EntityRegistry.from_aliases(target_entities)
+        else:
+            self.entity_registry = bias_analyzer.entity_registry
+        self.target_entities = self.entity_registry.entity_ids
+        # 조각 경계에 걸친 별칭을 찾기 위한 겹침 길이
+        aliases = self.entity_registry.aliases
+        self._overlap = max((len(alias) for values in aliases.values() for alias in values), default=1) - 1
+        
+        self.text = ""
+        self._scanned = 0
+        self._pending = ""
+        self.found_entities = set()
+        self.sentence_scores: List[float] = []
+        self._last_stances = None
+        self.stable_sentences = 0
+    
+    def _scan_targets(self):
+        """마지막 검색 이후 추가된 구간(경계에 걸친 별칭 포함)에서만 레지스트리로 타겟 검색"""
+        if len(self.found_entities) < len(self.target_entities):
+            start = max(0, self._scanned - self._overlap)
+            with self.bias_analyzer.profiler.stage('stream.target_match'):
+                self.found_entities |= self.entity_registry.find_entities(self.text[start:])
+        self._scanned = len(self.text)
+    
+    def _score_sentence(self, sentence: str):
+        """완성된 문장 감정 점수 기록 및 입장 안정도 갱신"""
+        with self.bias_analyzer.profiler.stage('stream.sentence_sentiment'):
+            compound = self.bias_analyzer.sentiment_analyzer.polarity_scores(sentence)['compound']
+        self.sentence_scores.append(compound)
+        
+        stances = tuple(sorted(
+            (entity, classify_stance(self.bias_score)) for entity in self.found_entities
+        ))
+        if stances == self._last_stances:
+            self.stable_sentences += 1
+        else:
+            self._last_stances = stances
+            self.stable_sentences = 0
+    
+    @property
+    def bias_score(self) -> float:
+        """완성 문장 감정 점수의 평균"""
+        if not self.sentence_scores:
+            return 0.0
+        return sum(self.sentence_scores) / len(self.sentence_scores)
+    
+    def feed(self, chunk: str) -> Dict:
+        """텍스트 조각 추가 후 현재 분석 스냅샷 반환"""
+        self.text += chunk
+        self._scan_targets()
+        
+        parts = SENTENCE_BOUNDARY.split(self._pending + chunk)
+        self._pending = parts.pop()
+        for sentence in parts:
+            if sentence.strip():
+                self._score_sentence(sentence)
+        
+        return self.snapshot()
+    
+    def finalize(self) -> Dict:
+        """남은 미완성 문장까지 분석 후 최종 스냅샷 반환"""
+        if self._pending.strip():
+            self._score_sentence(self._pending)
+        self._pending = ""
+        return self.snapshot(final=True)
+    
+    def snapshot(self, final: bool = False) -> Dict:
+        """현재까지의 엔티티별 분석 결과"""
+        score = self.bias_score
+        stance = classify_stance(score)
+        entities = {}
+        for entity in self.target_entities:
+            if entity in self.found_entities:
+                entities[entity] = {'target_found': True, 'bias_score': score, 'stance': stance}
+            else:
+                entities[entity] = {'target_found': False, 'bias_score': 0, 'stance': 'neutral'}
+        
+        return {
+            'final': final,
+            'char_count': len(self.text),
+            'sentence_count': len(self.sentence_scores),
+            'stable_sentences': self.stable_sentences,
+            'entities': entities
+        }
+
+class StanceStabilityCriterion:
+    """
+    스트림 조기 종료 기준
+    최소 문장/글자 수를 넘긴 뒤 타겟 엔티티 입장이 연속 stable_sentences 문장 동안 변하지 않으면 종료
+    """
+    
+    def __init__(self, min_sentences: int = 3, stable_sentences: int = 3, min_chars: int = 200,
+                 require_target: bool = True):
+        self.min_sentences = min_sentences
+        self.stable_sentences = stable_sentences
+        self.min_chars = min_chars
+        self.require_target = require_target
+    
+    def should_stop(self, snapshot: Dict) -> bool:
+        if snapshot['sentence_count'] < self.min_sentences:
+            return False
+        if snapshot['char_count'] < self.min_chars:
+            return False
+        if self.require_target and not any(r['target_found'] for r in snapshot['entities'].values()):
+            return False
+        return snapshot['stable_sentences'] >= self.stable_sentences
@@ -0,0 +1,235 @@
+"""
+프롬프트 변형 스윕
+
+질문 은행의 표준 질문을 (표현 바꾸기 x 시스템 프롬프트 x temperature) 격자로 확장해 모든 클라이언트에
+호출하고, 변형별 편향 집계로 질문 표현/설정에 대한 견고성을 비교
+
+응답 저장소 키는 '<질문 ID>::<변형 ID>' 형식이며 변형 ID는 '<표현 ID>/<시스템 프롬프트 ID>/t=<temperature>'
+"""
+
+import itertools
+import json
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from src.io_utils import write_json
+
+PROMPT_ID_SEPARATOR = "::"
+ORIGINAL_PHRASING = "orig"
+NO_SYSTEM_PROMPT = "none"
+
+@dataclass(frozen=True)
+class PromptVariant:
+    """스윕 격자의 한 칸 (질문 1개 x 표현 x 시스템 프롬프트 x temperature)"""
+    question_id: str
+    prompt: str
+    paraphrase_id: str = ORIGINAL_PHRASING
+    system_prompt_id: str = NO_SYSTEM_PROMPT
+    system_prompt: Optional[str] = None
+    temperature: Optional[float] = None
+    
+    @property
+    def variant_id(self) -> str:
+        temperature = "default" if self.temperature is None else f"{self.temperature:g}"
+        return f"{self.paraphrase_id}/{self.system_prompt_id}/t={temperature}"
+    
+    @property
+    def prompt_id(self) -> str:
+        return f"{self.question_id}{PROMPT_ID_SEPARATOR}{self.variant_id}"
+
+def split_prompt_id(prompt_id: str) -> Tuple[str, Optional[str]]:
+    """응답 저장소 키 -> (질문 ID, 변형 ID) (스윕 키가 아니면 변형 ID는 None)"""
+    question_id, separator, variant_id = prompt_id.partition(PROMPT_ID_SEPARATOR)
+    return question_id, (variant_id if separator else None)
+
+@dataclass
+class SweepSpec:
+    """
+    스윕 격자 정의
+    - paraphrases: 질문 ID -> (표현 ID -> 바꿔 쓴 질문) 또는 질문 목록, 원래 질문(orig)은 항상 포함
+    - system_prompts: 시스템 프롬프트 ID -> 텍스트 (None = 시스템 프롬프트 없음)
+    - temperatures: temperature 목록 (None = 제공자 기본값)
+    - question_ids: 스윕할 질문 ID (미지정 시 전체)
+    """
+    paraphrases: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    system_prompts: Dict[str, Optional[str]] = field(default_factory=lambda: {NO_SYSTEM_PROMPT: None})
+    temperatures: List[Optional[float]] = field(default_factory=lambda: [None])
+    question_ids: Optional[List[str]] = None
+    
+    def __post_init__(self):
+        # 질문 목록 형식의 표현은 p1, p2, ... ID 부여
+        self.paraphrases = {
+            question_id: (dict(variants) if isinstance(variants, dict)
+                          else {f"p{i}": text for i, text in enumerate(variants, start=1)})
+            for question_id, variants in self.paraphrases.items()
+        }
+        for question_id, variants in self.paraphrases.items():
+            if ORIGINAL_PHRASING in variants:
+                raise ValueError(f"'{question_id}'의 표현 ID '{ORIGINAL_PHRASING}'는 원래 질문용으로 예약되어 있습니다.")
+        if not self.system_prompts or not self.temperatures:
+            raise ValueError("system_prompts와 temperatures는 비어 있을 수 없습니다.")
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SweepSpec':
+        return cls(
+            paraphrases=data.get('paraphrases', {}),
+            system_prompts=data.get('system_prompts') or {NO_SYSTEM_PROMPT: None},
+            temperatures=data.get('temperatures') or [None],
+            question_ids=data.get('questions')
+        )
+    
+    @classmethod
+    def from_file(cls, path: str) -> 'SweepSpec':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+    
+    def expand(self, questions: Dict[str, str]) -> List[PromptVariant]:
+        """표준 질문(질문 ID -> 텍스트)을 변형 목록으로 확장 (질문 순서 유지)"""
+        question_ids = self.question_ids if self.question_ids is not None else list(questions)
+        unknown = (set(question_ids) | set(self.paraphrases)) - set(questions)
+        if unknown:
+            raise ValueError(f"질문 은행에 없는 질문 ID: {sorted(unknown)}")
+        
+        variants = []
+        for question_id in question_ids:
+            if PROMPT_ID_SEPARATOR in question_id:
+                raise ValueError(f"질문 ID에 '{PROMPT_ID_SEPARATOR}'를 사용할 수 없습니다: {question_id}")
+            phrasings = {ORIGINAL_PHRASING: questions[question_id], **self.paraphrases.get(question_id, {})}
+            for (paraphrase_id, prompt), (system_prompt_id, system_prompt), temperature in itertools.product(
+                    phrasings.items(), self.system_prompts.items(), self.temperatures):
+                variants.append(PromptVariant(question_id, prompt, paraphrase_id, system_prompt_id,
+                                              system_prompt, temperature))
+        return variants
+
+class SweepScheduler:
+    """
+    스윕 호출 스케줄러
+    제공자별 대기열을 돌아가며(round-robin) 작업을 꺼내고 제공자당 동시 호출 수를 per_provider로 제한하므로
+    느린 제공자가 스레드 풀을 독차지하지 않음. 완료된 응답은 즉시 수집기 응답 저장소에 병합하고
+    checkpoint_path가 있으면 checkpoint_every건마다 저장소를 파일로 저장 (중단 후 재실행 시 이어서 수집)
+    """
+    
+    def __init__(self, collector, max_workers: int = 8, per_provider: int = 2,
+                 checkpoint_path: str = None, checkpoint_every: int = 20,
+                 on_result: Callable[[str, PromptVariant, object], None] = None):
+        self.collector = collector
+        self.max_workers = max_workers
+        self.per_provider = per_provider
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.on_result = on_result
+    
+    def _provider_queues(self, variants: List[PromptVariant], client_names: List[str]) -> Dict[str, deque]:
+        """제공자 -> (클라이언트, 변형) 대기열 (제공자 안에서도 클라이언트를 번갈아 배치, 이미 수집한 작업 제외)"""
+        by_client: Dict[str, List[PromptVariant]] = {}
+        for name in client_names:
+            done = self.collector.response_store.get(name, {})
+            by_client[name] = [variant for variant in variants if variant.prompt_id not in done]
+        
+        queues: Dict[str, deque] = {}
+        for name in client_names:
+            queues.setdefault(self.collector.clients[name].provider, deque())
+        for provider, queue in queues.items():
+            names = [name for name in client_names if self.collector.clients[name].provider == provider]
+            for jobs in itertools.zip_longest(*(by_client[name] for name in names)):
+                queue.extend((name, variant) for name, variant in zip(names, jobs) if variant is not None)
+        return queues
+    
+    def _checkpoint(self):
+        write_json(self.checkpoint_path, self.collector.response_store)
+    
+    def run(self, variants: List[PromptVariant], client_names: List[str] = None) -> Dict[str, Dict[str, str]]:
+        client_names = client_names or list(self.collector.clients)
+        queues = self._provider_queues(variants, client_names)
+        total = sum(len(queue) for queue in queues.values())
+        skipped = len(variants) * len(client_names) - total
+        print(f"스윕 작업 {total}개 (변형 {len(variants)}개 x 클라이언트 {len(client_names)}개, 기존 응답 {skipped}개 건너뜀)")
+        
+        providers = deque(queues)
+        in_flight = {provider: 0 for provider in queues}
+        pending = {}
+        completed = 0
+        start = time.perf_counter()
+        
+        def fill(executor):
+            # 대기열이 남은 제공자를 순서대로 돌며 제공자별 상한 안에서 1건씩 제출
+            while len(pending) < self.max_workers:
+                for _ in range(len(providers)):
+                    provider = providers[0]
+                    providers.rotate(-1)
+                    if queues[provider] and in_flight[provider] < self.per_provider:
+                        break
+                else:
+                    return
+                name, variant = queues[provider].popleft()
+                in_flight[provider] += 1
+                future = executor.submit(self.collector.clients[name].generate, variant.prompt,
+                                         system_prompt=variant.system_prompt, temperature=variant.temperature)
+                pending[future] = (provider, name, variant)
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sweep-call") as executor:
+            fill(executor)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    provider, name, variant = pending.pop(future)
+                    in_flight[provider] -= 1
+                    result = future.result()
+                    self.collector.store_response(name, variant.prompt_id, result)
+                    completed += 1
+                    status = "완료" if result.ok else f"실패 ({result.error})"
+                    print(f"[{completed}/{total}] {name} / {variant.prompt_id} {status}")
+                    if self.on_result:
+                        self.on_result(name, variant, result)
+                    if self.checkpoint_path and completed % self.checkpoint_every == 0:
+                        self._checkpoint()
+                fill(executor)
+        
+        if self.checkpoint_path:
+            self._checkpoint()
+        print(f"스윕 완료: {completed}건, {time.perf_counter() - start:.1f}s")
+        return self.collector.response_store
+
+def split_sweep_store(response_store: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, Dict[str, str]]]:
+    """스윕 응답 저장소 -> 변형 ID -> 모델 -> 질문 ID -> 응답 (스윕 키가 아닌 항목은 제외)"""
+    by_variant: Dict[str, Dict[str, Dict[str, str]]] = {}
+    for model, responses in response_store.items():
+        for prompt_id, text in responses.items():
+            question_id, variant_id = split_prompt_id(prompt_id)
+            if variant_id is not None:
+                by_variant.setdefault(variant_id, {}).setdefault(model, {})[question_id] = text
+    return by_variant
+
+def variant_robustness(variant_results: Dict[str, Dict[str, Dict[str, Dict]]]) -> Dict[str, Dict[str, Dict]]:
+    """
+    변형별 종합 결과(변형 ID -> 모델 -> 엔티티 -> 종합 결과)를 모델/엔티티별 변형 간 분산으로 요약
+    stance_agreement는 가장 많은 변형이 낸 입장의 비율 (1.0 = 모든 변형에서 같은 입장)
+    """
+    collected: Dict[str, Dict[str, List[Tuple[str, float, str]]]] = {}
+    for variant_id, model_results in variant_results.items():
+        for model, entity_results in model_results.items():
+            for entity, result in entity_results.items():
+                if result['target_found']:
+                    collected.setdefault(model, {}).setdefault(entity, []).append(
+                        (variant_id, result['overall_bias_score'], result['overall_stance'])
+                    )
+    
+    summary: Dict[str, Dict[str, Dict]] = {}
+    for model, entities in collected.items():
+        for entity, rows in entities.items():
+            scores = np.array([score for _, score, _ in rows], dtype=float)
+            stances = [stance for _, _, stance in rows]
+            summary.setdefault(model, {})[entity] = {
+                'variants': len(rows),
+                'mean_bias_score': float(scores.mean()),
+                'std_bias_score': float(scores.std()),
+                'min_bias_score': float(scores.min()),
+                'max_bias_score': float(scores.max()),
+                'stance_agreement': max(stances.count(stance) for stance in set(stances)) / len(stances),
+                'most_negative_variant': rows[int(scores.argmin())][0],
+                'most_positive_variant': rows[int(scores.argmax())][0]
+            }
+    return summary
@@ -0,0 +1,341 @@
+import json
+import os
+import re
+import socket
+import sqlite3
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+@dataclass
+class QueueTask:
+    """큐에서 임대(lease)한 작업 1건"""
+    task_id: str
+    payload: Dict
+    attempts: int
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+class WorkQueue:
+    """
+    작업 큐 공통 인터페이스
+    작업은 임대 후 complete/fail로 종료하며, 임대 기한이 지난 작업(워커 중단)은 다시 대기열로 돌아감
+    임대 기한은 임대한 워커가 정하고 renew로 연장하며, 기한이 지나 다른 워커에 재배정된 작업의
+    complete/fail/renew는 아무것도 바꾸지 않고 False를 반환
+    fail된 작업은 max_attempts까지 지수 백오프로 재시도 후 failed 상태가 됨
+    """
+    
+    def enqueue(self, payload: Dict, max_attempts: int = 3) -> str:
+        raise NotImplementedError
+    
+    def enqueue_many(self, payloads: Iterable[Dict], max_attempts: int = 3) -> List[str]:
+        return [self.enqueue(payload, max_attempts) for payload in payloads]
+    
+    def lease(self, worker_id: str, lease_seconds: float = 600.0) -> Optional[QueueTask]:
+        """대기 중인 작업 1건 임대 (없으면 None)"""
+        raise NotImplementedError
+    
+    def renew(self, task: QueueTask, worker_id: str, lease_seconds: float = 600.0) -> bool:
+        """임대 기한을 지금부터 lease_seconds로 연장 (하트비트)"""
+        raise NotImplementedError
+    
+    def complete(self, task: QueueTask, worker_id: str) -> bool:
+        raise NotImplementedError
+    
+    def fail(self, task: QueueTask, worker_id: str, error: str, retry_delay: float = 5.0) -> bool:
+        raise NotImplementedError
+    
+    def stats(self) -> Dict[str, int]:
+        """상태별 작업 수 (queued/leased/done/failed)"""
+        raise NotImplementedError
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status
+    ON tasks (status, available_at);
+"""
+
+class SQLiteWorkQueue(WorkQueue):
+    """
+    SQLite 기반 작업 큐 (같은 머신 또는 잠금을 지원하는 공유 파일시스템용)
+    BEGIN IMMEDIATE 트랜잭션으로 임대를 원자적으로 처리
+    
+    기본 저널 모드는 DELETE(롤백 저널)로, 파일 잠금만으로 동작하므로 NFS 등 네트워크 파일시스템에서도 사용 가능
+    WAL은 공유 메모리 인덱스가 필요해 네트워크 파일시스템에서는 DB가 손상될 수 있으므로
+    모든 워커가 한 머신에서 실행될 때만 journal_mode='WAL'로 지정
+    """
+    
+    def __init__(self, db_path: str = "work_queue.db", timeout: float = 30.0, journal_mode: str = 'DELETE'):
+        if journal_mode.upper() not in ('DELETE', 'TRUNCATE', 'PERSIST', 'WAL'):
+            raise ValueError(f"지원하지 않는 저널 모드: {journal_mode}")
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute(f"PRAGMA journal_mode={journal_mode.upper()}")
+        self.conn.executescript(SCHEMA)
+    
+    def close(self):
+        self.conn.close()
+    
+    def enqueue(self, payload: Dict, max_attempts: int = 3) -> str:
+        return self.enqueue_many([payload], max_attempts)[0]
+    
+    def enqueue_many(self, payloads: Iterable[Dict], max_attempts: int = 3) -> List[str]:
+        now = time.time()
+        task_ids = []
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for payload in payloads:
+                cursor = self.conn.execute(
+                    "INSERT INTO tasks (payload, status, max_attempts, available_at, created_at, updated_at) "
+                    "VALUES (?, 'queued', ?, ?, ?, ?)",
+                    (json.dumps(payload, ensure_ascii=False), max_attempts, now, now, now)
+                )
+                task_ids.append(str(cursor.lastrowid))
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return task_ids
+    
+    def lease(self, worker_id: str, lease_seconds: float = 600.0) -> Optional[QueueTask]:
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 재시도 횟수를 다 쓴 채 임대가 만료된 작업은 실패 처리
+            self.conn.execute(
+                "UPDATE tasks SET status = 'failed', error = 'lease expired', updated_at = ? "
+                "WHERE status = 'leased' AND lease_expires <= ? AND attempts >= max_attempts",
+                (now, now)
+            )
+            row = self.conn.execute(
+                "SELECT task_id, payload, attempts FROM tasks "
+                "WHERE (status = 'queued' AND available_at <= ?) OR (status = 'leased' AND lease_expires <= ?) "
+                "ORDER BY task_id LIMIT 1",
+                (now, now)
+            ).fetchone()
+            if row is not None:
+                self.conn.execute(
+                    "UPDATE tasks SET status = 'leased', attempts = attempts + 1, lease_owner = ?, "
+                    "lease_expires = ?, updated_at = ? WHERE task_id = ?",
+                    (worker_id, now + lease_seconds, now, row['task_id'])
+                )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        
+        if row is None:
+            return None
+        return QueueTask(str(row['task_id']), json.loads(row['payload']), row['attempts'] + 1)
+    
+    # 임대 소유 조건 (같은 워커가 만료 후 다시 임대한 경우도 구분하도록 시도 횟수까지 비교)
+    OWNED = "task_id = ? AND lease_owner = ? AND attempts = ? AND status = 'leased'"
+    
+    def _owned(self, task: QueueTask, worker_id: str) -> tuple:
+        return int(task.task_id), worker_id, task.attempts
+    
+    def renew(self, task: QueueTask, worker_id: str, lease_seconds: float = 600.0) -> bool:
+        now = time.time()
+        cursor = self.conn.execute(
+            f"UPDATE tasks SET lease_expires = ?, updated_at = ? WHERE {self.OWNED}",
+            (now + lease_seconds, now) + self._owned(task, worker_id)
+        )
+        return cursor.rowcount == 1
+    
+    def complete(self, task: QueueTask, worker_id: str) -> bool:
+        cursor = self.conn.execute(
+            f"UPDATE tasks SET status = 'done', error = NULL, updated_at = ? WHERE {self.OWNED}",
+            (time.time(),) + self._owned(task, worker_id)
+        )
+        return cursor.rowcount == 1
+    
+    def fail(self, task: QueueTask, worker_id: str, error: str, retry_delay: float = 5.0) -> bool:
+        now = time.time()
+        cursor = self.conn.execute(
+            "UPDATE tasks SET status = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END, "
+            f"available_at = ?, error = ?, updated_at = ? WHERE {self.OWNED}",
+            (now + retry_delay * 2 ** (task.attempts - 1), error, now) + self._owned(task, worker_id)
+        )
+        return cursor.rowcount == 1
+    
+    def stats(self) -> Dict[str, int]:
+        counts = {'queued': 0, 'leased': 0, 'done': 0, 'failed': 0}
+        for row in self.conn.execute("SELECT status, COUNT(*) AS n FROM tasks GROUP BY status"):
+            counts[row['status']] = row['n']
+        return counts
+    
+    def failed_tasks(self) -> List[Dict]:
+        rows = self.conn.execute(
+            "SELECT task_id, attempts, error FROM tasks WHERE status = 'failed' ORDER BY task_id"
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+class FileWorkQueue(WorkQueue):
+    """
+    파일시스템 기반 작업 큐 (여러 노드가 공유 디렉터리를 마운트해 사용)
+    
+    임대 파일 이름에 시도 횟수와 워커 ID를 넣어(leased/<작업 ID>.<시도>.<워커>.json) 소유권을 rename에 포함
+    queued/ -> tmp/ 원자적 rename으로 한 작업은 한 워커만 가져가고, complete/fail/임대 회수도
+    자기 임대 파일을 먼저 rename해야 진행하므로 기한이 지나 회수된 작업을 원래 워커가 덮어쓰지 않음
+    임대 기한은 임대 파일 수정 시각 + 레코드의 lease_seconds(임대한 워커가 지정)로 판단하고 renew는 수정 시각만 갱신
+    """
+    
+    STATES = ('queued', 'leased', 'done', 'failed')
+    
+    def __init__(self, root: str = "work_queue"):
+        self.root = root
+        for state in self.STATES + ('tmp',):
+            os.makedirs(os.path.join(root, state), exist_ok=True)
+    
+    def _path(self, state: str, task_id: str) -> str:
+        return os.path.join(self.root, state, f"{task_id}.json")
+    
+    def _lease_name(self, task_id: str, attempts: int, worker_id: str) -> str:
+        owner = re.sub(r'[^\w.-]', '_', worker_id)
+        return f"{task_id}.{attempts}.{owner}.json"
+    
+    def _leased_path(self, task: QueueTask, worker_id: str) -> str:
+        return os.path.join(self.root, 'leased', self._lease_name(task.task_id, task.attempts, worker_id))
+    
+    def _claim(self, path: str) -> Optional[str]:
+        """파일을 tmp/로 옮겨 독점 (다른 워커가 먼저 옮겼으면 None)"""
+        claimed_path = os.path.join(self.root, 'tmp', os.path.basename(path))
+        try:
+            os.rename(path, claimed_path)
+        except FileNotFoundError:
+            return None
+        return claimed_path
+    
+    def _move(self, claimed_path: str, record: Dict, path: str):
+        """독점한 파일의 레코드를 갱신해 목적지로 이동"""
+        self._write(path, record)
+        os.remove(claimed_path)
+    
+    def _read(self, path: str) -> Dict:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _write(self, path: str, record: Dict):
+        tmp_path = os.path.join(self.root, 'tmp', f"{uuid.uuid4().hex}.json")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    
+    def enqueue(self, payload: Dict, max_attempts: int = 3) -> str:
+        # 시각 기반 접두어로 파일명 정렬 = 대략적인 제출 순서
+        task_id = f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+        self._write(self._path('queued', task_id), {
+            'payload': payload, 'attempts': 0, 'max_attempts': max_attempts,
+            'available_at': time.time(), 'lease_owner': None, 'lease_seconds': None, 'error': None
+        })
+        return task_id
+    
+    def _recover_expired(self):
+        """임대 기한이 지난 작업을 대기열(또는 재시도 소진 시 실패)로 되돌림"""
+        now = time.time()
+        leased_dir = os.path.join(self.root, 'leased')
+        for name in os.listdir(leased_dir):
+            path = os.path.join(leased_dir, name)
+            try:
+                if os.path.getmtime(path) + self._read(path)['lease_seconds'] > now:
+                    continue
+            except (FileNotFoundError, json.JSONDecodeError):
+                continue
+            claimed_path = self._claim(path)
+            if claimed_path is None:
+                # 원래 워커가 그 사이 완료/실패 처리함
+                continue
+            record = self._read(claimed_path)
+            state = 'queued' if record['attempts'] < record['max_attempts'] else 'failed'
+            if state == 'failed':
+                record['error'] = 'lease expired'
+            record['lease_owner'] = None
+            self._move(claimed_path, record, self._path(state, name.split('.', 1)[0]))
+    
+    def lease(self, worker_id: str, lease_seconds: float = 600.0) -> Optional[QueueTask]:
+        self._recover_expired()
+        now = time.time()
+        queued_dir = os.path.join(self.root, 'queued')
+        for name in sorted(os.listdir(queued_dir)):
+            task_id = name[:-len('.json')]
+            path = os.path.join(queued_dir, name)
+            try:
+                if self._read(path)['available_at'] > now:
+                    continue
+            except (FileNotFoundError, json.JSONDecodeError):
+                continue
+            claimed_path = self._claim(path)
+            if claimed_path is None:
+                # 다른 워커가 먼저 가져감
+                continue
+            
+            record = self._read(claimed_path)
+            record['attempts'] += 1
+            record['lease_owner'] = worker_id
+            record['lease_seconds'] = lease_seconds
+            leased_path = os.path.join(self.root, 'leased', self._lease_name(task_id, record['attempts'], worker_id))
+            self._move(claimed_path, record, leased_path)
+            return QueueTask(task_id, record['payload'], record['attempts'])
+        return None
+    
+    def renew(self, task: QueueTask, worker_id: str, lease_seconds: float = 600.0) -> bool:
+        # 만료 시각 = 수정 시각 + 레코드의 lease_seconds 이므로 수정 시각을 옮겨 연장 (레코드는 다시 쓰지 않음)
+        path = self._leased_path(task, worker_id)
+        try:
+            now = time.time()
+            mtime = now + lease_seconds - self._read(path)['lease_seconds']
+            os.utime(path, (now, mtime))
+        except FileNotFoundError:
+            return False
+        return True
+    
+    def complete(self, task: QueueTask, worker_id: str) -> bool:
+        try:
+            os.rename(self._leased_path(task, worker_id), self._path('done', task.task_id))
+        except FileNotFoundError:
+            return False
+        return True
+    
+    def fail(self, task: QueueTask, worker_id: str, error: str, retry_delay: float = 5.0) -> bool:
+        claimed_path = self._claim(self._leased_path(task, worker_id))
+        if claimed_path is None:
+            return False
+        record = self._read(claimed_path)
+        record['error'] = error
+        record['lease_owner'] = None
+        record['available_at'] = time.time() + retry_delay * 2 ** (record['attempts'] - 1)
+        state = 'queued' if record['attempts'] < record['max_attempts'] else 'failed'
+        self._move(claimed_path, record, self._path(state, task.task_id))
+        return True
+    
+    def stats(self) -> Dict[str, int]:
+        return {state: len(os.listdir(os.path.join(self.root, state))) for state in self.STATES}
+    
+    def failed_tasks(self) -> List[Dict]:
+        failed_dir = os.path.join(self.root, 'failed')
+        tasks = []
+        for name in sorted(os.listdir(failed_dir)):
+            record = self._read(os.path.join(failed_dir, name))
+            tasks.append({'task_id': name[:-len('.json')], 'attempts': record['attempts'], 'error': record['error']})
+        return tasks
+
+def open_queue(spec: str) -> WorkQueue:
+    """큐 지정 문자열로 큐 열기 (.db/.sqlite 파일이면 SQLite, 그 외는 디렉터리 기반)"""
+    if spec.endswith(('.db', '.sqlite', '.sqlite3')):
+        return SQLiteWorkQueue(spec)
+    return FileWorkQueue(spec)
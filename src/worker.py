@@ -0,0 +1,122 @@
+import os
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from src.io_utils import write_json
+from src.profiling import get_profiler
+from src.work_queue import QueueTask, WorkQueue, default_worker_id
+
+def make_analysis_batches(response_store: Dict[str, Dict[str, str]], batch_size: int = 64,
+                          question_ids: Optional[Iterable[str]] = None) -> List[Dict]:
+    """응답 저장소(모델 -> 질문 ID -> 응답)를 큐 작업 페이로드 목록으로 분할"""
+    allowed = set(question_ids) if question_ids is not None else None
+    items = [
+        [model, question_id, text]
+        for model, responses in sorted(response_store.items())
+        for question_id, text in sorted(responses.items())
+        if allowed is None or question_id in allowed
+    ]
+    return [{'items': items[i:i + batch_size]} for i in range(0, len(items), batch_size)]
+
+class AnalysisWorker:
+    """
+    큐 기반 분석 워커
+    분석기는 워커당 1회만 생성해 여러 배치를 처리하고, 배치별 질문 분석 결과
+    (모델 -> 질문 ID -> 엔티티 -> 결과)를 결과 디렉터리에 작업 ID 이름으로 저장 (재시도 시 덮어쓰기)
+    """
+    
+    def __init__(self, queue: WorkQueue, results_dir: str, analyzer_factory: Callable,
+                 entity_names: Optional[List[str]] = None, worker_id: str = None,
+                 lease_seconds: float = 600.0, retry_delay: float = 5.0, profiler=None):
+        self.queue = queue
+        self.results_dir = results_dir
+        self.analyzer_factory = analyzer_factory
+        self.entity_names = entity_names
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.retry_delay = retry_delay
+        self.profiler = profiler or get_profiler()
+        self._analyzer = None
+        self.processed = 0
+        self.failed = 0
+        os.makedirs(results_dir, exist_ok=True)
+    
+    @property
+    def analyzer(self):
+        """분석기 (첫 배치에서 1회 생성 후 재사용)"""
+        if self._analyzer is None:
+            self._analyzer = self.analyzer_factory()
+        return self._analyzer
+    
+    def result_path(self, task: QueueTask) -> str:
+        return os.path.join(self.results_dir, f"{task.task_id}.json")
+    
+    def process(self, task: QueueTask) -> Dict[str, Dict[str, Dict]]:
+        """작업 1건 분석 후 결과 파일 저장"""
+        items: List[Tuple[str, str, str]] = task.payload['items']
+        with self.profiler.stage('worker.batch', items=len(items)):
+            results = self.analyzer.analyze_batch([text for _, _, text in items], self.entity_names)
+        
+        question_results: Dict[str, Dict[str, Dict]] = {}
+        for (model, question_id, _), result in zip(items, results):
+            question_results.setdefault(model, {})[question_id] = result
+        write_json(self.result_path(task), question_results)
+        return question_results
+    
+    @contextmanager
+    def _heartbeat(self, task: QueueTask):
+        """처리하는 동안 lease_seconds/3 간격으로 임대 연장 (느린 배치가 다른 워커에 재배정되지 않도록)"""
+        stop = threading.Event()
+        
+        def renew():
+            while not stop.wait(self.lease_seconds / 3):
+                if not self.queue.renew(task, self.worker_id, self.lease_seconds):
+                    return
+        
+        thread = threading.Thread(target=renew, name=f"heartbeat-{task.task_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+    
+    def run_once(self) -> bool:
+        """작업 1건 처리 (처리할 작업이 없으면 False)"""
+        task = self.queue.lease(self.worker_id, self.lease_seconds)
+        if task is None:
+            return False
+        try:
+            with self._heartbeat(task):
+                self.process(task)
+        except Exception:
+            self.failed += 1
+            error = traceback.format_exc()
+            print(f"[{self.worker_id}] 작업 {task.task_id} 실패 (시도 {task.attempts}회)\n{error}")
+            owned = self.queue.fail(task, self.worker_id, error, self.retry_delay)
+        else:
+            self.processed += 1
+            owned = self.queue.complete(task, self.worker_id)
+        if not owned:
+            print(f"경고: [{self.worker_id}] 작업 {task.task_id}의 임대가 만료되어 다른 워커에 재배정됨 (상태 변경 없음)")
+        return True
+    
+    def run(self, max_batches: int = None, wait: bool = False, poll_interval: float = 5.0) -> Dict[str, int]:
+        """
+        큐가 빌 때까지(wait=True면 계속 대기하며) 배치 처리
+        재시도 대기 중인 작업이 남아 있으면 큐가 비어도 대기
+        """
+        start = time.perf_counter()
+        while max_batches is None or self.processed + self.failed < max_batches:
+            if self.run_once():
+                continue
+            stats = self.queue.stats()
+            if not wait and stats['queued'] == 0 and stats['leased'] == 0:
+                break
+            time.sleep(poll_interval)
+        
+        elapsed = time.perf_counter() - start
+        print(f"[{self.worker_id}] 완료 {self.processed}건, 실패 {self.failed}건, {elapsed:.1f}s")
+        return {'processed': self.processed, 'failed': self.failed}
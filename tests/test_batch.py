@@ -0,0 +1,107 @@
+import os
+import threading
+import pytest
+from src.batch import (AnthropicBatchBackend, BatchJob, BatchRunner, BatchTimeoutError, LocalBatchBackend,
+                       OpenAIBatchBackend, make_batch_jobs)
+from src.llm_clients import LLMResponse, LLMResponseCollector
+
+def echo_handler(job):
+    return LLMResponse(text=f"{job.client_name}:{job.prompt}", provider="local", model=job.model or "echo")
+
+def test_make_batch_jobs_covers_every_client_and_prompt():
+    jobs = make_batch_jobs({'q1': "first", 'q2': "second"}, ['A', 'B'], models={'B': 'model-b'})
+    assert [(job.client_name, job.prompt_id) for job in jobs] == [('A', 'q1'), ('A', 'q2'), ('B', 'q1'), ('B', 'q2')]
+    assert jobs[2].model == 'model-b'
+    assert len({job.custom_id for job in jobs}) == 4
+
+def test_temperature_defaults_match_sync_clients():
+    job = BatchJob('A', 'q1', "prompt")
+    assert OpenAIBatchBackend("key").format_request(job)["body"]["temperature"] == 0.7
+    assert "temperature" not in AnthropicBatchBackend("key").format_request(job)["params"]
+    
+    job = BatchJob('A', 'q1', "prompt", temperature=0.2)
+    assert OpenAIBatchBackend("key").format_request(job)["body"]["temperature"] == 0.2
+    assert AnthropicBatchBackend("key").format_request(job)["params"]["temperature"] == 0.2
+
+def test_local_backend_round_trip(tmp_path):
+    backend = LocalBatchBackend(handler=echo_handler, work_dir=str(tmp_path / "jobs"))
+    jobs = make_batch_jobs({'q1': "first", 'q2': "second"}, ['A'])
+    results = BatchRunner({'A': backend}, poll_interval=0.01, timeout=5).run(jobs)
+    
+    assert {job.custom_id: results[job.custom_id].text for job in jobs} == {
+        jobs[0].custom_id: "A:first", jobs[1].custom_id: "A:second"
+    }
+    assert all(name.endswith(".jsonl") for name in os.listdir(tmp_path / "jobs"))
+
+def test_local_backend_without_work_dir_uses_temp_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    backend = LocalBatchBackend(handler=echo_handler)
+    BatchRunner({'A': backend}, poll_interval=0.01, timeout=5).run(make_batch_jobs({'q1': "first"}, ['A']))
+    assert os.listdir(tmp_path) == []
+    assert os.path.isdir(backend.work_dir)
+
+def test_runner_splits_by_max_batch_size(tmp_path):
+    backend = LocalBatchBackend(handler=echo_handler, work_dir=str(tmp_path))
+    backend.max_batch_size = 2
+    runner = BatchRunner({'A': backend, 'B': backend}, poll_interval=0.01, timeout=5)
+    jobs = make_batch_jobs({f"q{i}": f"prompt {i}" for i in range(5)}, ['A', 'B'])
+    
+    submitted = runner.submit(jobs)
+    assert {name: len(batch_ids) for name, batch_ids in submitted.items()} == {'A': 3, 'B': 3}
+    results = runner.wait(submitted)
+    assert set(results) == {job.custom_id for job in jobs}
+
+def test_runner_rejects_duplicate_jobs(tmp_path):
+    backend = LocalBatchBackend(handler=echo_handler, work_dir=str(tmp_path))
+    jobs = [BatchJob('A', 'q1', "first"), BatchJob('A', 'q1', "first again")]
+    with pytest.raises(ValueError):
+        BatchRunner({'A': backend}).submit(jobs)
+
+def test_failed_local_batch_is_reported_and_skipped(tmp_path):
+    def failing_handler(job):
+        raise RuntimeError("boom")
+    
+    backend = LocalBatchBackend(handler=failing_handler, work_dir=str(tmp_path))
+    results = BatchRunner({'A': backend}, poll_interval=0.01, timeout=5).run(make_batch_jobs({'q1': "first"}, ['A']))
+    assert results == {}
+
+def test_runner_timeout_keeps_completed_results(tmp_path):
+    release = threading.Event()
+    
+    def blocking_handler(job):
+        release.wait(5)
+        return echo_handler(job)
+    
+    fast = LocalBatchBackend(handler=echo_handler, work_dir=str(tmp_path))
+    slow = LocalBatchBackend(handler=blocking_handler, work_dir=str(tmp_path))
+    runner = BatchRunner({'A': fast, 'B': slow}, poll_interval=0.01, timeout=0.5)
+    jobs = make_batch_jobs({'q1': "first"}, ['A', 'B'])
+    try:
+        with pytest.raises(BatchTimeoutError) as excinfo:
+            runner.run(jobs)
+    finally:
+        release.set()
+    assert isinstance(excinfo.value, TimeoutError)
+    assert {custom_id: result.text for custom_id, result in excinfo.value.completed.items()} == {
+        jobs[0].custom_id: "A:first"
+    }
+    assert excinfo.value.pending_jobs == [jobs[1]]
+    assert "B/q1" in str(excinfo.value) and "A/q1" not in str(excinfo.value)
+
+def test_collector_merges_completed_results_before_timeout(tmp_path):
+    release = threading.Event()
+    
+    def blocking_handler(job):
+        release.wait(5)
+        return echo_handler(job)
+    
+    collector = LLMResponseCollector()
+    backends = {'A': LocalBatchBackend(handler=echo_handler, work_dir=str(tmp_path)),
+                'B': LocalBatchBackend(handler=blocking_handler, work_dir=str(tmp_path))}
+    try:
+        with pytest.raises(BatchTimeoutError):
+            collector.run_batch(make_batch_jobs({'q1': "first"}, ['A', 'B']), backends=backends,
+                                poll_interval=0.01, timeout=0.5)
+    finally:
+        release.set()
+    assert collector.response_store == {'A': {'q1': "A:first"}}
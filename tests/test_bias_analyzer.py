@@ -0,0 +1,24 @@
+import pytest
+from src.bias_analyzer import BiasAnalyzer
+from src.question_bank import load_question_bank
+
+@pytest.fixture
+def analyzer():
+    return BiasAnalyzer(multilingual=False)
+
+def test_registry_is_loaded_lazily():
+    analyzer = BiasAnalyzer(multilingual=False)
+    assert analyzer._entity_registry is None
+    assert analyzer.entity_registry is load_question_bank().entity_registry
+
+def test_target_entities_follow_registry(analyzer):
+    assert set(analyzer.target_entities) == set(load_question_bank().entity_ids)
+    with pytest.raises(TypeError):
+        analyzer.target_entities['japan'] = ['Japan']
+
+def test_assigning_target_entities_changes_detection(analyzer):
+    analyzer.target_entities = {'japan': ['Japan', 'Tokyo']}
+    assert analyzer.find_target_entities("Tokyo is a large city.") == {'japan'}
+    assert analyzer.find_target_entities("China is a large country.") == set()
+    # 공유 질문 은행 레지스트리는 바뀌지 않음
+    assert 'japan' not in load_question_bank().entity_ids
@@ -0,0 +1,87 @@
+import argparse
+import json
+import pytest
+from src.cli import in_shard, main, merge_stores, parse_shard, shard_of
+from src.question_bank import load_question_bank
+
+def test_parse_shard():
+    assert parse_shard(None) == (0, 1)
+    assert parse_shard("2/4") == (2, 4)
+    for value in ("4/4", "-1/4", "1/0", "1-4"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_shard(value)
+
+def test_shards_partition_work_deterministically():
+    keys = [(f"model{m}", f"q{q}") for m in range(5) for q in range(40)]
+    for model, question_id in keys:
+        assert shard_of(model, question_id, 4) == shard_of(model, question_id, 4)
+        assert sum(in_shard(model, question_id, (i, 4)) for i in range(4)) == 1
+    assert all(in_shard(model, question_id, (0, 1)) for model, question_id in keys)
+    assert len({shard_of(model, question_id, 4) for model, question_id in keys}) == 4
+
+def test_merge_stores():
+    merged = merge_stores([{'gpt': {'q1': "a"}}, {'gpt': {'q2': "b"}, 'claude': {'q1': "c"}}, {'gpt': {'q1': "a"}}])
+    assert merged == {'gpt': {'q1': "a", 'q2': "b"}, 'claude': {'q1': "c"}}
+    with pytest.raises(ValueError):
+        merge_stores([{'gpt': {'q1': "a"}}, {'gpt': {'q1': "different"}}])
+
+def test_sharded_analyze_matches_single_run(tmp_path):
+    question_ids = sorted(load_question_bank().questions)[:4]
+    responses = {
+        model: {question_id: f"{model} thinks China is doing well on {question_id}." for question_id in question_ids}
+        for model in ('gpt', 'claude')
+    }
+    responses_path = tmp_path / "responses.json"
+    responses_path.write_text(json.dumps(responses), encoding='utf-8')
+    
+    full = tmp_path / "full.json"
+    assert main(['analyze', '--input', str(responses_path), '--output', str(full)]) == 0
+    shard_paths = []
+    for i in range(3):
+        shard_paths.append(str(tmp_path / f"shard{i}.json"))
+        assert main(['analyze', '--input', str(responses_path), '--output', shard_paths[-1],
+                     '--shard', f"{i}/3"]) == 0
+    merged = tmp_path / "merged.json"
+    assert main(['merge', '--input', *shard_paths, '--output', str(merged)]) == 0
+    full_results = json.loads(full.read_text(encoding='utf-8'))
+    assert {model: sorted(results) for model, results in full_results.items()} == {
+        'gpt': question_ids, 'claude': question_ids}
+    assert json.loads(merged.read_text(encoding='utf-8')) == full_results
+
+def test_near_duplicate_analyze_does_not_depend_on_chunking(tmp_path):
+    question_ids = sorted(load_question_bank().questions)[:2]
+    base = "thinks China has a long history, a large population, a growing economy and a complex political system"
+    responses = {
+        'gpt': {question_ids[0]: f"GPT {base} that is good.", question_ids[1]: f"GPT {base} that is bad."},
+        'claude': {question_ids[0]: f"Claude {base} overall.", question_ids[1]: "China is terrible."}
+    }
+    responses_path = tmp_path / "responses.json"
+    responses_path.write_text(json.dumps(responses), encoding='utf-8')
+    
+    outputs = []
+    for chunk_size in ("1", "64"):
+        outputs.append(tmp_path / f"chunk{chunk_size}.json")
+        assert main(['analyze', '--input', str(responses_path), '--output', str(outputs[-1]),
+                     '--near-duplicates', '0.5', '--chunk-size', chunk_size]) == 0
+    per_chunk, single = (json.loads(path.read_text(encoding='utf-8')) for path in outputs)
+    assert per_chunk == single
+    # 유사 중복은 대표(첫 응답)의 감정 점수를 공유
+    scores = {(model, question_id): result['china']['bias_score']
+              for model, results in single.items() for question_id, result in results.items()}
+    assert scores['gpt', question_ids[1]] == scores['gpt', question_ids[0]]
+
+def test_near_duplicates_rejected_for_sharded_analyze(tmp_path, capsys):
+    responses_path = tmp_path / "responses.json"
+    responses_path.write_text(json.dumps({'gpt': {}}), encoding='utf-8')
+    assert main(['analyze', '--input', str(responses_path), '--output', str(tmp_path / "out.json"),
+                 '--near-duplicates', '0.8', '--shard', "0/2"]) == 2
+    assert "--shard" in capsys.readouterr().err
+
+def test_merge_conflict_exits_with_error(tmp_path, capsys):
+    paths = []
+    for i, text in enumerate(("a", "b")):
+        path = tmp_path / f"part{i}.json"
+        path.write_text(json.dumps({'gpt': {'q1': text}}), encoding='utf-8')
+        paths.append(str(path))
+    assert main(['merge', '--input', *paths, '--output', str(tmp_path / "out.json")]) == 2
+    assert "샤드 출력 충돌" in capsys.readouterr().err
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from src.bias_analyzer import BiasAnalyzer
+from src.comparison import ModelComparisonEngine
+
+TEXT = "China has made remarkable progress in reducing poverty."
+
+@pytest.fixture
+def analyzer():
+    analyzer = BiasAnalyzer(multilingual=False)
+    analyzer.target_entities = {'china': ['China'], 'usa': ['United States', 'USA']}
+    return analyzer
+
+def test_default_factory_forwards_settings():
+    analyzer = BiasAnalyzer(multilingual=False, max_length=64, long_text='chunk', chunk_overlap=8, num_threads=2,
+                            idle_unload_seconds=30, scoring_backend='transformer',
+                            stance_label_map={'LABEL_0': 'negative', 'LABEL_2': 'positive'})
+    worker_analyzer = ModelComparisonEngine(analyzer, workers=2)._default_factory()()
+    for name in ('model_name', 'use_gpu', 'multilingual', 'scoring_backend', 'stance_model', 'max_length',
+                 'long_text', 'chunk_overlap', 'num_threads', 'idle_unload_seconds', 'stance_label_map'):
+        assert getattr(worker_analyzer, name) == getattr(analyzer, name), name
+    assert worker_analyzer.entity_registry is analyzer.entity_registry
+
+def test_identical_texts_are_analyzed_once(analyzer):
+    comparison = analyzer.compare_models({'a': TEXT, 'b': TEXT, 'c': "The USA is a large country."})
+    assert comparison.unique_texts == 2
+    assert comparison.model_names == ['a', 'b', 'c']
+    assert comparison.found_matrix.tolist() == [[True, False], [True, False], [False, True]]
+    assert np.isnan(comparison.score_matrix[0, 1])
+    assert comparison.entity_scores('china').keys() == {'a', 'b'}
+
+def test_shared_results_do_not_share_nested_objects(analyzer):
+    results = analyzer.compare_models({'a': TEXT, 'b': TEXT}).results
+    assert results['a'] == results['b']
+    results['a']['china']['sentiment_scores']['vader_compound'] = 99
+    assert results['b']['china']['sentiment_scores']['vader_compound'] != 99
+
+def test_entity_results_copy_mentions(analyzer):
+    entities = [{'text': 'China', 'label': 'GPE', 'start': 0, 'end': 5}]
+    sentiment_scores = {'vader_compound': 0.5}
+    first = analyzer.build_entity_result(True, 0.5, sentiment_scores, entities)
+    second = analyzer.build_entity_result(True, 0.5, sentiment_scores, entities)
+    first['entities'][0]['text'] = 'changed'
+    assert second['entities'][0]['text'] == 'China' and entities[0]['text'] == 'China'
+    assert first['sentiment_scores'] is not second['sentiment_scores']
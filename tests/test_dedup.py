@@ -0,0 +1,78 @@
+import zlib
+import pytest
+from src.bias_analyzer import BiasAnalyzer
+from src.dedup import ResponseDeduplicator, shingles
+
+BASE = ("is a large country with a long history and a growing economy that trades with many partners "
+        "across the world and invests heavily in new infrastructure projects every single year")
+
+def words(count, prefix="w"):
+    return [f"{prefix}{i}" for i in range(count)]
+
+def test_shingles():
+    assert shingles("A b c d", size=3) == {"a b c", "b c d"}
+    assert shingles("Only two", size=3) == {"only two"}
+
+def test_exact_duplicates_only_by_default():
+    groups = ResponseDeduplicator(threshold=None).group(["a", "b", "a", "a b"])
+    assert groups.assignments == [0, 1, 0, 2]
+    assert groups.representatives == [0, 1, 3]
+    assert groups.stats() == {'total': 4, 'groups': 3, 'exact_duplicates': 1, 'near_duplicates': 0}
+    assert groups.fan_out(['A', 'B', 'AB']) == ['A', 'B', 'A', 'AB']
+
+def test_near_duplicates_join_first_similar_representative():
+    text = " ".join(words(40))
+    near = " ".join(words(39) + ["changed"])
+    other = " ".join(words(40, prefix="x"))
+    groups = ResponseDeduplicator(threshold=0.8).group([text, other, near, near])
+    assert groups.assignments == [0, 1, 0, 0]
+    assert groups.stats()['near_duplicates'] == 1
+    assert groups.stats()['exact_duplicates'] == 1
+
+def test_no_chaining_through_intermediate_text():
+    a = words(30)
+    b = a[:25] + words(5, prefix="b")
+    c = words(5, prefix="c") + b[5:]
+    deduplicator = ResponseDeduplicator(threshold=0.6)
+    groups = deduplicator.group([" ".join(a), " ".join(b), " ".join(c)])
+    # b는 a, c와 각각 유사하지만 a와 c는 유사하지 않으므로 a와 c는 다른 그룹
+    assert groups.assignments[0] == groups.assignments[1]
+    assert groups.assignments[2] != groups.assignments[0]
+
+def test_signature_matches_exact_integer_minhash():
+    deduplicator = ResponseDeduplicator()
+    text = "China is growing fast and the economy is strong"
+    signature = deduplicator.signature(text)
+    # 파이썬 정수(임의 정밀도)로 계산한 MinHash와 같아야 함 (uint64 넘침 없음)
+    hashes = [zlib.crc32(s.encode('utf-8')) for s in shingles(text)]
+    expected = [
+        min(((int(a) * h + int(b)) % ((1 << 61) - 1)) & 0xFFFFFFFF for h in hashes)
+        for a, b in zip(deduplicator._a, deduplicator._b)
+    ]
+    assert signature.tolist() == expected
+    assert signature[:6].tolist() == [445566985, 176544949, 506277498, 85099669, 552180276, 28874057]
+
+def test_invalid_band_configuration():
+    with pytest.raises(ValueError):
+        ResponseDeduplicator(threshold=0.8, num_perm=100, bands=16)
+
+def test_near_duplicates_naming_different_entities_keep_their_own_targets():
+    texts = [f"China {BASE}.", f"Russia {BASE}."]
+    deduplicator = ResponseDeduplicator(threshold=0.7)
+    assert deduplicator.group(texts).stats()['near_duplicates'] == 1
+    
+    analyzer = BiasAnalyzer(multilingual=False, deduplicator=deduplicator)
+    china, russia = analyzer.analyze_batch(texts, ['china', 'russia'])
+    assert china['china']['target_found'] and not china['russia']['target_found']
+    assert russia['russia']['target_found'] and not russia['china']['target_found']
+    # 엔티티 무관 분석 결과(감정 점수)는 그룹 대표와 공유
+    assert china['china']['sentiment_scores'] == russia['russia']['sentiment_scores']
+    assert china['china']['sentiment_scores'] is not russia['russia']['sentiment_scores']
+
+def test_member_with_target_is_analyzed_even_if_representative_has_none():
+    texts = [f"Atlantis {BASE}.", f"China {BASE}."]
+    analyzer = BiasAnalyzer(multilingual=False, deduplicator=ResponseDeduplicator(threshold=0.7))
+    first, second = analyzer.analyze_batch(texts, ['china'])
+    assert not first['china']['target_found']
+    assert second['china']['target_found']
+    assert second['china']['sentiment_scores'] is not None
@@ -0,0 +1,51 @@
+import threading
+import time
+from src.jobs import BackgroundJobManager
+
+def wait_for(manager, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while manager.is_active(job_id) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return manager.get(job_id)
+
+def test_job_reports_progress_and_result():
+    release = threading.Event()
+    
+    def job(count, progress):
+        for i in range(count):
+            progress(i + 1, count, f"step {i + 1}")
+        release.wait(5)
+        return count * 2
+    
+    manager = BackgroundJobManager()
+    job_id = manager.submit("analysis", job, 3)
+    deadline = time.monotonic() + 5
+    while manager.get(job_id)['done'] < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    running = manager.get(job_id)
+    assert running['status'] == 'running' and running['total'] == 3 and running['message'] == "step 3"
+    
+    release.set()
+    finished = wait_for(manager, job_id)
+    assert finished['status'] == 'completed' and finished['result'] == 6
+    assert finished['finished_at'] is not None
+
+def test_failed_job_keeps_error():
+    def job(progress):
+        raise RuntimeError("model missing")
+    
+    manager = BackgroundJobManager()
+    job_id = manager.submit("broken", job)
+    failed = wait_for(manager, job_id)
+    assert failed['status'] == 'failed' and failed['error'] == "model missing"
+    assert manager.get("unknown") is None
+
+def test_status_is_a_copy_and_jobs_are_listed_newest_first():
+    manager = BackgroundJobManager()
+    first = manager.submit("first", lambda progress: 1)
+    wait_for(manager, first)
+    second = manager.submit("second", lambda progress: 2)
+    wait_for(manager, second)
+    manager.get(first)['status'] = 'changed'
+    assert manager.get(first)['status'] == 'completed'
+    assert [job['id'] for job in manager.list_jobs()] == [second, first]
@@ -0,0 +1,142 @@
+from types import SimpleNamespace
+import pytest
+from src.llm_clients import LLMClient, LLMResponse, is_transient_error
+
+class RateLimitError(Exception):
+    pass
+
+class HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+class ScriptedClient(LLMClient):
+    """미리 정한 예외/응답을 순서대로 돌려주는 클라이언트"""
+    
+    provider = "fake"
+    default_model = "fake-model"
+    
+    def __init__(self, outcomes, **kwargs):
+        super().__init__(retry_backoff=0.0, **kwargs)
+        self.outcomes = list(outcomes)
+        self.calls = 0
+    
+    def _request(self, prompt, model, system_prompt=None, temperature=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return LLMResponse(text=outcome, provider=self.provider, model=model)
+
+@pytest.mark.parametrize("error, transient", [
+    (TimeoutError(), True),
+    (ConnectionError(), True),
+    (RateLimitError(), True),
+    (HTTPError(429), True),
+    (HTTPError(503), True),
+    (HTTPError(401), False),
+    (HTTPError(400), False),
+    (AttributeError("'NoneType' object has no attribute 'ChatCompletion'"), False),
+    (ValueError("bad request"), False),
+])
+def test_is_transient_error(error, transient):
+    assert is_transient_error(error) is transient
+
+def test_generate_retries_transient_errors():
+    client = ScriptedClient([RateLimitError(), HTTPError(502), "ok"], max_retries=2)
+    result = client.generate("prompt")
+    assert result.ok and result.text == "ok"
+    assert client.calls == 3 and result.retries == 2
+
+def test_generate_does_not_retry_permanent_errors():
+    client = ScriptedClient([HTTPError(401), "ok"], max_retries=2)
+    result = client.generate("prompt")
+    assert not result.ok
+    assert client.calls == 1 and result.retries == 0
+
+def test_latency_excludes_backoff_wait():
+    client = ScriptedClient([TimeoutError(), "ok"], max_retries=1)
+    client.retry_backoff = 0.2
+    result = client.generate("prompt")
+    assert result.ok
+    assert result.latency < 0.1
+    assert result.wall_time >= 0.2
+
+class AttrDict(dict):
+    __getattr__ = dict.__getitem__
+
+class FakeOpenAI:
+    """호출 인자를 기록하는 openai 모듈 대역"""
+    
+    def __init__(self):
+        self.calls = []
+        self.ChatCompletion = self
+    
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if kwargs.get('stream'):
+            return iter([AttrDict(choices=[AttrDict(delta={'content': "answer"}, finish_reason="stop")])])
+        message = AttrDict(content="answer")
+        return AttrDict(choices=[AttrDict(message=message, finish_reason="stop")],
+                        usage={'prompt_tokens': 3, 'completion_tokens': 5})
+
+def test_openai_compatible_clients_pass_credentials_per_call():
+    import openai
+    from src.llm_clients import DeepSeekClient, OpenAIClient
+    
+    before = (getattr(openai, 'api_key', None), getattr(openai, 'api_base', None))
+    gpt, deepseek = OpenAIClient("openai-key"), DeepSeekClient("deepseek-key")
+    assert (getattr(openai, 'api_key', None), getattr(openai, 'api_base', None)) == before
+    
+    fake = FakeOpenAI()
+    gpt.client = deepseek.client = fake
+    assert gpt.generate("q").text == "answer"
+    assert deepseek.generate("q").text == "answer"
+    assert fake.calls[0]['api_key'] == "openai-key" and 'api_base' not in fake.calls[0]
+    assert fake.calls[1]['api_key'] == "deepseek-key"
+    assert fake.calls[1]['api_base'] == "https://api.deepseek.com"
+
+class FakeClaudeStream:
+    text_stream = ["answer"]
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def get_final_message(self):
+        return AttrDict(usage=AttrDict(input_tokens=3, output_tokens=5), stop_reason="end_turn")
+
+class FakeClaude:
+    """messages.stream 호출 인자를 기록하는 anthropic 클라이언트 대역"""
+    
+    def __init__(self):
+        self.calls = []
+        self.messages = self
+    
+    def stream(self, **kwargs):
+        self.calls.append(kwargs)
+        return FakeClaudeStream()
+
+class FakeGemini:
+    def __init__(self):
+        self.calls = []
+    
+    def generate_content(self, prompt, **kwargs):
+        self.calls.append(dict(kwargs, prompt=prompt))
+        return iter([SimpleNamespace(text="answer")])
+
+def test_stream_forwards_system_prompt_and_temperature():
+    from src.llm_clients import ClaudeClient, GeminiClient, OpenAIClient
+    
+    gpt, claude, gemini = OpenAIClient("key"), ClaudeClient(), GeminiClient()
+    gpt.client, claude.client, gemini.client = FakeOpenAI(), FakeClaude(), FakeGemini()
+    for client in (gpt, claude, gemini):
+        assert "".join(client.stream("q", system_prompt="be brief", temperature=0.2)) == "answer"
+    
+    assert gpt.client.calls[0]['messages'][0] == {"role": "system", "content": "be brief"}
+    assert gpt.client.calls[0]['temperature'] == 0.2
+    assert claude.client.calls[0]['system'] == "be brief" and claude.client.calls[0]['temperature'] == 0.2
+    assert gemini.client.calls[0]['prompt'] == "be brief\n\nq"
+    assert gemini.client.calls[0]['generation_config'] == {'temperature': 0.2}
@@ -0,0 +1,115 @@
+from types import SimpleNamespace
+import numpy as np
+import pytest
+import torch
+import src.bias_analyzer as bias_analyzer_module
+from src.bias_analyzer import BiasAnalyzer
+from src.model_manager import ModelManager, model_memory_bytes
+
+CLS, SEP, PAD = 1, 2, 0
+
+class FakeTokenizer:
+    """단어 단위로 토큰화하는 작은 BERT 형식 토크나이저 ([CLS] ... [SEP])"""
+    
+    vocab_size = 64
+    
+    def num_special_tokens_to_add(self, pair=False):
+        return 2
+    
+    def __call__(self, texts, add_special_tokens=True):
+        input_ids = []
+        for text in texts:
+            ids = [sum(map(ord, word)) % (self.vocab_size - 3) + 3 for word in text.split()]
+            input_ids.append(self.build_inputs_with_special_tokens(ids) if add_special_tokens else ids)
+        return {'input_ids': input_ids}
+    
+    def build_inputs_with_special_tokens(self, ids):
+        return [CLS] + list(ids) + [SEP]
+    
+    def pad(self, encoded, return_tensors=None):
+        length = max(len(ids) for ids in encoded['input_ids'])
+        input_ids = [ids + [PAD] * (length - len(ids)) for ids in encoded['input_ids']]
+        attention_mask = [[1] * len(ids) + [0] * (length - len(ids)) for ids in encoded['input_ids']]
+        return {'input_ids': torch.tensor(input_ids), 'attention_mask': torch.tensor(attention_mask)}
+
+class FakeModel(torch.nn.Module):
+    """토큰 임베딩만 반환하는 작은 인코더 (last_hidden_state만 제공)"""
+    
+    def __init__(self, hidden_size=8):
+        super().__init__()
+        self.config = SimpleNamespace(hidden_size=hidden_size)
+        self.embeddings = torch.nn.Embedding(FakeTokenizer.vocab_size, hidden_size)
+    
+    def forward(self, input_ids, attention_mask=None):
+        return SimpleNamespace(last_hidden_state=self.embeddings(input_ids))
+
+@pytest.fixture(autouse=True)
+def fake_bert(monkeypatch):
+    # 사전학습 모델을 내려받지 않도록 로더가 쓰는 from_pretrained를 작은 가짜 모델로 교체
+    monkeypatch.setattr(bias_analyzer_module.AutoTokenizer, 'from_pretrained', lambda name: FakeTokenizer())
+    monkeypatch.setattr(bias_analyzer_module.AutoModel, 'from_pretrained', lambda name: FakeModel())
+
+@pytest.fixture
+def manager():
+    return ModelManager()
+
+def make_analyzer(manager, **kwargs):
+    return BiasAnalyzer(multilingual=False, model_manager=manager, **kwargs)
+
+def test_compatibility_attributes_follow_managed_model(manager):
+    analyzer = make_analyzer(manager)
+    assert analyzer.tokenizer is None and analyzer.model is None
+    analyzer._load_bert_model()
+    assert isinstance(analyzer.tokenizer, FakeTokenizer) and isinstance(analyzer.model, FakeModel)
+    assert manager.loaded_models() == [analyzer._bert]
+    analyzer.unload_models()
+    assert analyzer.tokenizer is None and analyzer.model is None
+    assert not manager.loaded_models()
+
+def test_memory_limit_unloads_least_recently_used():
+    # 모델 1개는 상한 안에 들어가지만 2개는 넘도록 상한 설정
+    manager = ModelManager(max_memory_mb=1.5 * model_memory_bytes(FakeModel()) / 1024 ** 2)
+    first, second = make_analyzer(manager), make_analyzer(manager)
+    first.get_bert_embeddings("first")
+    second.get_bert_embeddings("second")
+    assert first.model is None and second.model is not None
+    assert manager.loaded_models() == [second._bert]
+
+def test_idle_models_are_unloaded(manager):
+    analyzer = make_analyzer(manager, idle_unload_seconds=0.01)
+    analyzer.get_bert_embeddings("text")
+    analyzer._bert.last_used -= 1
+    assert manager.unload_idle() == 1
+    assert analyzer.model is None
+    # 다음 사용 시 다시 로드
+    analyzer.get_bert_embeddings("text")
+    assert analyzer._bert.loads == 2
+
+@pytest.mark.parametrize('max_length, chunk_overlap', [(16, 14), (16, 20), (16, -1), (2, 0)])
+def test_invalid_chunk_overlap(manager, max_length, chunk_overlap):
+    with pytest.raises(ValueError):
+        make_analyzer(manager, max_length=max_length, long_text='chunk', chunk_overlap=chunk_overlap)
+
+def test_chunk_mode_covers_long_text(manager):
+    text = " ".join(f"w{i}" for i in range(40))
+    truncated = make_analyzer(manager, max_length=12)
+    chunked = make_analyzer(manager, max_length=12, long_text='chunk', chunk_overlap=3)
+    tokenizer = truncated._bert.load()[0]
+    assert [len(chunk) for chunk in truncated._chunk_token_ids(tokenizer, [text])[0]] == [12]
+    chunks = chunked._chunk_token_ids(tokenizer, [text])[0]
+    # 구간 10토큰, 7토큰 간격 -> 40토큰을 6개 구간으로 모두 포함
+    assert len(chunks) == 6 and all(len(chunk) <= 12 for chunk in chunks)
+    assert chunks[-1][-2] == tokenizer([text], add_special_tokens=False)['input_ids'][0][-1]
+    embeddings = chunked.get_bert_embeddings_batch([text, "short"])
+    assert embeddings.shape == (2, chunked.model.config.hidden_size) and np.isfinite(embeddings).all()
+
+def test_num_threads_only_when_explicit(manager):
+    before = torch.get_num_threads()
+    target = 1 if before != 1 else 2
+    try:
+        make_analyzer(manager).get_bert_embeddings("text")
+        assert torch.get_num_threads() == before
+        make_analyzer(manager, num_threads=target).get_bert_embeddings("text")
+        assert torch.get_num_threads() == target
+    finally:
+        torch.set_num_threads(before)
@@ -0,0 +1,64 @@
+import pytest
+import spacy
+from src.bias_analyzer import BiasAnalyzer
+from src.model_manager import ModelManager
+from src.multilingual import MULTILINGUAL_SENTIMENT_MODEL, LanguageRouter, detect_language
+
+KOREAN_TEXT = "중국 경제는 빠르게 성장했다."
+
+@pytest.mark.parametrize("text, language", [
+    ("China is growing.", 'en'),
+    (KOREAN_TEXT, 'ko'),
+    ("中国经济发展很快。", 'zh'),
+    ("中国の経済は成長している。", 'ja'),
+    ("Россия большая страна.", 'ru'),
+    ("12345", 'en'),
+])
+def test_detect_language(text, language):
+    assert detect_language(text) == language
+
+def test_batch_matches_single_text_when_multilingual_disabled(monkeypatch):
+    analyzer = BiasAnalyzer(multilingual=False)
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("multilingual=False인데 언어별 감정 모델을 호출함")
+    
+    monkeypatch.setattr(analyzer.language_router, '_model_sentiment', fail)
+    texts = [KOREAN_TEXT, "China is growing."]
+    assert analyzer.analyze_batch(texts, ['china']) == [analyzer._analyze_entities(text, ['china']) for text in texts]
+
+def test_missing_language_package_falls_back_to_english_nlp(monkeypatch):
+    analyzer = BiasAnalyzer()
+    
+    def missing_package(name):
+        raise ImportError("No module named 'sudachipy'")
+    
+    monkeypatch.setattr(spacy, 'load', missing_package)
+    router = LanguageRouter(analyzer)
+    assert router._get_nlp('ja') is analyzer.nlp
+
+def test_sentiment_model_failure_falls_back_to_lexicon(monkeypatch):
+    analyzer = BiasAnalyzer()
+    router = analyzer.language_router
+    attempts = []
+    
+    def offline(model_name):
+        attempts.append(model_name)
+        raise OSError("offline")
+    
+    monkeypatch.setattr(router, '_get_sentiment_model', offline)
+    results = analyzer.analyze_batch([KOREAN_TEXT, KOREAN_TEXT + " 두 번째"], ['china'])
+    expected = analyzer.get_sentiment_scores_batch([KOREAN_TEXT])[0]
+    assert results[0]['china']['target_found']
+    assert results[0]['china']['sentiment_scores'] == expected
+    
+    analyzer.analyze_batch(["러시아와 중국"], ['china'])
+    assert len(attempts) == 1
+
+def test_sentiment_models_follow_analyzer_model_settings():
+    manager = ModelManager()
+    analyzer = BiasAnalyzer(idle_unload_seconds=5, num_threads=2, model_manager=manager)
+    classifier = analyzer.language_router._get_sentiment_model(MULTILINGUAL_SENTIMENT_MODEL)
+    assert classifier._model.manager is manager
+    assert classifier._model.idle_timeout == 5
+    assert classifier.num_threads == 2
@@ -0,0 +1,47 @@
+import json
+import pytest
+from src.profiling import PipelineProfiler, profile_block
+
+def test_disabled_profiler_records_nothing():
+    profiler = PipelineProfiler()
+    with profiler.stage('spacy.ner'):
+        pass
+    assert profiler.stage('a') is profiler.stage('b')
+    assert profiler.get_stats() == {}
+
+def test_stage_stats():
+    profiler = PipelineProfiler(enabled=True)
+    with profiler.stage('vader.sentiment', items=3):
+        pass
+    profiler.record('vader.sentiment', 0.5, items=2)
+    with pytest.raises(RuntimeError):
+        with profiler.stage('bert.embed'):
+            raise RuntimeError("boom")
+    
+    stats = profiler.get_stats()
+    assert list(stats) == ['bert.embed', 'vader.sentiment']
+    assert stats['vader.sentiment']['calls'] == 2
+    assert stats['vader.sentiment']['items'] == 5
+    assert stats['vader.sentiment']['max_time'] == 0.5
+    assert stats['bert.embed']['errors'] == 1
+    profiler.reset()
+    assert profiler.get_stats() == {}
+
+def test_exports(tmp_path):
+    profiler = PipelineProfiler(enabled=True)
+    profiler.record('llm."openai"', 1.5, items=4)
+    assert json.loads(profiler.to_json())['llm."openai"']['items_per_sec'] == pytest.approx(4 / 1.5)
+    
+    path = tmp_path / "stats.json"
+    profiler.save_json(str(path))
+    assert json.loads(path.read_text(encoding='utf-8')) == profiler.get_stats()
+    
+    text = profiler.to_prometheus('test')
+    assert "# TYPE test_stage_seconds_total counter" in text
+    assert 'test_stage_calls_total{stage="llm.\\"openai\\""} 1' in text
+
+def test_profile_block_dumps_stats(tmp_path):
+    output = tmp_path / "profile.pstats"
+    with profile_block(str(output)):
+        sum(range(1000))
+    assert output.stat().st_size > 0
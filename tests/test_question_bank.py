@@ -0,0 +1,73 @@
+import pytest
+from src.multi_question_analyzer import MultiQuestionBiasAnalyzer
+from src.question_bank import EntityRegistry, QuestionBank, load_question_bank
+
+def make_bank_data(**overrides):
+    data = {
+        'format_version': 1,
+        'version': 'test',
+        'default_language': 'en',
+        'entities': {
+            'china': {'name': '중국', 'aliases': {'en': ['China', 'Chinese'], 'ko': ['중국']}},
+            'korea': {'name': '한국', 'aliases': {'en': ['Korea', 'South Korea'], 'ko': ['한국']}},
+            'north_korea': {'name': '북한', 'aliases': {'en': ['North Korea', 'DPRK']}}
+        },
+        'questions': {
+            'china_politics': {'entities': ['china'], 'weight': 1.2,
+                               'text': {'en': "Describe China's politics.", 'ko': "중국 정치를 설명하세요."}},
+            'korea_relations': {'entities': ['korea', 'north_korea'],
+                                'text': {'en': "Describe inter-Korean relations."}}
+        }
+    }
+    data.update(overrides)
+    return data
+
+def test_registry_finds_entities_case_insensitively():
+    registry = QuestionBank(make_bank_data()).entity_registry
+    assert registry.find_entities("the CHINESE economy") == {'china'}
+    assert registry.find_entities("중국과 한국") == {'china', 'korea'}
+    assert registry.find_entities("nothing relevant") == set()
+
+def test_longer_alias_also_counts_contained_aliases():
+    registry = QuestionBank(make_bank_data()).entity_registry
+    assert registry.find_entities("North Korea tested a missile") == {'north_korea', 'korea'}
+
+def test_from_aliases_registry_matches_plain_alias_dict():
+    registry = EntityRegistry.from_aliases({'japan': ['Japan', 'Tokyo']})
+    assert registry.aliases == {'japan': ['Japan', 'Tokyo']}
+    assert registry.find_entities("a trip to tokyo") == {'japan'}
+
+def test_bank_index_and_weights():
+    bank = QuestionBank(make_bank_data())
+    assert bank.questions_for_entity('north_korea') == ['korea_relations']
+    assert bank.questions_for_entity('unknown') == []
+    assert bank.question_weights == {'china_politics': 1.2, 'korea_relations': 1.0}
+    assert bank.get_text('china_politics', 'ko') == "중국 정치를 설명하세요."
+    assert bank.get_text('korea_relations', 'ko') == "Describe inter-Korean relations."
+
+def test_questions_for_entity_returns_a_copy():
+    bank = QuestionBank(make_bank_data())
+    bank.questions_for_entity('china').append('injected')
+    assert bank.questions_for_entity('china') == ['china_politics']
+
+def test_bank_rejects_unknown_version_and_entity():
+    with pytest.raises(ValueError):
+        QuestionBank(make_bank_data(format_version=99))
+    data = make_bank_data()
+    data['questions']['bad'] = {'entities': ['atlantis'], 'text': {'en': "?"}}
+    with pytest.raises(ValueError):
+        QuestionBank(data)
+
+def test_bundled_bank_loads_once():
+    bank = load_question_bank()
+    assert bank is load_question_bank()
+    for question_id in bank.questions:
+        for entity_id in bank.entities_for_question(question_id):
+            assert question_id in bank.questions_for_entity(entity_id)
+
+def test_question_set_follows_overridden_standard_questions():
+    analyzer = MultiQuestionBiasAnalyzer(question_bank=QuestionBank(make_bank_data()))
+    assert analyzer.get_question_set('north_korea') == {'korea_relations': "Describe inter-Korean relations."}
+    analyzer.standard_questions = {'china_politics': "Is China democratic?", 'custom': "Compare China and Korea."}
+    assert analyzer.get_question_set('china') == analyzer.standard_questions
+    assert analyzer.get_question_set('korea') == {'custom': "Compare China and Korea."}
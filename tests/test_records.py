@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from src.records import EntityAggregate, EntityResultBlock, comprehensive_from_dict, comprehensive_to_dict
+
+FOUND = {
+    'target_found': True,
+    'bias_score': 0.5,
+    'sentiment_scores': {'vader_compound': 0.5, 'textblob_polarity': 0.2},
+    'stance': 'positive',
+    'entities': [{'text': 'China', 'label': 'GPE', 'start': 0, 'end': 5}]
+}
+NOT_FOUND = {'target_found': False, 'bias_score': 0, 'sentiment_scores': None, 'stance': 'neutral'}
+
+AGGREGATE = {
+    'target_found': True,
+    'overall_bias_score': -0.25,
+    'overall_stance': 'negative',
+    'confidence': 0.75,
+    'response_count': 2,
+    'stance_distribution': {'positive': 0, 'negative': 2, 'neutral': 0},
+    'individual_scores': [-0.5, 0.0],
+    'question_results': {'q1': {'bias_score': -0.25, 'weight': 1.0, 'stance': 'negative'}}
+}
+
+def test_block_round_trip():
+    batch = [{'china': FOUND, 'usa': NOT_FOUND}, {'china': NOT_FOUND, 'usa': FOUND}]
+    block = EntityResultBlock.from_batch(batch, ['china', 'usa'])
+    assert block.to_dicts() == batch
+    assert block.stance_counts('china') == {'positive': 1, 'negative': 0, 'neutral': 0}
+    assert block.rows_for_entity('usa').tolist() == [3]
+
+def test_columns_do_not_block_append():
+    block = EntityResultBlock(['china'])
+    block.append_response({'china': FOUND})
+    scores = block.bias_scores
+    sentiment = block.sentiment
+    block.append_response({'china': NOT_FOUND})
+    # 먼저 받은 열은 그대로, 새 열에는 추가된 행 반영
+    assert scores.tolist() == [0.5]
+    assert sentiment.shape == (1, 10)
+    assert block.bias_scores.tolist() == [0.5, 0.0]
+    assert block.target_found.tolist() == [True, False]
+
+def test_columns_are_read_only():
+    block = EntityResultBlock.from_batch([{'china': FOUND}])
+    with pytest.raises(ValueError):
+        block.bias_scores[0] = 1.0
+
+def test_aggregate_item_access_matches_to_dict():
+    for data in (AGGREGATE, {'target_found': False, 'overall_bias_score': 0, 'overall_stance': 'neutral',
+                             'confidence': 0}):
+        aggregate = EntityAggregate.from_dict(data)
+        assert aggregate.to_dict() == data
+        for key, value in data.items():
+            assert aggregate[key] == value
+            assert aggregate.get(key) == value
+    
+    aggregate = EntityAggregate.from_dict(dict(AGGREGATE, question_results=None))
+    assert aggregate.get('question_results', 'missing') == 'missing'
+    with pytest.raises(KeyError):
+        EntityAggregate(False)['response_count']
+    assert EntityAggregate(False).get('response_count', 0) == 0
+
+def test_comprehensive_round_trip():
+    data = {'model': {'china': AGGREGATE}}
+    aggregates = comprehensive_from_dict(data)
+    assert isinstance(aggregates['model']['china'].individual_scores, np.ndarray)
+    assert comprehensive_to_dict(aggregates) == data
@@ -0,0 +1,62 @@
+import pandas as pd
+import pytest
+from src.records import EntityAggregate, EntityResultBlock, comprehensive_from_dict
+from src.report_builder import ReportBuilder, model_bias_bar, summary_frame, summary_frame_from_blocks
+
+def aggregate(score, stance, distribution, scores):
+    return {
+        'target_found': True,
+        'overall_bias_score': score,
+        'overall_stance': stance,
+        'confidence': 0.5,
+        'response_count': len(scores),
+        'stance_distribution': distribution,
+        'individual_scores': scores
+    }
+
+NOT_FOUND = {'target_found': False, 'overall_bias_score': 0, 'overall_stance': 'neutral', 'confidence': 0}
+RESULTS = {
+    'gpt': {
+        'china': aggregate(-0.4, 'negative', {'positive': 0, 'negative': 2, 'neutral': 0}, [-0.5, -0.3]),
+        'usa': NOT_FOUND
+    },
+    'claude': {
+        'china': aggregate(0.2, 'positive', {'positive': 1, 'negative': 0, 'neutral': 1}, [0.4, 0.0]),
+        'usa': aggregate(0.0, 'neutral', {'positive': 0, 'negative': 0, 'neutral': 1}, [0.0])
+    }
+}
+
+def test_summary_frame_reads_aggregates_like_dicts(monkeypatch):
+    aggregates = comprehensive_from_dict(RESULTS)
+    # EntityAggregate는 dict로 변환하지 않고 속성에서 바로 읽음
+    monkeypatch.setattr(EntityAggregate, 'to_dict', lambda self: pytest.fail("to_dict called"))
+    pd.testing.assert_frame_equal(summary_frame(aggregates), summary_frame(RESULTS))
+
+def test_summary_frame_values():
+    frame = summary_frame(RESULTS).set_index(['model', 'entity'])
+    assert frame.loc[('gpt', 'china'), 'negative'] == 2
+    assert not frame.loc[('gpt', 'usa'), 'target_found']
+    assert frame.loc[('claude', 'usa'), 'response_count'] == 1
+
+def test_summary_frame_from_blocks():
+    found = {'target_found': True, 'bias_score': -0.5, 'sentiment_scores': None, 'stance': 'negative', 'entities': []}
+    missing = {'target_found': False, 'bias_score': 0, 'sentiment_scores': None, 'stance': 'neutral'}
+    block = EntityResultBlock.from_batch([{'china': found, 'usa': missing}, {'china': missing, 'usa': missing}])
+    frame = summary_frame_from_blocks({'gpt': block}).set_index('entity')
+    assert frame.loc['china', 'stance'] == 'negative'
+    assert frame.loc['china', 'confidence'] == 0.5
+    assert not frame.loc['usa', 'target_found']
+
+def test_model_bias_bar_labels_entity_count():
+    fig = model_bias_bar(summary_frame(RESULTS))
+    assert fig.layout.coloraxis.colorbar.title.text == 'Entities Found'
+    assert list(fig.data[0].marker.color) == [1, 2]
+
+def test_report_build_writes_files(tmp_path):
+    html_path, markdown_path = tmp_path / "report.html", tmp_path / "report.md"
+    html_report, markdown_report = ReportBuilder(plotlyjs='cdn').build(
+        RESULTS, str(html_path), str(markdown_path), subtitle="run 1")
+    assert html_path.read_text(encoding='utf-8') == html_report
+    assert markdown_path.read_text(encoding='utf-8') == markdown_report
+    assert "## 모델별 상세" in markdown_report and "gpt" in markdown_report
+    assert "cdn.plot.ly" in html_report
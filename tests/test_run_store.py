@@ -0,0 +1,56 @@
+import pytest
+from src.run_store import RunStore
+
+def run_results(score, stance):
+    return {
+        'gpt': {
+            'china': {
+                'target_found': True,
+                'overall_bias_score': score,
+                'overall_stance': stance,
+                'confidence': 0.5,
+                'response_count': 2,
+                'stance_distribution': {'positive': 0, 'negative': 0, 'neutral': 0},
+                'individual_scores': [score, score],
+                'question_results': {'q1': {'bias_score': score, 'weight': 1.0, 'stance': stance}}
+            },
+            'usa': {'target_found': False, 'overall_bias_score': 0, 'overall_stance': 'neutral', 'confidence': 0}
+        }
+    }
+
+@pytest.fixture
+def store(tmp_path):
+    store = RunStore(str(tmp_path / "runs.db"))
+    yield store
+    store.close()
+
+def test_bias_trend_returns_last_runs_oldest_first(store):
+    for i, (score, stance) in enumerate([(-0.5, 'negative'), (0.0, 'neutral'), (0.4, 'positive')]):
+        store.record_run(run_results(score, stance), label=f"v{i}", created_at=1000.0 + i)
+    
+    trend = store.bias_trend('gpt', 'china', last_n=2)
+    assert [row['label'] for row in trend] == ['v1', 'v2']
+    assert [row['bias_score'] for row in trend] == [0.0, 0.4]
+    assert store.bias_trend('gpt', 'usa') == []
+    assert [row['stance'] for row in store.bias_trend('gpt', 'china', question_id='q1')] == [
+        'negative', 'neutral', 'positive']
+    
+    summary = store.drift_summary('gpt', 'china')
+    assert summary['runs'] == 3 and summary['change'] == pytest.approx(0.9) and summary['stance_changes'] == 2
+    assert store.drift_summary('gpt', 'usa')['runs'] == 0
+
+def test_listing(store):
+    run_id = store.record_run(run_results(0.2, 'positive'), label="nightly", metadata={'questions': 1})
+    assert store.list_runs()[0] == {'run_id': run_id, 'created_at': store.list_runs()[0]['created_at'],
+                                    'label': "nightly", 'metadata': {'questions': 1}}
+    assert store.list_models() == ['gpt']
+    assert store.list_entities('gpt') == ['china', 'usa']
+    assert store.list_questions('gpt', 'china') == ['q1']
+
+def test_records_results_without_question_results(store):
+    # question_results가 없는 이전 형식 결과도 엔티티 점수만 저장
+    results = run_results(-0.2, 'negative')
+    del results['gpt']['china']['question_results']
+    store.record_run(results)
+    assert store.bias_trend('gpt', 'china')[0]['bias_score'] == -0.2
+    assert store.list_questions('gpt', 'china') == []
@@ -0,0 +1,83 @@
+import threading
+import time
+import numpy as np
+import pytest
+from src.profiling import PipelineProfiler
+from src.scoring_service import MicroBatcher, ScoringService
+
+class FakeAnalyzer:
+    """동시 호출을 감지하는 분석기"""
+    
+    def __init__(self):
+        self.profiler = PipelineProfiler()
+        self.target_entities = {'china': ('china',), 'usa': ('usa',)}
+        self.active = 0
+        self.overlaps = 0
+        self._lock = threading.Lock()
+    
+    def _enter(self):
+        with self._lock:
+            self.active += 1
+            self.overlaps += self.active > 1
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+    
+    def analyze_batch(self, texts, entity_names):
+        self._enter()
+        return [{name: {'target_found': name in text.lower()} for name in entity_names} for text in texts]
+    
+    def get_bert_embeddings_batch(self, texts):
+        self._enter()
+        return np.ones((len(texts), 2))
+
+def test_batcher_coalesces_requests():
+    batches = []
+    batcher = MicroBatcher('test', lambda items: batches.append(items) or [item * 2 for item in items],
+                           max_batch_size=8, max_wait_ms=50)
+    futures = [batcher.submit(i) for i in range(5)]
+    assert [future.result(timeout=5) for future in futures] == [0, 2, 4, 6, 8]
+    assert sum(len(batch) for batch in batches) == 5
+    assert batcher.metrics()['requests'] == 5
+
+def test_batcher_fails_requests_without_results():
+    # 결과가 모자란 배치는 요청별로 다시 처리하고, 그래도 모자라면 해당 요청만 실패
+    batcher = MicroBatcher('short', lambda items: [item for item in items if item != 'drop'], max_wait_ms=50)
+    futures = [batcher.submit(item) for item in ('a', 'drop', 'b')]
+    assert futures[0].result(timeout=5) == 'a'
+    assert futures[2].result(timeout=5) == 'b'
+    with pytest.raises(RuntimeError):
+        futures[1].result(timeout=5)
+    assert batcher.metrics()['errors'] == 1
+
+def test_batcher_isolates_failing_request():
+    def process(items):
+        if 'bad' in items:
+            raise ValueError('bad item')
+        return items
+    
+    batcher = MicroBatcher('errors', process, max_wait_ms=50)
+    good, bad = batcher.submit('good'), batcher.submit('bad')
+    assert good.result(timeout=5) == 'good'
+    with pytest.raises(ValueError):
+        bad.result(timeout=5)
+
+def test_service_serializes_analyzer_access():
+    analyzer = FakeAnalyzer()
+    service = ScoringService(analyzer, max_wait_ms=1, warm_up=False)
+    threads = []
+    for i in range(8):
+        target = service.embed if i % 2 else service.analyze
+        threads.append(threading.Thread(target=target, args=([f"text {i} about China"],)))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert analyzer.overlaps == 0
+
+def test_service_filters_entities():
+    service = ScoringService(FakeAnalyzer(), max_wait_ms=1, warm_up=False)
+    assert service.analyze(["China rises"], ['china']) == [{'china': {'target_found': True}}]
+    with pytest.raises(ValueError):
+        service.analyze(["text"], ['mars'])
+    assert service.embed(["a", "b"]) == [[1.0, 1.0], [1.0, 1.0]]
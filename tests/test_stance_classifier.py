@@ -0,0 +1,76 @@
+import sys
+import threading
+import pytest
+import torch
+from src.model_manager import ModelManager
+from src.stance_classifier import TransformerStanceClassifier, resolve_label_keys
+
+def fake_infer(texts):
+    return [{'model_compound': float(len(text))} for text in texts]
+
+def make_classifier(**kwargs):
+    classifier = TransformerStanceClassifier(model_manager=ModelManager(), **kwargs)
+    classifier._infer = fake_infer
+    return classifier
+
+def test_cache_hits_and_eviction():
+    classifier = make_classifier(cache_size=2)
+    assert classifier.score_batch(["a", "bb", "a"]) == [{'model_compound': 1.0}, {'model_compound': 2.0}, {'model_compound': 1.0}]
+    assert classifier.cache_info() == {'size': 2, 'hits': 1, 'misses': 2}
+    
+    classifier.score("ccc")
+    classifier.score("bb")
+    assert classifier.cache_info()['hits'] == 2
+    classifier.score("a")
+    assert classifier.cache_info()['misses'] == 4
+
+def test_returned_scores_are_copies():
+    classifier = make_classifier()
+    classifier.score("text")['model_compound'] = 99.0
+    assert classifier.score("text") == {'model_compound': 4.0}
+
+def test_concurrent_scoring_with_small_cache():
+    classifier = make_classifier(cache_size=8)
+    errors = []
+    
+    def worker(offset):
+        try:
+            for i in range(300):
+                texts = ["x" * ((offset + i + j) % 20 + 1) for j in range(5)]
+                assert classifier.score_batch(texts) == fake_infer(texts)
+        except Exception as e:
+            errors.append(e)
+    
+    # 스레드 전환을 자주 일으켜 조회/제거 경합을 재현
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
+    assert classifier.cache_info()['size'] <= 8
+
+def test_constructor_does_not_touch_torch_threads():
+    before = torch.get_num_threads()
+    TransformerStanceClassifier(num_threads=before + 1, model_manager=ModelManager())
+    assert torch.get_num_threads() == before
+
+def test_label_keys_from_label_names():
+    id2label = {0: 'Negative', 1: 'Neutral', 2: 'Positive'}
+    assert resolve_label_keys(id2label) == {0: 'negative', 1: 'neutral', 2: 'positive'}
+
+def test_generic_labels_require_label_map():
+    id2label = {0: 'LABEL_0', 1: 'LABEL_1', 2: 'LABEL_2'}
+    with pytest.raises(ValueError, match='LABEL_0'):
+        resolve_label_keys(id2label)
+    label_map = {'LABEL_0': 'negative', 'LABEL_1': 'neutral', 2: 'positive'}
+    assert resolve_label_keys(id2label, label_map) == {0: 'negative', 1: 'neutral', 2: 'positive'}
+
+def test_label_map_rejects_unknown_keys():
+    with pytest.raises(ValueError):
+        resolve_label_keys({0: 'LABEL_0', 1: 'LABEL_1'}, {'LABEL_0': 'negative', 'LABEL_1': 'good'})
@@ -0,0 +1,104 @@
+from src.llm_clients import LLMClient, LLMResponseCollector
+from src.profiling import PipelineProfiler
+from src.question_bank import EntityRegistry
+from src.streaming import IncrementalBiasAnalyzer, StanceStabilityCriterion, classify_stance
+
+class FakeSentiment:
+    """'good'이 있으면 긍정, 'bad'가 있으면 부정인 VADER 대역"""
+    
+    def polarity_scores(self, text):
+        text = text.lower()
+        return {'compound': 0.5 if 'good' in text else -0.5 if 'bad' in text else 0.0}
+
+class FakeAnalyzer:
+    def __init__(self):
+        self.profiler = PipelineProfiler()
+        self.sentiment_analyzer = FakeSentiment()
+        self.entity_registry = EntityRegistry.from_aliases({'china': ['China', 'Beijing', '중국'],
+                                                            'usa': ['United States']})
+
+class StreamingClient(LLMClient):
+    provider = "fake"
+    default_model = "fake-model"
+    
+    def __init__(self, chunks):
+        super().__init__()
+        self.chunks = chunks
+        self.consumed = 0
+        self.options = []
+    
+    def _stream(self, prompt, model, meta, system_prompt=None, temperature=None):
+        self.options.append((system_prompt, temperature))
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+        meta['finish_reason'] = 'stop'
+
+def test_classify_stance():
+    assert [classify_stance(score) for score in (0.5, 0.1, -0.5)] == ['positive', 'neutral', 'negative']
+
+def test_targets_found_across_chunk_boundaries():
+    incremental = IncrementalBiasAnalyzer(FakeAnalyzer())
+    incremental.feed("The Uni")
+    snapshot = incremental.feed("ted States is large")
+    assert snapshot['entities']['usa']['target_found']
+    assert not snapshot['entities']['china']['target_found']
+
+def test_targets_use_analyzer_registry_and_overrides():
+    incremental = IncrementalBiasAnalyzer(FakeAnalyzer())
+    assert incremental.feed("중국은 크다")['entities']['china']['target_found']
+    assert incremental.target_entities == ['china', 'usa']
+    
+    custom = IncrementalBiasAnalyzer(FakeAnalyzer(), target_entities={'japan': ['Tokyo']})
+    assert custom.feed("Tokyo and China")['entities'] == {
+        'japan': {'target_found': True, 'bias_score': 0.0, 'stance': 'neutral'}
+    }
+
+def test_only_complete_sentences_are_scored():
+    incremental = IncrementalBiasAnalyzer(FakeAnalyzer())
+    assert incremental.feed("China is good")['sentence_count'] == 0
+    snapshot = incremental.feed(". Beijing is ")
+    assert snapshot['sentence_count'] == 1
+    assert snapshot['entities']['china'] == {'target_found': True, 'bias_score': 0.5, 'stance': 'positive'}
+    final = incremental.finalize()
+    assert final['final'] and final['sentence_count'] == 2
+    assert final['entities']['china']['bias_score'] == 0.25
+
+def test_stability_criterion():
+    criterion = StanceStabilityCriterion(min_sentences=2, stable_sentences=2, min_chars=10)
+    incremental = IncrementalBiasAnalyzer(FakeAnalyzer())
+    snapshots = [incremental.feed(chunk) for chunk in ("China is good. ", "It is good. ", "Good again. ")]
+    assert not criterion.should_stop(snapshots[1])
+    assert criterion.should_stop(snapshots[2])
+    
+    no_target = IncrementalBiasAnalyzer(FakeAnalyzer())
+    for chunk in ("It is good. ", "It is good. ", "Good again. "):
+        snapshot = no_target.feed(chunk)
+    assert not criterion.should_stop(snapshot)
+
+def test_collector_stops_stream_early():
+    chunks = ["China is good. "] * 10
+    client = StreamingClient(chunks)
+    collector = LLMResponseCollector()
+    collector.add_client("fake", client)
+    updates = []
+    criterion = StanceStabilityCriterion(min_sentences=2, stable_sentences=2, min_chars=10)
+    responses = collector.stream_responses("q", analyzer=FakeAnalyzer(), stop_criterion=criterion,
+                                           on_update=lambda name, snapshot: updates.append(snapshot))
+    result = collector.response_details["fake"]
+    assert result.finish_reason == 'early_exit'
+    assert client.consumed < len(chunks)
+    assert responses["fake"] == "".join(chunks[:client.consumed])
+    assert result.first_chunk_latency is not None and len(updates) == client.consumed
+
+def test_collector_streams_to_completion_without_criterion():
+    client = StreamingClient(["China ", "is good."])
+    collector = LLMResponseCollector()
+    collector.add_client("fake", client)
+    updates = []
+    collector.stream_responses("q", analyzer=FakeAnalyzer(), on_update=lambda name, snapshot: updates.append(snapshot),
+                               system_prompt="be brief", temperature=0.0)
+    assert collector.responses["fake"] == "China is good."
+    assert client.options == [("be brief", 0.0)]
+    assert collector.response_details["fake"].finish_reason == 'stop'
+    assert updates[-1]['final']
@@ -0,0 +1,120 @@
+import json
+import threading
+import time
+import pytest
+from src.llm_clients import LLMClient, LLMResponse, LLMResponseCollector
+from src.sweep import SweepScheduler, SweepSpec, split_prompt_id, split_sweep_store, variant_robustness
+
+QUESTIONS = {'q1': "What about China?", 'q2': "What about the USA?"}
+
+class FakeClient(LLMClient):
+    """호출 순서와 제공자별 동시 호출 수를 기록하는 클라이언트"""
+    
+    default_model = "fake-model"
+    
+    def __init__(self, name, provider, log, delay=0.0):
+        super().__init__(retry_backoff=0.0)
+        self.name = name
+        self.provider = provider
+        self.log = log
+        self.delay = delay
+    
+    def _request(self, prompt, model, system_prompt=None, temperature=None):
+        self.log.start(self.provider, self.name)
+        try:
+            time.sleep(self.delay)
+        finally:
+            self.log.finish(self.provider)
+        return LLMResponse(text=f"{self.name}: {prompt} [{system_prompt}, {temperature}]",
+                           provider=self.provider, model=model)
+
+class CallLog:
+    def __init__(self):
+        self.order = []
+        self.active = {}
+        self.peak = {}
+        self._lock = threading.Lock()
+    
+    def start(self, provider, name):
+        with self._lock:
+            self.order.append(name)
+            self.active[provider] = self.active.get(provider, 0) + 1
+            self.peak[provider] = max(self.peak.get(provider, 0), self.active[provider])
+    
+    def finish(self, provider):
+        with self._lock:
+            self.active[provider] -= 1
+
+def make_collector(log, clients, delay=0.0):
+    collector = LLMResponseCollector()
+    for name, provider in clients:
+        collector.add_client(name, FakeClient(name, provider, log, delay))
+    return collector
+
+def test_expand_grid():
+    spec = SweepSpec(paraphrases={'q1': ["Tell me about China."]}, system_prompts={'none': None, 'brief': "Be brief."},
+                     temperatures=[0.0, 1.0])
+    variants = spec.expand(QUESTIONS)
+    # q1: 표현 2 x 시스템 프롬프트 2 x temperature 2, q2: 1 x 2 x 2
+    assert len(variants) == 12
+    assert variants[0].prompt_id == "q1::orig/none/t=0"
+    assert {variant.paraphrase_id for variant in variants if variant.question_id == 'q1'} == {'orig', 'p1'}
+    assert split_prompt_id(variants[-1].prompt_id) == ('q2', 'orig/brief/t=1')
+    with pytest.raises(ValueError):
+        SweepSpec(question_ids=['q3']).expand(QUESTIONS)
+
+def test_providers_are_interleaved():
+    log = CallLog()
+    collector = make_collector(log, [('gpt-a', 'openai'), ('gpt-b', 'openai'), ('claude', 'anthropic')])
+    variants = SweepSpec().expand(QUESTIONS)
+    SweepScheduler(collector, max_workers=1).run(variants)
+    # 제공자를 번갈아 호출하고, 같은 제공자 안에서도 클라이언트를 번갈아 호출
+    assert log.order[:4] == ['gpt-a', 'claude', 'gpt-b', 'claude']
+    assert sorted(log.order) == sorted(['gpt-a', 'gpt-b', 'claude'] * 2)
+
+def test_per_provider_concurrency_limit():
+    log = CallLog()
+    collector = make_collector(log, [('gpt-a', 'openai'), ('gpt-b', 'openai'), ('claude', 'anthropic')], delay=0.02)
+    spec = SweepSpec(temperatures=[0.0, 0.5, 1.0])
+    SweepScheduler(collector, max_workers=8, per_provider=2).run(spec.expand(QUESTIONS))
+    assert log.peak['openai'] == 2
+    assert log.peak['anthropic'] <= 2
+    assert all(len(responses) == 6 for responses in collector.response_store.values())
+
+def test_existing_responses_are_skipped():
+    log = CallLog()
+    collector = make_collector(log, [('gpt', 'openai'), ('claude', 'anthropic')])
+    variants = SweepSpec().expand(QUESTIONS)
+    collector.response_store = {'gpt': {variants[0].prompt_id: "cached"}}
+    SweepScheduler(collector).run(variants)
+    assert log.order.count('gpt') == 1 and log.order.count('claude') == 2
+    assert collector.response_store['gpt'][variants[0].prompt_id] == "cached"
+
+def test_checkpoint_allows_resume(tmp_path):
+    checkpoint = tmp_path / "sweep.json"
+    variants = SweepSpec(temperatures=[0.0, 1.0]).expand(QUESTIONS)
+    first = make_collector(CallLog(), [('gpt', 'openai')])
+    SweepScheduler(first, checkpoint_path=str(checkpoint), checkpoint_every=1).run(variants)
+    assert json.loads(checkpoint.read_text(encoding='utf-8')) == first.response_store
+    
+    log = CallLog()
+    resumed = make_collector(log, [('gpt', 'openai')])
+    resumed.response_store = json.loads(checkpoint.read_text(encoding='utf-8'))
+    SweepScheduler(resumed).run(variants)
+    assert log.order == []
+
+def test_variant_aggregates():
+    store = {'gpt': {'q1::orig/none/t=0': "a", 'q1::orig/none/t=1': "b", 'q1': "plain"}}
+    assert split_sweep_store(store) == {'orig/none/t=0': {'gpt': {'q1': "a"}}, 'orig/none/t=1': {'gpt': {'q1': "b"}}}
+    
+    def result(score, stance):
+        return {'target_found': True, 'overall_bias_score': score, 'overall_stance': stance}
+    
+    summary = variant_robustness({
+        'orig/none/t=0': {'gpt': {'china': result(-0.5, 'negative')}},
+        'orig/none/t=1': {'gpt': {'china': result(0.5, 'positive')}},
+        'p1/none/t=0': {'gpt': {'china': result(-0.3, 'negative')}}
+    })['gpt']['china']
+    assert summary['variants'] == 3
+    assert summary['most_negative_variant'] == 'orig/none/t=0'
+    assert summary['stance_agreement'] == pytest.approx(2 / 3)
@@ -0,0 +1,131 @@
+import os
+import time
+import pytest
+from src.work_queue import FileWorkQueue, SQLiteWorkQueue, open_queue
+from src.worker import AnalysisWorker
+
+@pytest.fixture(params=['sqlite', 'file'])
+def queue(request, tmp_path):
+    if request.param == 'sqlite':
+        queue = SQLiteWorkQueue(str(tmp_path / "queue.db"))
+        yield queue
+        queue.close()
+    else:
+        yield FileWorkQueue(str(tmp_path / "queue"))
+
+def expire(queue, task, worker_id):
+    """임대 기한을 과거로 옮김"""
+    if isinstance(queue, SQLiteWorkQueue):
+        queue.conn.execute("UPDATE tasks SET lease_expires = 0 WHERE task_id = ?", (int(task.task_id),))
+    else:
+        os.utime(queue._leased_path(task, worker_id), (0, 0))
+
+def test_sqlite_queue_uses_rollback_journal(tmp_path):
+    queue = SQLiteWorkQueue(str(tmp_path / "queue.db"))
+    assert queue.conn.execute("PRAGMA journal_mode").fetchone()[0] == 'delete'
+    with pytest.raises(ValueError):
+        SQLiteWorkQueue(str(tmp_path / "other.db"), journal_mode='MEMORY')
+
+def test_open_queue(tmp_path):
+    assert isinstance(open_queue(str(tmp_path / "q.db")), SQLiteWorkQueue)
+    assert isinstance(open_queue(str(tmp_path / "q")), FileWorkQueue)
+
+def test_lease_complete(queue):
+    task_ids = queue.enqueue_many([{'n': 1}, {'n': 2}])
+    task = queue.lease("w1")
+    assert task.task_id == task_ids[0] and task.payload == {'n': 1} and task.attempts == 1
+    assert queue.stats() == {'queued': 1, 'leased': 1, 'done': 0, 'failed': 0}
+    assert queue.complete(task, "w1")
+    assert queue.lease("w1").payload == {'n': 2}
+    assert queue.lease("w1") is None
+    assert queue.stats()['done'] == 1
+
+def test_only_owner_can_complete(queue):
+    queue.enqueue({'n': 1})
+    task = queue.lease("w1")
+    assert not queue.complete(task, "w2")
+    assert queue.stats()['leased'] == 1
+
+def test_fail_retries_then_fails(queue):
+    queue.enqueue({'n': 1}, max_attempts=2)
+    task = queue.lease("w1")
+    assert queue.fail(task, "w1", "boom", retry_delay=0)
+    task = queue.lease("w1")
+    assert task.attempts == 2
+    assert queue.fail(task, "w1", "boom again", retry_delay=0)
+    assert queue.lease("w1") is None
+    assert queue.stats()['failed'] == 1
+    assert queue.failed_tasks()[0]['error'] == "boom again"
+
+def test_reclaimed_lease_is_not_overwritten_by_slow_worker(queue):
+    queue.enqueue({'n': 1})
+    slow = queue.lease("slow", lease_seconds=60)
+    expire(queue, slow, "slow")
+    # 임대 기한은 임대한 워커가 정한 값 기준 (다른 워커의 lease_seconds와 무관)
+    fast = queue.lease("fast", lease_seconds=60)
+    assert fast.attempts == 2
+    assert not queue.complete(slow, "slow")
+    assert not queue.fail(slow, "slow", "late")
+    assert not queue.renew(slow, "slow")
+    assert queue.stats() == {'queued': 0, 'leased': 1, 'done': 0, 'failed': 0}
+    assert queue.complete(fast, "fast")
+
+def test_same_worker_release_is_a_new_lease(queue):
+    queue.enqueue({'n': 1})
+    first = queue.lease("w1", lease_seconds=60)
+    expire(queue, first, "w1")
+    second = queue.lease("w1", lease_seconds=60)
+    assert not queue.complete(first, "w1")
+    assert queue.complete(second, "w1")
+
+def test_lease_expiry_uses_leasing_workers_deadline(queue):
+    queue.enqueue({'n': 1})
+    queue.enqueue({'n': 2})
+    task = queue.lease("w1", lease_seconds=60)
+    # 다른 워커가 짧은 lease_seconds로 임대해도 w1의 임대는 회수되지 않음
+    assert queue.lease("w2", lease_seconds=0.01).payload == {'n': 2}
+    time.sleep(0.05)
+    assert queue.lease("w3", lease_seconds=60).payload == {'n': 2}
+    assert queue.complete(task, "w1")
+
+def test_renew_extends_lease(queue):
+    queue.enqueue({'n': 1})
+    task = queue.lease("w1", lease_seconds=0.05)
+    assert queue.renew(task, "w1", lease_seconds=60)
+    time.sleep(0.1)
+    assert queue.lease("w2") is None
+    assert queue.complete(task, "w1")
+
+class FakeAnalyzer:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+    
+    def analyze_batch(self, texts, entity_names=None):
+        time.sleep(self.delay)
+        if "bad" in texts:
+            raise RuntimeError("bad text")
+        return [{'china': {'target_found': False}} for _ in texts]
+
+def test_worker_processes_and_retries(queue, tmp_path):
+    queue.enqueue({'items': [['m', 'q1', 'good']]})
+    queue.enqueue({'items': [['m', 'q2', 'bad']]}, max_attempts=1)
+    worker = AnalysisWorker(queue, str(tmp_path / "results"), FakeAnalyzer, worker_id="w1")
+    assert worker.run(poll_interval=0) == {'processed': 1, 'failed': 1}
+    assert queue.stats() == {'queued': 0, 'leased': 0, 'done': 1, 'failed': 1}
+    assert len(os.listdir(tmp_path / "results")) == 1
+
+def test_worker_heartbeat_keeps_slow_batch(queue, tmp_path):
+    queue.enqueue({'items': [['m', 'q1', 'good']]})
+    stolen = []
+    
+    class SlowAnalyzer(FakeAnalyzer):
+        def analyze_batch(self, texts, entity_names=None):
+            # 임대 기한(0.15초)보다 오래 처리하는 동안 다른 워커가 임대를 시도
+            time.sleep(0.3)
+            stolen.append(queue.lease("w2"))
+            return super().analyze_batch(texts, entity_names)
+    
+    worker = AnalysisWorker(queue, str(tmp_path / "results"), SlowAnalyzer, worker_id="w1", lease_seconds=0.15)
+    assert worker.run_once()
+    assert stolen == [None]
+    assert queue.stats()['done'] == 1